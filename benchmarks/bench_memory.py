@@ -0,0 +1,94 @@
+"""
+Замер памяти, занимаемой одним экземпляром каждого класса фигур.
+
+Сравнивает текущую компоновку на __slots__ с прежней, где поля
+(_Shape__unit, _Rectangle__width и т.д.) хранились в __dict__ экземпляра.
+
+Запуск: python benchmarks/bench_memory.py [--count N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shapes.shapes2d import Rectangle, Circle
+from shapes.shapes3d import Cube, Sphere
+
+
+def _dict_layout(*fields):
+    """
+    Создает класс, хранящий поля в __dict__ экземпляра, как фигуры
+    до перехода на __slots__.
+
+    :param fields: Имена полей в порядке их установки в конструкторе
+    :return: Класс с конструктором (*значения полей)
+    """
+    class DictLayout:
+        def __init__(self, *values):
+            for field, value in zip(fields, values):
+                setattr(self, field, value)
+
+    return DictLayout
+
+
+_OldRectangle = _dict_layout('_Shape__unit', '_Rectangle__width', '_Rectangle__height')
+_OldCircle = _dict_layout('_Shape__unit', '_Circle__radius')
+_OldCube = _dict_layout('_ThreeDShape__unit', '_Cube__side')
+_OldSphere = _dict_layout('_ThreeDShape__unit', '_Sphere__radius')
+
+# Класс: (фабрика нового экземпляра, фабрика экземпляра в старой компоновке)
+CASES = {
+    'Rectangle': (lambda first, second: Rectangle(first, second, 'cm'),
+                  lambda first, second: _OldRectangle('cm', first, second)),
+    'Circle': (lambda first, _: Circle(first, 'cm'),
+               lambda first, _: _OldCircle('cm', first)),
+    'Cube': (lambda first, _: Cube(first, 'cm'),
+             lambda first, _: _OldCube('cm', first)),
+    'Sphere': (lambda first, _: Sphere(first, 'cm'),
+               lambda first, _: _OldSphere('cm', first)),
+}
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    """
+    Измеряет средний объем памяти на один экземпляр.
+
+    Размеры и список для экземпляров создаются до начала замера,
+    поэтому учитываются только сами объекты фигур.
+
+    :param factory: Функция, создающая экземпляр по двум размерам
+    :param count: Количество создаваемых экземпляров
+    :return: Байт на экземпляр
+    """
+    firsts = [i + 1.0 for i in range(count)]
+    seconds = [i + 2.0 for i in range(count)]
+    instances = [None] * count
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        instances[i] = factory(firsts[i], seconds[i])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000,
+                        help='Количество экземпляров каждого класса')
+    args = parser.parse_args()
+
+    print(f"{'Класс':<10} {'__dict__, байт':>15} {'__slots__, байт':>16} {'Экономия':>9}")
+    for name, (slotted, dict_based) in CASES.items():
+        old = bytes_per_instance(dict_based, args.count)
+        new = bytes_per_instance(slotted, args.count)
+        print(f"{name:<10} {old:>15.1f} {new:>16.1f} {1 - new / old:>8.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Замер вычисления объема и площади поверхности треугольной сетки.
+
+Строится сетка сферы (широтно-долготное разбиение) с заданным количеством
+граней, и для нее измеряется время построения Mesh (с проверкой),
+вычисления объема и площади поверхности. Результаты сравниваются
+с характеристиками сферы того же радиуса.
+
+Запуск: python benchmarks/bench_mesh.py [--faces 1e6] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from math import pi
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from shapes.shapes3d import Mesh
+
+
+def sphere_mesh(faces: int, radius: float = 1.0) -> tuple:
+    """
+    Строит замкнутую сетку сферы с гранями, ориентированными наружу.
+
+    :param faces: Примерное количество граней
+    :param radius: Радиус сферы
+    :return: Кортеж (вершины (V, 3), грани (F, 3))
+    """
+    # F = 2 * stacks * (slices - 1) при slices = 2 * stacks
+    stacks = max(2, int(round((faces / 4) ** 0.5)))
+    slices = 2 * stacks
+
+    theta = np.linspace(0, pi, stacks + 1)[1:-1]
+    phi = np.linspace(0, 2 * pi, slices, endpoint=False)
+    ring = np.stack([np.outer(np.sin(theta), np.cos(phi)),
+                     np.outer(np.sin(theta), np.sin(phi)),
+                     np.repeat(np.cos(theta)[:, np.newaxis], slices, axis=1)], axis=-1)
+    vertices = np.vstack([[0, 0, 1], ring.reshape(-1, 3), [0, 0, -1]]) * radius
+
+    top, bottom = 0, len(vertices) - 1
+    index = np.arange(slices)
+    following = (index + 1) % slices
+    parts = [np.column_stack([np.full(slices, top), 1 + index, 1 + following])]
+    for stack in range(stacks - 2):
+        upper = 1 + stack * slices
+        lower = upper + slices
+        parts.append(np.column_stack([upper + index, lower + index, lower + following]))
+        parts.append(np.column_stack([upper + index, lower + following, upper + following]))
+    last = 1 + (stacks - 2) * slices
+    parts.append(np.column_stack([last + index, np.full(slices, bottom), last + following]))
+    return vertices, np.vstack(parts)
+
+
+def measure(function, repeat: int) -> float:
+    """
+    Возвращает минимальное время выполнения функции из нескольких повторов.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер вычислений треугольной сетки")
+    parser.add_argument('--faces', type=float, default=1e6, help="Количество граней")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов")
+    args = parser.parse_args(argv)
+
+    vertices, faces = sphere_mesh(int(args.faces))
+    print(f"Сетка: {len(vertices)} вершин, {len(faces)} граней")
+
+    mesh = Mesh(vertices, faces, 'cm')
+    construct = measure(lambda: Mesh(vertices, faces, 'cm'), args.repeat)
+    volume = measure(lambda: Mesh._unchecked(mesh.get_vertices(), mesh.get_faces(),
+                                             'cm').volume(), args.repeat)
+    surface = measure(lambda: Mesh._unchecked(mesh.get_vertices(), mesh.get_faces(),
+                                              'cm').surface_area(), args.repeat)
+
+    print(f"Создание с проверкой: {construct:.4f} с")
+    print(f"Объем: {volume:.4f} с "
+          f"({mesh.volume():.6f}, сфера {4 / 3 * pi:.6f})")
+    print(f"Площадь поверхности: {surface:.4f} с "
+          f"({mesh.surface_area():.6f}, сфера {4 * pi:.6f})")
+    print(f"Граней в секунду (объем): {len(faces) / volume:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
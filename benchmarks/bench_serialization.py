@@ -0,0 +1,95 @@
+"""
+Сравнение размера и скорости сериализации списка фигур.
+
+Сравниваются три способа: pickle с прежним представлением объектов
+(словарь всех слотов с именами вида '_Rectangle__width'), pickle
+с компактным __reduce__ и двоичный формат shapes.serialization.
+
+Запуск: python benchmarks/bench_serialization.py [--size 1e5] [--repeat 3]
+"""
+
+import argparse
+import copyreg
+import io
+import pickle
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shapes.serialization import dumps, loads
+from shapes.shapes2d import Shape, Rectangle, Circle
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+
+
+class _SlotsPickler(pickle.Pickler):
+    """
+    Pickler, сохраняющий фигуры так же, как без __reduce__: через
+    стандартный протокол с полным набором слотов.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (Shape, ThreeDShape)):
+            slots = {name: getattr(obj, name) for name in copyreg._slotnames(type(obj))}
+            return copyreg.__newobj__, (type(obj),), (None, slots)
+        return NotImplemented
+
+
+def _slots_dumps(shapes: list) -> bytes:
+    buffer = io.BytesIO()
+    _SlotsPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(shapes)
+    return buffer.getvalue()
+
+
+def mixed_shapes(size: int) -> list:
+    """
+    Создает список фигур четырех типов в нескольких единицах измерения.
+
+    :param size: Количество фигур
+    :return: Список фигур
+    """
+    rng = random.Random(size)
+    units = ['mm', 'cm', 'm']
+    factories = [lambda d, u: Rectangle(d, d + 1, u), Circle, Cube, Sphere]
+    return [factories[i % 4](rng.uniform(0.1, 100.0), units[i % 3]) for i in range(size)]
+
+
+def measure(function, repeat: int) -> float:
+    """
+    Возвращает минимальное время выполнения функции из нескольких повторов.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер сериализации фигур")
+    parser.add_argument('--size', type=float, default=1e5, help="Количество фигур")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов")
+    args = parser.parse_args(argv)
+
+    shapes = mixed_shapes(int(args.size))
+    methods = [
+        ('pickle (все слоты)', _slots_dumps, pickle.loads),
+        ('pickle (__reduce__)', lambda items: pickle.dumps(items, pickle.HIGHEST_PROTOCOL),
+         pickle.loads),
+        ('dumps/loads', dumps, loads),
+    ]
+
+    print(f"Фигур: {len(shapes)}")
+    print(f"{'Способ':<22}{'Байт на фигуру':>16}{'Запись, с':>12}{'Чтение, с':>12}")
+    for name, encode, decode in methods:
+        data = encode(shapes)
+        write = measure(lambda: encode(shapes), args.repeat)
+        read = measure(lambda: decode(data), args.repeat)
+        print(f"{name:<22}{len(data) / len(shapes):>16.1f}{write:>12.4f}{read:>12.4f}")
+
+
+if __name__ == '__main__':
+    main()
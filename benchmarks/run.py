@@ -0,0 +1,245 @@
+"""
+Набор тестов производительности основных операций пакета shapes.
+
+Запуск:
+    python benchmarks/run.py [--sizes 1e3 1e4 1e5] [--output result.json]
+                             [--baseline baseline.json] [--threshold 0.1]
+
+Для каждого случая и размера измеряется минимальное время из нескольких
+повторов. Результат выводится в формате JSON. С параметром --baseline
+результаты сравниваются с сохраненным ранее файлом, и при замедлении
+больше порога программа завершается с кодом 1.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import pickle
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from shapes.serialization import dumps, loads
+from shapes.shapes2d import Rectangle, Circle
+from shapes.shapes3d import Cube, Sphere
+from shapes.utils import convert_units, compare_shapes_by_area
+
+
+def _load_app():
+    """
+    Загружает bin/shapes_app.py как модуль.
+
+    :return: Модуль приложения
+    """
+    spec = importlib.util.spec_from_file_location('shapes_app', ROOT / 'bin' / 'shapes_app.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+app = _load_app()
+
+
+def _dimensions(size: int) -> list:
+    rng = random.Random(size)
+    return [rng.uniform(0.1, 100.0) for _ in range(size)]
+
+
+def _mixed_shapes(size: int) -> list:
+    dims = _dimensions(size)
+    factories = [lambda d: Rectangle(d, d + 1, 'cm'), lambda d: Circle(d, 'cm'),
+                 lambda d: Cube(d, 'cm'), lambda d: Sphere(d, 'cm')]
+    return [factories[i % 4](d) for i, d in enumerate(dims)]
+
+
+def _construct(factory):
+    def setup(size):
+        dims = _dimensions(size)
+        return lambda: [factory(d) for d in dims]
+    return setup
+
+
+def _metric(factory, metric):
+    def setup(size):
+        # Новые объекты на каждый повтор, чтобы не мерить попадания в кэш
+        shapes = [factory(d) for d in _dimensions(size)]
+        method = getattr(type(shapes[0]), metric)
+        return lambda: [method(shape) for shape in shapes]
+    return setup
+
+
+def _sort(size):
+    shapes = [Rectangle(d, d + 1, 'cm') if i % 2 else Circle(d, 'cm')
+              for i, d in enumerate(_dimensions(size))]
+    return lambda: sorted(shapes)
+
+
+def _compare(size):
+    shapes = _mixed_shapes(size)
+    pairs = list(zip(shapes, shapes[1:] + shapes[:1]))
+    return lambda: [compare_shapes_by_area(first, second) for first, second in pairs]
+
+
+def _convert(size):
+    dims = _dimensions(size)
+    return lambda: [convert_units(d, 'cm', 'm') for d in dims]
+
+
+def _pickle(size):
+    shapes = _mixed_shapes(size)
+    return lambda: pickle.loads(pickle.dumps(shapes, pickle.HIGHEST_PROTOCOL))
+
+
+def _serialize(size):
+    shapes = _mixed_shapes(size)
+    return lambda: loads(dumps(shapes))
+
+
+def _quiet(function):
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+    return run
+
+
+def _print_table(size):
+    rows = [[f"Фигура {i}", f"{d:.2f} см²", f"{d * 2:.2f} см", "-"]
+            for i, d in enumerate(_dimensions(size))]
+    headers = ["Фигура", "Площадь", "Периметр/Окружность", "Объем"]
+    return _quiet(lambda: app.print_table(rows, headers))
+
+
+def _display_shape_info(size):
+    shapes = _mixed_shapes(size)
+    return lambda: [app.display_shape_info(shape) for shape in shapes]
+
+
+# Название случая: функция подготовки (размер -> измеряемая функция)
+CASES = {
+    'construct.Rectangle': _construct(lambda d: Rectangle(d, d + 1, 'cm')),
+    'construct.Circle': _construct(lambda d: Circle(d, 'cm')),
+    'construct.Cube': _construct(lambda d: Cube(d, 'cm')),
+    'construct.Sphere': _construct(lambda d: Sphere(d, 'cm')),
+    'metric.Rectangle.area': _metric(lambda d: Rectangle(d, d + 1, 'cm'), 'area'),
+    'metric.Rectangle.perimeter': _metric(lambda d: Rectangle(d, d + 1, 'cm'), 'perimeter'),
+    'metric.Circle.area': _metric(lambda d: Circle(d, 'cm'), 'area'),
+    'metric.Circle.perimeter': _metric(lambda d: Circle(d, 'cm'), 'perimeter'),
+    'metric.Cube.volume': _metric(lambda d: Cube(d, 'cm'), 'volume'),
+    'metric.Cube.surface_area': _metric(lambda d: Cube(d, 'cm'), 'surface_area'),
+    'metric.Sphere.volume': _metric(lambda d: Sphere(d, 'cm'), 'volume'),
+    'metric.Sphere.surface_area': _metric(lambda d: Sphere(d, 'cm'), 'surface_area'),
+    'sort.Shape.__lt__': _sort,
+    'utils.compare_shapes_by_area': _compare,
+    'utils.convert_units': _convert,
+    'pickle.roundtrip': _pickle,
+    'serialization.roundtrip': _serialize,
+    'app.print_table': _print_table,
+    'app.display_shape_info': _display_shape_info,
+}
+
+
+def run_case(name: str, size: int, repeat: int) -> dict:
+    """
+    Измеряет один случай на заданном размере.
+
+    Подготовка данных выполняется перед каждым повтором и не входит в замер.
+
+    :param name: Название случая из CASES
+    :param size: Количество элементов
+    :param repeat: Количество повторов
+    :return: Результат замера
+    """
+    timings = []
+    for _ in range(repeat):
+        function = CASES[name](size)
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+        del function
+
+    best = min(timings)
+    return {'case': name, 'size': size, 'seconds': best,
+            'ns_per_item': best / size * 1e9}
+
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """
+    Сравнивает результаты с сохраненными.
+
+    :param results: Текущие результаты
+    :param baseline: Сохраненные результаты
+    :param threshold: Допустимое относительное замедление (0.1 = 10%)
+    :return: Список сравнений для совпадающих случаев и размеров
+    """
+    previous = {(item['case'], item['size']): item['seconds'] for item in baseline}
+    comparisons = []
+    for item in results:
+        old = previous.get((item['case'], item['size']))
+        if old:
+            ratio = item['seconds'] / old
+            comparisons.append({'case': item['case'], 'size': item['size'],
+                                'baseline_seconds': old, 'seconds': item['seconds'],
+                                'ratio': ratio, 'regression': ratio > 1 + threshold})
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Тесты производительности пакета shapes")
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e3, 1e4, 1e5],
+                        help="Размеры входных данных (от 1e3 до 1e7)")
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES),
+                        help="Запускаемые случаи (по умолчанию все)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Количество повторов каждого замера")
+    parser.add_argument('--output', help="Файл для сохранения результатов в JSON")
+    parser.add_argument('--baseline', help="Файл с сохраненными результатами для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="Допустимое замедление относительно baseline")
+    args = parser.parse_args(argv)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': [],
+    }
+    for size in sorted({int(size) for size in args.sizes}):
+        for name in args.cases:
+            report['results'].append(run_case(name, size, args.repeat))
+            print(f"{name} [{size}]: {report['results'][-1]['seconds']:.4f} с",
+                  file=sys.stderr)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        report['comparison'] = compare(report['results'], baseline, args.threshold)
+        regressions = [item for item in report['comparison'] if item['regression']]
+        for item in regressions:
+            print(f"Замедление: {item['case']} [{item['size']}] "
+                  f"в {item['ratio']:.2f} раза", file=sys.stderr)
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        print(text)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
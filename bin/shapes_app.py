@@ -2,34 +2,20 @@
 Главный исполняемый файл приложения
 """
 
+import argparse
+
+from shapes import instrument
+from shapes.aggregate import QuantileAggregator, ShapeAggregator
+from shapes.cache import metric_cache_info
+from shapes.ingest import FORMATS, iter_batches
+from shapes.parallel import aggregate_file_parallel
+from shapes.report import format_shape_info, render_table, write_shape_reports
 from shapes.shapes2d import Rectangle, Circle
 from shapes.shapes3d import Cube, Sphere
-from shapes.utils import convert_units, compare_shapes_by_area
+from shapes.utils import compare_shapes_by_area
 
 def print_table(data, headers):
-    col_widths = []
-    for i in range(len(headers)):
-        max_len = len(headers[i])
-        for row in data:
-            max_len = max(max_len, len(str(row[i])))
-        col_widths.append(max_len + 2)
-
-    header_row = "|"
-    separator = "+"
-    for i, header in enumerate(headers):
-        header_row += f" {header:<{col_widths[i]}} |"
-        separator += "-" * (col_widths[i] + 2) + "+"
-
-    print(separator)
-    print(header_row)
-    print(separator)
-
-    for row in data:
-        row_str = "|"
-        for i, cell in enumerate(row):
-            row_str += f" {str(cell):<{col_widths[i]}} |"
-        print(row_str)
-        print(separator)
+    render_table(data, headers)
 
 
 def display_shape_info(shape):
@@ -39,30 +25,36 @@ def display_shape_info(shape):
     :param shape: Геометрическая фигура
     :return: Строка с информацией о фигуре
     """
-    info = f"Фигура: {shape.__class__.__name__}\n"
+    return format_shape_info(shape)
 
-    if hasattr(shape, 'get_width'):
-        info += f"  Ширина: {shape.get_width()}{shape.get_unit()}\n"
-    if hasattr(shape, 'get_height'):
-        info += f"  Высота: {shape.get_height()}{shape.get_unit()}\n"
-    if hasattr(shape, 'get_radius'):
-        info += f"  Радиус: {shape.get_radius()}{shape.get_unit()}\n"
-    if hasattr(shape, 'get_side'):
-        info += f"  Сторона: {shape.get_side()}{shape.get_unit()}\n"
 
-    if hasattr(shape, 'area'):
-        info += f"  Площадь: {shape.area():.2f}{shape.get_unit()}²\n"
-    if hasattr(shape, 'perimeter'):
-        info += f"  Периметр: {shape.perimeter():.2f}{shape.get_unit()}\n"
-    if hasattr(shape, 'surface_area'):
-        info += f"  Площадь поверхности: {shape.surface_area():.2f}{shape.get_unit()}²\n"
-    if hasattr(shape, 'volume'):
-        info += f"  Объем: {shape.volume():.2f}{shape.get_unit()}³\n"
+def report(path, fmt=None, chunk_size=65536, workers=1, percentiles=False):
+    """
+    Выводит статистику площади и объема по типам фигур и единицам
+    измерения для файла CSV, JSONL или двоичного хранилища фигур.
+
+    Файл читается порциями за один проход, поэтому расход памяти
+    не зависит от его размера.
+
+    :param path: Путь к файлу с описаниями фигур
+    :param fmt: Формат файла ('csv', 'jsonl' или 'store'); по умолчанию по расширению
+    :param chunk_size: Количество фигур в одной порции
+    :param workers: Количество процессов для параллельной обработки
+    :param percentiles: Вывести перцентили p50, p90 и p99 вместо суммы,
+        среднего, минимума и максимума
+    """
+    factory = QuantileAggregator if percentiles else ShapeAggregator
+    if workers > 1:
+        aggregator = aggregate_file_parallel(path, fmt, workers, chunk_size, factory)
+    else:
+        aggregator = factory()
+        for batch in iter_batches(path, fmt, chunk_size):
+            aggregator.add_batch(batch)
 
-    return info
+    print_table(aggregator.rows(), factory.HEADERS)
 
 
-def main():
+def demo():
 
     print("Геометрические фигуры")
 
@@ -103,8 +95,7 @@ def main():
 
     print(f"Куб до конвертации: {cube}")
 
-    side_in_m = convert_units(cube.get_side(), 'cm', 'm')
-    cube_in_m = Cube(side_in_m, 'm')
+    cube_in_m = cube.to_unit('m')
     print(f"Куб после конвертации в метры: {cube_in_m}")
 
     cube.set_side(5)
@@ -113,11 +104,55 @@ def main():
     print("\n5. Характеристики всех фигур:")
 
     shapes = [rect, circle, cube, sphere]
-    for shape in shapes:
-        print(display_shape_info(shape))
+    write_shape_reports(shapes)
 
     print("Программа завершена")
 
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Геометрические фигуры")
+    parser.add_argument('path', nargs='?',
+                        help="Файл CSV, JSONL или хранилище .shapes с описаниями фигур "
+                             "(без него запускается демонстрация)")
+    parser.add_argument('--format', choices=FORMATS,
+                        help="Формат файла (по умолчанию по расширению)")
+    parser.add_argument('--chunk-size', type=int, default=65536,
+                        help="Количество фигур, обрабатываемых за один раз")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Количество процессов для обработки файла")
+    parser.add_argument('--percentiles', action='store_true',
+                        help="Вывести перцентили площади и объема (p50, p90, p99)")
+    parser.add_argument('--stats', action='store_true',
+                        help="Вывести счетчики вызовов методов и функций при завершении "
+                             "(учитывается только основной процесс)")
+    return parser.parse_args(argv)
+
+
+def print_stats():
+    """
+    Выводит счетчики вызовов и кэша характеристик.
+    """
+    print("\nСчетчики вызовов:")
+    print_table(instrument.rows(), instrument.HEADERS)
+    cache = metric_cache_info()
+    print(f"Кэш характеристик: попаданий {cache.hits}, промахов {cache.misses}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.stats:
+        instrument.enable()
+    try:
+        if args.path:
+            report(args.path, args.format, args.chunk_size, args.workers,
+                   args.percentiles)
+        else:
+            demo()
+    finally:
+        if args.stats:
+            instrument.disable()
+            print_stats()
+
 if __name__ == "__main__":
 
     main()
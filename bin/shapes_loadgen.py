@@ -0,0 +1,152 @@
+"""
+Генератор нагрузки для сервера shapes_server.py.
+
+Открывает несколько соединений, в каждом держит заданное количество
+запросов в обработке одновременно и выводит задержку (p50, p99)
+и пропускную способность.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+OPERATIONS = ('metrics', 'convert', 'compare')
+
+_UNITS = ['mm', 'cm', 'm']
+
+
+def _shape(rng: random.Random) -> dict:
+    kind = rng.choice(['rectangle', 'circle', 'cube', 'sphere'])
+    unit = rng.choice(_UNITS)
+    if kind == 'rectangle':
+        return {'type': kind, 'width': rng.uniform(1, 100),
+                'height': rng.uniform(1, 100), 'unit': unit}
+    field = 'side' if kind == 'cube' else 'radius'
+    return {'type': kind, field: rng.uniform(1, 100), 'unit': unit}
+
+
+def make_request(rng: random.Random, op: str) -> dict:
+    """
+    Создает случайный запрос заданной операции.
+
+    :param rng: Генератор случайных чисел
+    :param op: Операция ('metrics', 'convert' или 'compare')
+    :return: Запрос без id
+    """
+    if op == 'metrics':
+        return {'op': op, 'shape': _shape(rng)}
+    if op == 'convert':
+        return {'op': op, 'value': rng.uniform(1, 100), 'from': rng.choice(_UNITS),
+                'to': rng.choice(_UNITS), 'power': rng.randint(1, 3)}
+    return {'op': op, 'first': _shape(rng), 'second': _shape(rng)}
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Возвращает перцентиль отсортированного списка (ближайший ранг).
+
+    :param values: Отсортированные значения
+    :param fraction: Доля (0.5 - медиана, 0.99 - p99)
+    :return: Значение перцентиля
+    """
+    if not values:
+        return float('nan')
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def _connection(args, number: int, latencies: list, errors: list):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    rng = random.Random(number)
+    operations = args.ops
+    sent = {}
+    window = asyncio.Semaphore(args.inflight)
+
+    async def send():
+        for i in range(args.requests):
+            await window.acquire()
+            request = make_request(rng, operations[i % len(operations)])
+            request['id'] = i
+            sent[i] = time.perf_counter()
+            writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await writer.drain()
+
+    async def receive():
+        for _ in range(args.requests):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("Сервер закрыл соединение.")
+            response = json.loads(line)
+            latencies.append(time.perf_counter() - sent.pop(response['id']))
+            if 'error' in response:
+                errors.append(response['error'])
+            window.release()
+
+    await asyncio.gather(send(), receive())
+    writer.close()
+
+
+async def run(args) -> dict:
+    """
+    Выполняет нагрузочный тест.
+
+    :param args: Параметры командной строки
+    :return: Сводка результатов
+    """
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection(args, number, latencies, errors)
+                           for number in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'seconds': elapsed,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else float('nan'),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Генератор нагрузки для shapes_server.py")
+    parser.add_argument('--host', default='127.0.0.1', help="Адрес сервера")
+    parser.add_argument('--port', type=int, default=8765, help="Порт сервера")
+    parser.add_argument('--unix', metavar='PATH', help="Путь к Unix-сокету сервера")
+    parser.add_argument('--connections', type=int, default=8,
+                        help="Количество соединений")
+    parser.add_argument('--requests', type=int, default=10000,
+                        help="Количество запросов в каждом соединении")
+    parser.add_argument('--inflight', type=int, default=16,
+                        help="Количество одновременных запросов в соединении")
+    parser.add_argument('--ops', nargs='+', choices=OPERATIONS, default=list(OPERATIONS),
+                        help="Операции запросов (чередуются)")
+    parser.add_argument('--json', action='store_true', help="Вывести результат в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    summary = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"Запросов: {summary['requests']} (ошибок: {summary['errors']}) "
+          f"за {summary['seconds']:.2f} с")
+    print(f"Пропускная способность: {summary['throughput']:.0f} запросов/с")
+    print(f"Задержка: p50 {summary['p50_ms']:.2f} мс, p99 {summary['p99_ms']:.2f} мс, "
+          f"макс. {summary['max_ms']:.2f} мс")
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,45 @@
+"""
+Сервер расчетов характеристик фигур (строки JSON по TCP или Unix-сокету).
+
+Протокол описан в модуле shapes.service.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from shapes.service import serve
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Сервер расчетов геометрических фигур")
+    parser.add_argument('--host', default='127.0.0.1', help="Адрес для TCP")
+    parser.add_argument('--port', type=int, default=8765, help="Порт для TCP")
+    parser.add_argument('--unix', metavar='PATH',
+                        help="Путь к Unix-сокету (вместо TCP)")
+    parser.add_argument('--batch-size', type=int, default=256,
+                        help="Максимальное количество запросов в пакете")
+    parser.add_argument('--max-wait', type=float, default=2.0,
+                        help="Максимальное время ожидания пакета в миллисекундах")
+    parser.add_argument('--max-pending', type=int, default=1024,
+                        help="Максимальное количество одновременно обрабатываемых "
+                             "запросов одного соединения")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    address = args.unix or f"{args.host}:{args.port}"
+
+    def ready():
+        print(f"Сервер принимает соединения: {address}", file=sys.stderr)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.batch_size,
+                          args.max_wait / 1000, ready, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+
+    main()
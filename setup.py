@@ -4,7 +4,7 @@ setup(
     name='geometric_shapes',
     version='0.0.1',
     packages=find_packages("."),
-    scripts=["bin/shapes_app.py"],
+    scripts=["bin/shapes_app.py", "bin/shapes_server.py", "bin/shapes_loadgen.py"],
     url='https://github.com/aleksandra-protasova/protasova_av',
     license='Apache-2.0',
     author='Протасова Александра Владимировна',
@@ -13,6 +13,7 @@ setup(
     include_package_data=True,
     install_requires=[
         'tabulate>=0.8.9',
+        'numpy>=1.21',
     ],
 
 )
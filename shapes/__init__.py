@@ -2,11 +2,29 @@
 Пакет для работы с геометрическими фигурами.
 """
 
-from .shapes2d import Shape, Rectangle, Circle
-from .shapes3d import ThreeDShape, Cube, Sphere
+from .shapes2d import Shape, Rectangle, Circle, Polygon
+from .shapes3d import ThreeDShape, Cube, Sphere, Mesh
+from .batch import ShapeBatch, PolygonBatch
+from .aggregate import ShapeAggregator, QuantileAggregator, aggregate
+from .sketch import QuantileSketch
+from .store import write_store, open_store
+from .serialization import dumps, loads
+from .spatial import SpatialIndex
+from .collection import ShapeCollection, IndexedShapeCollection
+from .identity import distinct, ShapeInterner
+from .cache import metric_cache_info, reset_metric_cache_info
 from .utils import (
     convert_units,
+    convert_units_array,
     compare_shapes_by_area,
+    area_difference_matrix,
+    area_order_matrix,
+    iter_area_difference_tiles,
+    comparison_messages,
+    top_k_by_area,
+    bottom_k_by_area,
+    rank_by_area,
+    select_by_area_range,
     create_shapes_demo,
 )
 
@@ -19,15 +37,55 @@ __all__ = [
     'Shape',
     'Rectangle',
     'Circle',
+    'Polygon',
 
     # Классы 3D фигур
     'ThreeDShape',
     'Cube',
     'Sphere',
+    'Mesh',
+
+    # Векторизованная обработка
+    'ShapeBatch',
+    'PolygonBatch',
+    'ShapeAggregator',
+    'QuantileAggregator',
+    'QuantileSketch',
+    'aggregate',
+
+    # Двоичное хранилище
+    'write_store',
+    'open_store',
+
+    # Двоичная сериализация
+    'dumps',
+    'loads',
+
+    # Пространственный индекс
+    'SpatialIndex',
+
+    # Коллекции фигур
+    'ShapeCollection',
+    'IndexedShapeCollection',
+
+    # Одинаковые фигуры
+    'distinct',
+    'ShapeInterner',
 
     # Вспомогательные функции
     'convert_units',
+    'convert_units_array',
+    'metric_cache_info',
+    'reset_metric_cache_info',
     'compare_shapes_by_area',
+    'area_difference_matrix',
+    'area_order_matrix',
+    'iter_area_difference_tiles',
+    'comparison_messages',
+    'top_k_by_area',
+    'bottom_k_by_area',
+    'rank_by_area',
+    'select_by_area_range',
 
     # Данные
     '__version__',
@@ -0,0 +1,401 @@
+"""
+Агрегирование характеристик фигур по типу и единице измерения.
+"""
+
+from abc import ABC, abstractmethod
+from functools import partial
+from math import inf
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch, PolygonBatch
+from shapes.shapes2d import Shape, Rectangle, Circle
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+from shapes.sketch import QuantileSketch
+from shapes.units import unit_code
+from shapes.utils import convert_units
+
+
+class MetricSummary:
+    """
+    Сводная статистика одной характеристики: количество, сумма,
+    минимум и максимум.
+    """
+
+    __slots__ = ('__count', '__total', '__minimum', '__maximum')
+
+    def __init__(self, count: int = 0, total: float = 0.0,
+                 minimum: float = inf, maximum: float = -inf):
+        """
+        Конструктор класса MetricSummary.
+
+        :param count: Количество значений
+        :param total: Сумма значений
+        :param minimum: Минимальное значение
+        :param maximum: Максимальное значение
+        """
+        self.__count = int(count)
+        self.__total = float(total)
+        self.__minimum = float(minimum)
+        self.__maximum = float(maximum)
+
+    def add(self, value: float):
+        """
+        Добавляет одно значение.
+
+        :param value: Значение характеристики
+        """
+        self.__count += 1
+        self.__total += value
+        self.__minimum = min(self.__minimum, value)
+        self.__maximum = max(self.__maximum, value)
+
+    def add_array(self, values: np.ndarray):
+        """
+        Добавляет массив значений.
+
+        :param values: Массив значений характеристики
+        """
+        if not len(values):
+            return
+        self.__count += len(values)
+        self.__total += float(values.sum())
+        self.__minimum = min(self.__minimum, float(values.min()))
+        self.__maximum = max(self.__maximum, float(values.max()))
+
+    def merge(self, other: 'MetricSummary'):
+        """
+        Добавляет статистику другой сводки.
+
+        :param other: Другая сводка
+        """
+        self.__count += other.get_count()
+        self.__total += other.get_total()
+        self.__minimum = min(self.__minimum, other.get_min())
+        self.__maximum = max(self.__maximum, other.get_max())
+
+    def get_count(self) -> int:
+        """
+        Возвращает количество значений.
+
+        :return: Количество значений
+        """
+        return self.__count
+
+    def get_total(self) -> float:
+        """
+        Возвращает сумму значений.
+
+        :return: Сумма значений
+        """
+        return self.__total
+
+    def get_min(self) -> float:
+        """
+        Возвращает минимальное значение.
+
+        :return: Минимум (inf, если значений нет)
+        """
+        return self.__minimum
+
+    def get_max(self) -> float:
+        """
+        Возвращает максимальное значение.
+
+        :return: Максимум (-inf, если значений нет)
+        """
+        return self.__maximum
+
+    def get_mean(self) -> float:
+        """
+        Возвращает среднее значение.
+
+        :return: Среднее (NaN, если значений нет)
+        """
+        return self.__total / self.__count if self.__count else float('nan')
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта MetricSummary.
+
+        :return: Строковое представление сводки
+        """
+        return (f"MetricSummary(count={self.__count}, total={self.__total:.2f}, "
+                f"min={self.__minimum:.2f}, max={self.__maximum:.2f})")
+
+
+class _GroupedAggregator(ABC):
+    """
+    Базовый класс накопителей характеристик по группам (тип фигуры, единица).
+
+    Для каждой группы и характеристики создается накопитель вызовом
+    accumulator(); накопитель должен поддерживать методы add, add_array,
+    merge и get_count. Подклассы задают накопитель, заголовки и ячейки
+    таблицы.
+
+    Для 3D фигур площадью считается площадь поверхности, объем 2D фигур
+    не определен и в статистику не входит.
+
+    Если задана единица измерения unit, характеристики всех фигур
+    переводятся в нее (площадь - по квадрату коэффициента перевода,
+    объем - по кубу), и фигуры разных единиц попадают в одну группу.
+    """
+
+    METRICS = ('area', 'volume')
+
+    HEADERS: List[str] = []
+
+    def __init__(self, unit: Optional[str], accumulator: Callable):
+        """
+        Базовый конструктор накопителя.
+
+        :param unit: Единица измерения, в которую переводятся характеристики,
+            или None, чтобы группировать фигуры по их собственным единицам
+        :param accumulator: Функция без аргументов, создающая накопитель
+            одной характеристики (должна сериализоваться pickle)
+        :raises ValueError: Если единица неизвестна
+        """
+        if unit is not None and (not isinstance(unit, str) or unit_code(unit) < 0):
+            raise ValueError(f"Неизвестная целевая единица измерения: {unit}")
+        self.__unit = unit
+        self.__accumulator = accumulator
+        self.__groups: Dict[Tuple[str, str], dict] = {}
+
+    def get_unit(self) -> Optional[str]:
+        """
+        Возвращает единицу измерения, в которую переводятся характеристики.
+
+        :return: Единица измерения или None
+        """
+        return self.__unit
+
+    def _group(self, kind_name: str, unit: str) -> dict:
+        """
+        Возвращает накопители группы, создавая их при первом обращении.
+
+        :param kind_name: Название типа фигуры
+        :param unit: Единица измерения группы
+        :return: Словарь {характеристика: накопитель}
+        """
+        key = (kind_name, unit)
+        group = self.__groups.get(key)
+        if group is None:
+            group = self.__groups[key] = {metric: self.__accumulator()
+                                          for metric in self.METRICS}
+        return group
+
+    def add_batch(self, batch: Union[ShapeBatch, PolygonBatch]):
+        """
+        Добавляет все фигуры набора: фигуры упорядочиваются по группам
+        одной сортировкой, и значения каждой группы передаются
+        накопителю одним массивом.
+
+        :param batch: Набор фигур или многоугольников
+        """
+        if not len(batch):
+            return
+        if self.__unit is not None:
+            batch = batch.to_unit(self.__unit)
+        if isinstance(batch, PolygonBatch):
+            self._group('Polygon', batch.get_unit())['area'].add_array(batch.area())
+            return
+
+        units = batch.get_units()
+        keys = batch.get_kinds().astype(np.intp) * len(units) + batch.get_unit_codes()
+        order = np.argsort(keys, kind='stable')
+        present, starts = np.unique(keys[order], return_index=True)
+        bounds = np.append(starts, len(keys)).tolist()
+
+        groups = []
+        for key in present.tolist():
+            kind, code = divmod(key, len(units))
+            groups.append(self._group(ShapeBatch.KIND_NAMES[kind], units[code]))
+
+        for metric, values in (('area', batch.comparable_area()),
+                               ('volume', batch.volume())):
+            values = values[order]
+            for i, group in enumerate(groups):
+                part = values[bounds[i]:bounds[i + 1]]
+                group[metric].add_array(part[~np.isnan(part)])
+
+    def add_shapes(self, shapes: Iterable[Union[Shape, ThreeDShape]]):
+        """
+        Добавляет фигуры по одной.
+
+        :param shapes: Геометрические фигуры
+        """
+        for shape in shapes:
+            unit = shape.get_unit()
+            factor = 1.0
+            if self.__unit is not None:
+                factor = convert_units(1.0, unit, self.__unit)
+                unit = self.__unit
+
+            group = self._group(shape.__class__.__name__, unit)
+            if isinstance(shape, Shape):
+                group['area'].add(shape.area() * factor ** 2)
+            else:
+                group['area'].add(shape.surface_area() * factor ** 2)
+                group['volume'].add(shape.volume() * factor ** 3)
+
+    def merge(self, other: '_GroupedAggregator'):
+        """
+        Добавляет статистику другого накопителя того же типа.
+
+        :param other: Другой накопитель
+        :raises TypeError: Если накопители разных типов
+        :raises ValueError: Если накопители переводят характеристики
+            в разные единицы измерения
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"Нельзя объединить {type(self).__name__} "
+                            f"с {type(other).__name__}.")
+        if other.get_unit() != self.__unit:
+            raise ValueError("Нельзя объединить статистику в разных единицах измерения.")
+        for (kind_name, unit), accumulators in other.get_groups().items():
+            group = self._group(kind_name, unit)
+            for metric, accumulator in accumulators.items():
+                group[metric].merge(accumulator)
+
+    def get_groups(self) -> Dict[Tuple[str, str], dict]:
+        """
+        Возвращает накопители по группам.
+
+        :return: Словарь {(тип фигуры, единица): {характеристика: накопитель}}
+        """
+        return dict(sorted(self.__groups.items()))
+
+    @abstractmethod
+    def _cells(self, accumulator, unit: str) -> List[str]:
+        """
+        Формирует ячейки таблицы для непустого накопителя.
+
+        :param accumulator: Накопитель характеристики
+        :param unit: Единица измерения с показателем степени (например, 'cm²')
+        :return: Список ячеек
+        """
+        pass
+
+    def rows(self) -> List[List[str]]:
+        """
+        Формирует строки таблицы для print_table.
+
+        :return: Список строк таблицы (столбцы соответствуют HEADERS)
+        """
+        columns = (len(self.HEADERS) - 3) // len(self.METRICS)
+        rows = []
+        for (kind_name, unit), group in self.get_groups().items():
+            row = [kind_name, unit, str(group['area'].get_count())]
+            for metric, suffix in (('area', '²'), ('volume', '³')):
+                accumulator = group[metric]
+                if accumulator.get_count():
+                    row += self._cells(accumulator, unit + suffix)
+                else:
+                    row += ['-'] * columns
+            rows.append(row)
+        return rows
+
+
+class ShapeAggregator(_GroupedAggregator):
+    """
+    Накопитель статистики площади и объема по группам (тип фигуры, единица):
+    количество, сумма, среднее, минимум и максимум.
+    """
+
+    HEADERS = ['Фигура', 'Единица', 'Количество',
+               'Площадь: сумма', 'среднее', 'мин', 'макс',
+               'Объем: сумма', 'среднее', 'мин', 'макс']
+
+    def __init__(self, unit: Optional[str] = None):
+        """
+        Конструктор класса ShapeAggregator.
+
+        :param unit: Единица измерения, в которую переводятся характеристики,
+            или None, чтобы группировать фигуры по их собственным единицам
+        :raises ValueError: Если единица неизвестна
+        """
+        super().__init__(unit, MetricSummary)
+
+    def _cells(self, accumulator: MetricSummary, unit: str) -> List[str]:
+        """
+        Формирует ячейки суммы, среднего, минимума и максимума.
+
+        :param accumulator: Сводка характеристики
+        :param unit: Единица измерения с показателем степени
+        :return: Список ячеек
+        """
+        return [f"{value:.2f} {unit}" for value in
+                (accumulator.get_total(), accumulator.get_mean(),
+                 accumulator.get_min(), accumulator.get_max())]
+
+
+class QuantileAggregator(_GroupedAggregator):
+    """
+    Накопитель квантилей площади и объема по группам (тип фигуры, единица).
+
+    Для каждой группы хранятся скетчи QuantileSketch, поэтому память
+    не зависит от количества фигур, а накопители разных процессов
+    объединяются методом merge.
+    """
+
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    HEADERS = ['Фигура', 'Единица', 'Количество',
+               'Площадь: p50', 'p90', 'p99',
+               'Объем: p50', 'p90', 'p99']
+
+    def __init__(self, unit: Optional[str] = None, k: int = 200):
+        """
+        Конструктор класса QuantileAggregator.
+
+        :param unit: Единица измерения, в которую переводятся характеристики,
+            или None, чтобы группировать фигуры по их собственным единицам
+        :param k: Параметр точности скетчей
+        :raises ValueError: Если единица неизвестна
+        """
+        super().__init__(unit, partial(QuantileSketch, k))
+
+    def _cells(self, accumulator: QuantileSketch, unit: str) -> List[str]:
+        """
+        Формирует ячейки квантилей QUANTILES.
+
+        :param accumulator: Скетч характеристики
+        :param unit: Единица измерения с показателем степени
+        :return: Список ячеек
+        """
+        return [f"{value:.2f} {unit}" for value in accumulator.quantiles(self.QUANTILES)]
+
+
+def aggregate(shapes: Union[ShapeBatch, PolygonBatch, Iterable[Union[Shape, ThreeDShape]]],
+              unit: Optional[str] = None) -> ShapeAggregator:
+    """
+    Вычисляет количество, сумму, среднее, минимум и максимум площади
+    и объема по группам (тип фигуры, единица измерения).
+
+    Прямоугольники, круги, кубы и сферы из списка или коллекции один раз
+    упаковываются в ShapeBatch, после чего статистика всех групп
+    вычисляется векторными операциями; остальные фигуры (например,
+    многоугольники) добавляются по одной.
+    Строки результата выводятся через print_table:
+    print_table(result.rows(), ShapeAggregator.HEADERS).
+
+    :param shapes: Набор фигур или многоугольников, список или коллекция фигур
+    :param unit: Единица измерения для перевода характеристик (None - без перевода)
+    :return: Накопитель со статистикой
+    """
+    aggregator = ShapeAggregator(unit)
+    if isinstance(shapes, (ShapeBatch, PolygonBatch)):
+        aggregator.add_batch(shapes)
+        return aggregator
+
+    batched = []
+    others = []
+    for shape in shapes:
+        (batched if isinstance(shape, (Rectangle, Circle, Cube, Sphere)) else others).append(shape)
+    aggregator.add_batch(ShapeBatch.from_shapes(batched))
+    aggregator.add_shapes(others)
+    return aggregator
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,332 @@
+"""
+Общая часть базовых классов 2D и 3D геометрических фигур.
+"""
+
+from sys import intern
+from typing import Optional, Sequence
+
+import numpy as np
+
+from shapes.units import canonical_dimensions, registry
+from shapes.validation import position_tuple
+
+
+def _restore(cls, arguments: tuple, position: Optional[tuple] = None):
+    """
+    Восстанавливает фигуру из представления, созданного __reduce__.
+
+    :param cls: Класс фигуры
+    :param arguments: Размеры фигуры и единица измерения
+    :param position: Положение фигуры или None
+    :return: Восстановленная фигура
+    """
+    *dimensions, unit = arguments
+    for value in dimensions:
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    shape = cls._unchecked(*dimensions, intern(unit))
+    shape._position = position
+    return shape
+
+
+class ShapeMixin:
+    """
+    Общая часть классов Shape и ThreeDShape: единица измерения,
+    положение, наблюдатели, перевод единиц, геометрическая
+    идентичность и сериализация.
+
+    Подклассы задают количество координат положения _AXES, объявляют
+    слоты кэшированных характеристик и сбрасывают их вместе с кэшем
+    хэша _hash в методе _invalidate_metrics.
+    """
+
+    __slots__ = ('_unit', '_position', '_observers', '_hash')
+
+    # Количество координат положения фигуры
+    _AXES = 2
+
+    def __init__(self, unit: str = 'cm', position: Sequence[float] = None):
+        """
+        Базовый конструктор фигуры.
+
+        :param unit: Единица измерения
+        :param position: Координаты опорной точки или None
+        """
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+
+        self._init_unchecked(intern(unit))
+        if position is not None:
+            self._position = position_tuple(position, self._AXES)
+
+    def _init_unchecked(self, unit: str):
+        """
+        Инициализирует поля базового класса без проверки аргументов.
+
+        :param unit: Интернированная единица измерения
+        """
+        self._unit = unit
+        self._position = None
+        self._observers = None
+        self._invalidate_metrics()
+
+    def get_unit(self) -> str:
+        """
+        Возвращает единицу измерения фигуры.
+
+        :return: Единица измерения
+        """
+        return self._unit
+
+    def set_unit(self, unit: str):
+        """
+        Устанавливает новое значение единицы измерения.
+
+        :param unit: Новая единица измерения
+        """
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+        unit = intern(unit)
+        changed = unit is not self._unit
+        self._unit = unit
+        if changed:
+            self._changed()
+
+    def _invalidate_metrics(self):
+        """
+        Сбрасывает кэшированные характеристики и хэш после изменения фигуры.
+
+        Характеристики хранятся в слотах подклассов, поэтому подклассы
+        переопределяют этот метод и сбрасывают в нем также _hash.
+        """
+        self._hash = None
+
+    def _changed(self):
+        """
+        Обрабатывает изменение размеров или единицы измерения фигуры:
+        сбрасывает кэш характеристик и уведомляет наблюдателей.
+        """
+        self._invalidate_metrics()
+        self._notify()
+
+    def _notify(self):
+        """
+        Вызывает всех наблюдателей фигуры.
+
+        Ошибка одного наблюдателя не мешает уведомить остальных, поэтому
+        все коллекции и индексы фигуры остаются согласованными; после
+        вызова всех наблюдателей первая ошибка передается вызвавшему коду.
+
+        :raises Exception: Первая ошибка, возникшая у наблюдателей
+        """
+        if self._observers:
+            error = None
+            for observer in list(self._observers):
+                try:
+                    observer(self)
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+            if error is not None:
+                raise error
+
+    def _add_observer(self, observer):
+        """
+        Добавляет наблюдателя, вызываемого после каждого изменения фигуры.
+
+        :param observer: Функция, принимающая измененную фигуру
+        """
+        if self._observers is None:
+            self._observers = []
+        self._observers.append(observer)
+
+    def _remove_observer(self, observer):
+        """
+        Удаляет наблюдателя фигуры.
+
+        :param observer: Ранее добавленная функция
+        """
+        if self._observers:
+            self._observers.remove(observer)
+
+    def get_position(self) -> Optional[tuple]:
+        """
+        Возвращает положение фигуры.
+
+        :return: Координаты опорной точки или None, если фигура не размещена
+        """
+        return self._position
+
+    def set_position(self, position: Optional[Sequence[float]]):
+        """
+        Устанавливает положение фигуры.
+
+        :param position: Координаты опорной точки или None
+        """
+        if position is not None:
+            position = position_tuple(position, self._AXES)
+        changed = position != self._position
+        self._position = position
+        if changed:
+            self._notify()
+
+    def _require_position(self) -> tuple:
+        """
+        Возвращает положение фигуры, если оно задано.
+
+        :return: Координаты опорной точки
+        :raises ValueError: Если положение фигуры не задано
+        """
+        if self._position is None:
+            raise ValueError("Положение фигуры не задано.")
+        return self._position
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет ограничивающий прямоугольник (для 3D фигур -
+        параллелепипед) фигуры.
+
+        :return: Кортеж (минимальные координаты, максимальные координаты)
+        :raises ValueError: Если положение фигуры не задано
+        :raises NotImplementedError: Если метод не определен в подклассе
+        """
+        raise NotImplementedError
+
+    def to_unit(self, unit: str) -> 'ShapeMixin':
+        """
+        Создает копию фигуры с размерами, переведенными в единицу unit.
+
+        Размеры фигуры уже проверены, поэтому копия создается без
+        повторных проверок. Положение фигуры, если оно задано, также
+        переводится в новую единицу.
+
+        :param unit: Целевая единица измерения
+        :return: Новая фигура того же типа
+        :raises ValueError: Если указана неизвестная единица измерения
+        """
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+        factor = registry.factor(self._unit, unit)
+        shape = self._scaled(factor, intern(unit))
+        if self._position is not None:
+            shape._position = tuple(value * factor for value in self._position)
+        return shape
+
+    def _scaled(self, factor: float, unit: str) -> 'ShapeMixin':
+        """
+        Создает копию фигуры с размерами, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения копии
+        :return: Новая фигура того же типа
+        :raises NotImplementedError: Если метод не определен в подклассе
+        """
+        raise NotImplementedError
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает размеры фигуры в каноническом порядке.
+
+        :return: Кортеж размеров
+        :raises NotImplementedError: Если метод не определен в подклассе
+        """
+        raise NotImplementedError
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает размеры фигуры в порядке аргументов _unchecked.
+
+        :return: Кортеж размеров
+        :raises NotImplementedError: Если метод не определен в подклассе
+        """
+        raise NotImplementedError
+
+    def __reduce__(self) -> tuple:
+        """
+        Возвращает компактное представление фигуры для pickle.
+
+        Сохраняются только размеры, единица измерения и положение:
+        кэш характеристик и наблюдатели не сериализуются, а фигура
+        восстанавливается через _unchecked без повторных проверок.
+
+        :return: Кортеж (функция восстановления, ее аргументы)
+        """
+        arguments = self._arguments() + (self._unit,)
+        if self._position is None:
+            return _restore, (type(self), arguments)
+        return _restore, (type(self), arguments, self._position)
+
+    def geometry_key(self, tolerance: float = 1e-9) -> tuple:
+        """
+        Возвращает ключ геометрической идентичности фигуры.
+
+        Ключ состоит из типа фигуры и размеров, переведенных в метры
+        и округленных до кратных tolerance, поэтому одинаковые фигуры,
+        заданные в разных единицах измерения, имеют одинаковый ключ.
+
+        Размеры в неизвестной реестру единице (например, 'inch') нельзя
+        перевести в метры: ключ такой фигуры содержит саму единицу
+        и размеры без перевода и округления, поэтому она равна только
+        фигуре того же типа с той же единицей и теми же размерами.
+
+        :param tolerance: Точность сравнения размеров в метрах
+        :return: Кортеж (название типа, размеры...) или
+            (название типа, единица, размеры...) для неизвестной единицы
+        """
+        if registry.code(self._unit) < 0:
+            return (self.__class__.__name__, self._unit) + self._dimensions()
+        return (self.__class__.__name__,) + canonical_dimensions(
+            self._dimensions(), self._unit, tolerance)
+
+    def __eq__(self, other: 'ShapeMixin') -> bool:
+        """
+        Сравнение фигур по геометрической идентичности: фигуры равны,
+        если совпадают их ключи geometry_key (тип и размеры в метрах).
+
+        До появления geometry_key оператор == сравнивал площади фигур.
+        Теперь фигуры разных типов или размеров с одинаковой площадью
+        не равны, и == не согласован с операторами < и >, которые
+        по-прежнему сравнивают площади: из того, что не выполняется
+        ни a < b, ни a > b, не следует a == b. Для сравнения площадей
+        используется compare_shapes_by_area.
+
+        Сначала сравниваются кэшированные хэши, поэтому сравнение разных
+        фигур обычно не строит ключи заново.
+
+        :param other: Другая фигура для сравнения
+        :return: True если фигуры геометрически одинаковы, иначе False
+        """
+        if not isinstance(other, ShapeMixin):
+            return NotImplemented
+        if self is other:
+            return True
+        return hash(self) == hash(other) and self.geometry_key() == other.geometry_key()
+
+    def __hash__(self) -> int:
+        """
+        Вычисляет хэш фигуры по ключу geometry_key, согласованный
+        со сравнением.
+
+        Хэш меняется при изменении размеров: фигуру нельзя изменять,
+        пока она хранится в множестве или используется как ключ словаря.
+        Построение ключа многоугольника или сетки занимает время,
+        пропорциональное количеству вершин, поэтому хэш хранится в слоте
+        _hash и сбрасывается вместе с кэшем характеристик.
+
+        :return: Хэш фигуры
+        """
+        value = self._hash
+        if value is None:
+            value = self._hash = hash(self.geometry_key())
+        return value
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление фигуры.
+
+        :return: Строковое представление
+        """
+        return f"{self.__class__.__name__}(unit={self._unit})"
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,593 @@
+"""
+Модуль для векторизованной обработки больших наборов фигур.
+"""
+
+from math import pi
+from sys import intern
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from shapes.shapes2d import (Shape, Rectangle, Circle, Polygon,
+                              polygon_areas, polygon_perimeters)
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+from shapes.units import registry, unit_code
+from shapes.validation import check_lengths, check_rows, numeric_column
+
+
+class ShapeBatch:
+    """
+    Колоночное хранилище фигур на основе массивов NumPy.
+
+    Каждая фигура описывается кодом типа, двумя размерами и кодом единицы
+    измерения. Коды единиц ссылаются на список строк единиц, общий для
+    всего набора.
+
+    Размеры по типам фигур:
+
+    - RECTANGLE: ширина, высота;
+    - CIRCLE: радиус, 0;
+    - CUBE: сторона, 0;
+    - SPHERE: радиус, 0.
+    """
+
+    RECTANGLE = 0
+    CIRCLE = 1
+    CUBE = 2
+    SPHERE = 3
+
+    KIND_NAMES = ('Rectangle', 'Circle', 'Cube', 'Sphere')
+
+    def __init__(self, kinds, dim1, dim2, unit_codes, units: Sequence[str]):
+        """
+        Конструктор класса ShapeBatch.
+
+        Массивы не копируются, если уже имеют нужный тип данных.
+
+        :param kinds: Коды типов фигур
+        :param dim1: Первый размер каждой фигуры
+        :param dim2: Второй размер каждой фигуры
+        :param unit_codes: Коды единиц измерения (индексы в units)
+        :param units: Список единиц измерения
+        :raises ValueError: Если массивы имеют разную длину или единиц
+            измерения больше 256 (коды хранятся как uint8)
+        """
+        if len(units) > 256:
+            raise ValueError("Набор поддерживает не более 256 единиц измерения.")
+        self.__kinds = np.asarray(kinds, dtype=np.uint8)
+        self.__dim1 = np.asarray(dim1, dtype=np.float64)
+        self.__dim2 = np.asarray(dim2, dtype=np.float64)
+        self.__unit_codes = np.asarray(unit_codes, dtype=np.uint8)
+        self.__units = tuple(units)
+
+        size = len(self.__kinds)
+        if not all(len(column) == size for column in
+                   [self.__dim1, self.__dim2, self.__unit_codes]):
+            raise ValueError("Все массивы должны иметь одинаковую длину.")
+
+    @classmethod
+    def from_shapes(cls, shapes: Iterable[Union[Shape, ThreeDShape]]) -> 'ShapeBatch':
+        """
+        Создает набор из списка объектов фигур.
+
+        :param shapes: Фигуры Rectangle, Circle, Cube или Sphere
+        :return: Новый набор фигур
+        :raises TypeError: Если встречена фигура неподдерживаемого типа
+        :raises ValueError: Если у фигур более 256 различных единиц измерения
+        """
+        kinds = []
+        dim1 = []
+        dim2 = []
+        unit_codes = []
+        units: Dict[str, int] = {}
+
+        for shape in shapes:
+            if isinstance(shape, Rectangle):
+                kind, first, second = cls.RECTANGLE, shape.get_width(), shape.get_height()
+            elif isinstance(shape, Circle):
+                kind, first, second = cls.CIRCLE, shape.get_radius(), 0.0
+            elif isinstance(shape, Cube):
+                kind, first, second = cls.CUBE, shape.get_side(), 0.0
+            elif isinstance(shape, Sphere):
+                kind, first, second = cls.SPHERE, shape.get_radius(), 0.0
+            else:
+                raise TypeError(f"Неподдерживаемый тип фигуры: "
+                                f"{shape.__class__.__name__}")
+
+            kinds.append(kind)
+            dim1.append(first)
+            dim2.append(second)
+            unit_codes.append(units.setdefault(shape.get_unit(), len(units)))
+
+        return cls(kinds, dim1, dim2, unit_codes, list(units))
+
+    @classmethod
+    def from_arrays(cls, kinds, dim1, dim2, unit_codes, units: Sequence[str],
+                    trusted: bool = False) -> 'ShapeBatch':
+        """
+        Создает набор из столбцов данных с векторизованной проверкой.
+
+        Проверяются тип данных столбцов, коды типов фигур и единиц
+        и положительность размеров; ошибка перечисляет все некорректные
+        строки сразу.
+
+        :param kinds: Коды типов фигур
+        :param dim1: Первый размер каждой фигуры
+        :param dim2: Второй размер каждой фигуры
+        :param unit_codes: Коды единиц измерения (индексы в units)
+        :param units: Список единиц измерения
+        :param trusted: Не проверять значения (для данных, уже проверенных
+            ранее, например из хранилища shapes.store)
+        :return: Новый набор фигур
+        :raises TypeError: Если столбцы имеют нечисловой тип данных
+        :raises ValueError: Если в данных есть некорректные строки
+        """
+        kinds = np.asarray(kinds)
+        unit_codes = np.asarray(unit_codes)
+        if kinds.dtype.kind not in 'iu' or unit_codes.dtype.kind not in 'iu':
+            raise TypeError("Коды типов фигур и единиц измерения должны быть целыми числами.")
+        dim1 = numeric_column(dim1, "Размеры фигур должны быть числами.")
+        dim2 = numeric_column(dim2, "Размеры фигур должны быть числами.")
+        check_lengths(kinds, dim1, dim2, unit_codes)
+        if not all(isinstance(unit, str) for unit in units):
+            raise TypeError("Единица измерения должна быть строкой.")
+        if len(units) > 256:
+            raise ValueError("Набор поддерживает не более 256 единиц измерения.")
+
+        if not trusted:
+            check_rows((kinds < 0) | (kinds >= len(cls.KIND_NAMES)),
+                       "Неизвестный код типа фигуры")
+            check_rows((unit_codes < 0) | (unit_codes >= len(units)),
+                       "Неизвестный код единицы измерения")
+
+        batch = cls(kinds, dim1, dim2, unit_codes, units)
+        if not trusted:
+            batch.validate()
+        return batch
+
+    def invalid_rows(self) -> np.ndarray:
+        """
+        Находит фигуры с некорректными значениями: неизвестным типом или
+        единицей измерения и неположительными (или NaN) размерами.
+
+        :return: Булева маска некорректных фигур
+        """
+        kinds = self.__kinds
+        return ((kinds >= len(self.KIND_NAMES)) |
+                (self.__unit_codes >= len(self.__units)) |
+                ~(self.__dim1 > 0) |
+                ((kinds == self.RECTANGLE) & ~(self.__dim2 > 0)))
+
+    def validate(self):
+        """
+        Проверяет все фигуры набора одной векторной операцией.
+
+        :raises ValueError: Со списком всех некорректных строк
+        """
+        check_rows(self.invalid_rows(),
+                   "Некорректные тип, единица измерения или размеры фигуры")
+
+    def to_shapes(self, trusted: bool = False) -> List[Union[Shape, ThreeDShape]]:
+        """
+        Преобразует набор обратно в список объектов фигур.
+
+        Набор проверяется целиком перед созданием объектов, поэтому сами
+        объекты создаются без повторных проверок в конструкторах.
+
+        :param trusted: Не проверять набор (если он уже проверен)
+        :return: Список фигур Rectangle, Circle, Cube и Sphere
+        :raises ValueError: Если в наборе есть некорректные фигуры
+        """
+        if not trusted:
+            self.validate()
+
+        factories = (
+            Rectangle._unchecked,
+            lambda radius, _, unit: Circle._unchecked(radius, unit),
+            lambda side, _, unit: Cube._unchecked(side, unit),
+            lambda radius, _, unit: Sphere._unchecked(radius, unit),
+        )
+        units = [intern(unit) for unit in self.__units]
+        return [factories[kind](first, second, units[code])
+                for kind, first, second, code in zip(self.__kinds.tolist(),
+                                                     self.__dim1.tolist(),
+                                                     self.__dim2.tolist(),
+                                                     self.__unit_codes.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.__kinds)
+
+    def get_kinds(self) -> np.ndarray:
+        """
+        Возвращает коды типов фигур.
+
+        :return: Массив кодов типов
+        """
+        return self.__kinds
+
+    def get_dimensions(self) -> tuple:
+        """
+        Возвращает массивы размеров фигур.
+
+        :return: Кортеж (первый размер, второй размер)
+        """
+        return self.__dim1, self.__dim2
+
+    def get_unit_codes(self) -> np.ndarray:
+        """
+        Возвращает коды единиц измерения.
+
+        :return: Массив кодов единиц
+        """
+        return self.__unit_codes
+
+    def get_units(self) -> tuple:
+        """
+        Возвращает список единиц измерения, на которые ссылаются коды.
+
+        :return: Кортеж единиц измерения
+        """
+        return self.__units
+
+    def take(self, indices) -> 'ShapeBatch':
+        """
+        Возвращает новый набор из фигур с указанными индексами.
+
+        :param indices: Индексы или булева маска фигур
+        :return: Новый набор фигур
+        """
+        return ShapeBatch(self.__kinds[indices], self.__dim1[indices],
+                          self.__dim2[indices], self.__unit_codes[indices],
+                          self.__units)
+
+    def to_unit(self, unit: str) -> 'ShapeBatch':
+        """
+        Переводит размеры всех фигур набора в заданную единицу измерения.
+
+        :param unit: Целевая единица измерения
+        :return: Новый набор фигур в единице unit
+        :raises ValueError: Если единица неизвестна (для исходных единиц
+            перечисляются позиции фигур с неизвестной единицей)
+        """
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+        target = unit_code(unit)
+        if target < 0:
+            raise ValueError(f"Неизвестная целевая единица измерения: {unit}")
+
+        sources = np.array([unit_code(name) for name in self.__units], dtype=np.intp)
+        codes = sources[self.__unit_codes] if len(sources) else np.empty(0, np.intp)
+        bad = np.flatnonzero(codes < 0)
+        if len(bad):
+            unknown = sorted({self.__units[code] for code in self.__unit_codes[bad].tolist()})
+            raise ValueError(f"Неизвестная исходная единица измерения "
+                             f"в позициях {bad.tolist()}: {unknown}")
+
+        factors = registry.get_factor_matrix()[codes, target]
+        return ShapeBatch(self.__kinds, self.__dim1 * factors, self.__dim2 * factors,
+                          np.zeros(len(self), dtype=np.uint8), [unit])
+
+    def _evaluate(self, formulas: dict) -> np.ndarray:
+        """
+        Вычисляет характеристику для всех фигур набора.
+
+        Для типов фигур, не указанных в formulas, результат равен NaN.
+
+        :param formulas: Словарь {код типа: функция (dim1, dim2) -> массив}
+        :return: Массив значений
+        """
+        result = np.full(len(self), np.nan)
+        for kind, formula in formulas.items():
+            mask = self.__kinds == kind
+            if mask.any():
+                result[mask] = formula(self.__dim1[mask], self.__dim2[mask])
+        return result
+
+    def area(self) -> np.ndarray:
+        """
+        Вычисляет площади 2D фигур набора (NaN для 3D фигур).
+
+        :return: Массив площадей
+        """
+        return self._evaluate({
+            self.RECTANGLE: lambda width, height: width * height,
+            self.CIRCLE: lambda radius, _: pi * radius ** 2,
+        })
+
+    def perimeter(self) -> np.ndarray:
+        """
+        Вычисляет периметры 2D фигур набора (NaN для 3D фигур).
+
+        :return: Массив периметров
+        """
+        return self._evaluate({
+            self.RECTANGLE: lambda width, height: 2 * (width + height),
+            self.CIRCLE: lambda radius, _: 2 * pi * radius,
+        })
+
+    def surface_area(self) -> np.ndarray:
+        """
+        Вычисляет площади поверхности 3D фигур набора (NaN для 2D фигур).
+
+        :return: Массив площадей поверхности
+        """
+        return self._evaluate({
+            self.CUBE: lambda side, _: 6 * side ** 2,
+            self.SPHERE: lambda radius, _: 4 * pi * radius ** 2,
+        })
+
+    def volume(self) -> np.ndarray:
+        """
+        Вычисляет объемы 3D фигур набора (NaN для 2D фигур).
+
+        :return: Массив объемов
+        """
+        return self._evaluate({
+            self.CUBE: lambda side, _: side ** 3,
+            self.SPHERE: lambda radius, _: (4 / 3) * pi * radius ** 3,
+        })
+
+    def comparable_area(self) -> np.ndarray:
+        """
+        Вычисляет площадь, по которой фигуры сравниваются между собой:
+        площадь для 2D фигур и площадь поверхности для 3D фигур
+        (как в compare_shapes_by_area).
+
+        :return: Массив площадей
+        """
+        return self._evaluate({
+            self.RECTANGLE: lambda width, height: width * height,
+            self.CIRCLE: lambda radius, _: pi * radius ** 2,
+            self.CUBE: lambda side, _: 6 * side ** 2,
+            self.SPHERE: lambda radius, _: 4 * pi * radius ** 2,
+        })
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта ShapeBatch.
+
+        :return: Строковое представление набора
+        """
+        return f"ShapeBatch(size={len(self)}, units={list(self.__units)})"
+
+
+class PolygonBatch:
+    """
+    Колоночное хранилище многоугольников с разным количеством вершин.
+
+    Вершины всех многоугольников записаны подряд в одном массиве формы
+    (M, 2); массив offsets длины N + 1 содержит индекс первой вершины
+    каждого многоугольника и общее количество вершин M в конце.
+    Все многоугольники набора имеют общую единицу измерения.
+    """
+
+    def __init__(self, coordinates, offsets, unit: str = 'cm'):
+        """
+        Конструктор класса PolygonBatch.
+
+        Массивы не копируются, если уже имеют нужный тип данных.
+
+        :param coordinates: Вершины всех многоугольников, массив (M, 2)
+        :param offsets: Начала многоугольников и M в конце
+        :param unit: Единица измерения
+        :raises ValueError: Если смещения не начинаются с 0, не заканчиваются
+            количеством вершин или задают многоугольник менее чем
+            из 3 вершин (со списком всех таких многоугольников)
+        """
+        self.__coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        self.__offsets = np.asarray(offsets, dtype=np.intp)
+        self.__unit = intern(unit)
+
+        if (self.__offsets.ndim != 1 or not len(self.__offsets) or self.__offsets[0] != 0 or
+                self.__offsets[-1] != len(self.__coordinates)):
+            raise ValueError("Смещения должны начинаться с 0 и заканчиваться "
+                             "количеством вершин.")
+        counts = np.diff(self.__offsets)
+        check_rows(counts < 0, "Смещения должны не убывать")
+        check_rows(counts < 3, "Многоугольник должен иметь не менее 3 вершин")
+
+    @classmethod
+    def from_polygons(cls, polygons: Iterable[Polygon],
+                      unit: Optional[str] = None) -> 'PolygonBatch':
+        """
+        Создает набор из списка многоугольников.
+
+        :param polygons: Многоугольники
+        :param unit: Единица измерения набора (по умолчанию единица
+            первого многоугольника); вершины многоугольников в других
+            единицах переводятся в нее
+        :return: Новый набор многоугольников
+        :raises TypeError: Если встречена фигура другого типа
+        """
+        polygons = list(polygons)
+        if not all(isinstance(polygon, Polygon) for polygon in polygons):
+            raise TypeError("Все элементы должны быть многоугольниками Polygon.")
+        if unit is None:
+            unit = polygons[0].get_unit() if polygons else 'cm'
+
+        arrays = [polygon.get_vertices() if polygon.get_unit() == unit
+                  else polygon.to_unit(unit).get_vertices() for polygon in polygons]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+        np.cumsum([len(array) for array in arrays], out=offsets[1:])
+        coordinates = np.concatenate(arrays) if arrays else np.empty((0, 2))
+        return cls(coordinates, offsets, unit)
+
+    @classmethod
+    def from_arrays(cls, coordinates, offsets, unit: str = 'cm',
+                    trusted: bool = False) -> 'PolygonBatch':
+        """
+        Создает набор из массивов вершин и смещений с векторизованной проверкой.
+
+        :param coordinates: Вершины всех многоугольников, массив (M, 2)
+        :param offsets: Начала многоугольников и M в конце
+        :param unit: Единица измерения
+        :param trusted: Не проверять многоугольники (для уже проверенных данных)
+        :return: Новый набор многоугольников
+        :raises TypeError: Если массивы имеют нечисловой тип данных
+        :raises ValueError: Если в данных есть некорректные многоугольники
+        """
+        coordinates = np.asarray(coordinates)
+        offsets = np.asarray(offsets)
+        if coordinates.dtype.kind not in 'biuf' or coordinates.ndim != 2 or \
+                coordinates.shape[1] != 2:
+            raise TypeError("Вершины должны быть массивом пар чисел (x, y).")
+        if offsets.dtype.kind not in 'iu':
+            raise TypeError("Смещения должны быть целыми числами.")
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+
+        batch = cls(coordinates, offsets, unit)
+        if not trusted:
+            batch.validate()
+        return batch
+
+    def invalid_rows(self) -> np.ndarray:
+        """
+        Находит некорректные многоугольники: с бесконечными (или NaN)
+        координатами или нулевой площадью. Количество вершин проверяется
+        конструктором.
+
+        :return: Булева маска некорректных многоугольников
+        """
+        invalid = np.zeros(len(self), dtype=bool)
+        if len(self):
+            finite = np.isfinite(self.__coordinates).all(axis=1)
+            invalid = np.logical_and.reduceat(finite, self.__offsets[:-1]) == 0
+        # Площадь считается только для многоугольников с конечными координатами
+        filled = ~invalid
+        if filled.any():
+            subset = self.take(np.flatnonzero(filled))
+            invalid[filled] = ~(subset.area() > 0)
+        return invalid
+
+    def validate(self):
+        """
+        Проверяет все многоугольники набора векторными операциями.
+
+        :raises ValueError: Со списком всех некорректных многоугольников
+        """
+        check_rows(self.invalid_rows(), "Некорректные вершины многоугольника")
+
+    def to_polygons(self, trusted: bool = False) -> List[Polygon]:
+        """
+        Преобразует набор в список объектов многоугольников.
+
+        Вершины каждого многоугольника являются представлением общего
+        массива набора, без копирования.
+
+        :param trusted: Не проверять набор (если он уже проверен)
+        :return: Список многоугольников
+        :raises ValueError: Если в наборе есть некорректные многоугольники
+        """
+        if not trusted:
+            self.validate()
+        coordinates = self.__coordinates.view()
+        coordinates.setflags(write=False)
+        offsets = self.__offsets.tolist()
+        return [Polygon._unchecked(coordinates[start:stop], self.__unit)
+                for start, stop in zip(offsets, offsets[1:])]
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def get_coordinates(self) -> np.ndarray:
+        """
+        Возвращает вершины всех многоугольников.
+
+        :return: Массив формы (M, 2)
+        """
+        return self.__coordinates
+
+    def get_offsets(self) -> np.ndarray:
+        """
+        Возвращает смещения многоугольников.
+
+        :return: Массив длины N + 1
+        """
+        return self.__offsets
+
+    def get_vertex_counts(self) -> np.ndarray:
+        """
+        Возвращает количество вершин каждого многоугольника.
+
+        :return: Массив длины N
+        """
+        return np.diff(self.__offsets)
+
+    def get_unit(self) -> str:
+        """
+        Возвращает единицу измерения набора.
+
+        :return: Единица измерения
+        """
+        return self.__unit
+
+    def take(self, indices) -> 'PolygonBatch':
+        """
+        Возвращает новый набор из многоугольников с указанными индексами.
+
+        :param indices: Индексы или булева маска многоугольников
+        :return: Новый набор многоугольников
+        """
+        indices = np.arange(len(self))[indices]
+        starts = self.__offsets[:-1][indices]
+        counts = self.get_vertex_counts()[indices]
+        offsets = np.zeros(len(indices) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        # Индекс каждой вершины нового набора в исходном массиве вершин
+        source = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+        return PolygonBatch(self.__coordinates[source], offsets, self.__unit)
+
+    def to_unit(self, unit: str) -> 'PolygonBatch':
+        """
+        Переводит координаты всех многоугольников в заданную единицу измерения.
+
+        :param unit: Целевая единица измерения
+        :return: Новый набор многоугольников в единице unit
+        :raises ValueError: Если указана неизвестная единица измерения
+        """
+        if not isinstance(unit, str):
+            raise TypeError("Единица измерения должна быть строкой.")
+        factor = registry.factor(self.__unit, unit)
+        return PolygonBatch(self.__coordinates * factor, self.__offsets, unit)
+
+    def area(self) -> np.ndarray:
+        """
+        Вычисляет площади всех многоугольников формулой шнурования.
+
+        :return: Массив площадей
+        """
+        if not len(self.__coordinates):
+            return np.zeros(len(self))
+        return polygon_areas(self.__coordinates, self.__offsets)
+
+    def perimeter(self) -> np.ndarray:
+        """
+        Вычисляет периметры всех многоугольников.
+
+        :return: Массив периметров
+        """
+        if not len(self.__coordinates):
+            return np.zeros(len(self))
+        return polygon_perimeters(self.__coordinates, self.__offsets)
+
+    def comparable_area(self) -> np.ndarray:
+        """
+        Вычисляет площадь, по которой фигуры сравниваются между собой
+        (для многоугольников совпадает с area).
+
+        :return: Массив площадей
+        """
+        return self.area()
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта PolygonBatch.
+
+        :return: Строковое представление набора
+        """
+        return (f"PolygonBatch(size={len(self)}, vertices={len(self.__coordinates)}, "
+                f"unit={self.__unit})")
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,68 @@
+"""
+Кэширование вычисляемых характеристик фигур.
+"""
+
+from functools import wraps
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """
+    Счетчики обращений к кэшу характеристик.
+    """
+
+    hits: int
+    misses: int
+
+
+_hits = 0
+_misses = 0
+
+
+def cached_metric(method):
+    """
+    Декоратор, кэширующий результат метода характеристики фигуры.
+
+    Значение хранится в слоте с именем '_' + имя метода (например,
+    '_area'), который должен быть объявлен в классе фигуры и сбрасываться
+    в None при изменении фигуры.
+
+    :param method: Метод без аргументов, вычисляющий характеристику
+    :return: Метод с кэшированием
+    """
+    slot = '_' + method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        global _hits, _misses
+        value = getattr(self, slot)
+        if value is None:
+            _misses += 1
+            value = method(self)
+            setattr(self, slot, value)
+        else:
+            _hits += 1
+        return value
+
+    return wrapper
+
+
+def metric_cache_info() -> CacheInfo:
+    """
+    Возвращает счетчики попаданий и промахов кэша характеристик.
+
+    :return: Счетчики (hits, misses)
+    """
+    return CacheInfo(_hits, _misses)
+
+
+def reset_metric_cache_info():
+    """
+    Обнуляет счетчики кэша характеристик.
+    """
+    global _hits, _misses
+    _hits = 0
+    _misses = 0
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,442 @@
+"""
+Коллекции фигур, обновляемые при изменении входящих в них фигур.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from math import inf
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from shapes.shapes2d import Shape
+from shapes.shapes3d import ThreeDShape
+from shapes.units import unit_code
+from shapes.utils import convert_units
+
+
+class _ObservedCollection(ABC):
+    """
+    Базовый класс коллекций, подписанных на изменения своих фигур.
+
+    Фигуры хранятся в порядке добавления. Подклассы получают уведомления
+    через методы _on_add, _on_remove и _on_change.
+    """
+
+    def __init__(self, shapes: Iterable[Union[Shape, ThreeDShape]] = ()):
+        # id фигуры: фигура
+        self._members: Dict[int, Union[Shape, ThreeDShape]] = {}
+        for shape in shapes:
+            self.add(shape)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[Union[Shape, ThreeDShape]]:
+        return iter(list(self._members.values()))
+
+    def __contains__(self, shape) -> bool:
+        return id(shape) in self._members
+
+    def add(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Добавляет фигуру в коллекцию. Повторное добавление игнорируется.
+
+        :param shape: Геометрическая фигура
+        :raises TypeError: Если объект не является фигурой
+        """
+        if not isinstance(shape, (Shape, ThreeDShape)):
+            raise TypeError("Коллекция может содержать только фигуры.")
+        key = id(shape)
+        if key in self._members:
+            return
+        self._members[key] = shape
+        self._on_add(shape)
+        shape._add_observer(self._on_change)
+
+    def remove(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Удаляет фигуру из коллекции.
+
+        :param shape: Фигура из коллекции
+        :raises KeyError: Если фигуры нет в коллекции
+        """
+        del self._members[id(shape)]
+        shape._remove_observer(self._on_change)
+        self._on_remove(shape)
+
+    def discard(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Удаляет фигуру из коллекции, если она там есть.
+
+        :param shape: Геометрическая фигура
+        """
+        if id(shape) in self._members:
+            self.remove(shape)
+
+    def clear(self):
+        """
+        Удаляет все фигуры из коллекции.
+        """
+        for shape in list(self._members.values()):
+            self.remove(shape)
+
+    @abstractmethod
+    def _on_add(self, shape):
+        """
+        Обрабатывает добавление фигуры в коллекцию.
+
+        :param shape: Добавленная фигура
+        """
+        pass
+
+    @abstractmethod
+    def _on_remove(self, shape):
+        """
+        Обрабатывает удаление фигуры из коллекции.
+
+        :param shape: Удаленная фигура
+        """
+        pass
+
+    @abstractmethod
+    def _on_change(self, shape):
+        """
+        Обрабатывает изменение размеров или единицы измерения фигуры.
+
+        :param shape: Измененная фигура
+        """
+        pass
+
+
+class IndexedShapeCollection(_ObservedCollection):
+    """
+    Коллекция фигур с отсортированными индексами по характеристикам.
+
+    Для каждой характеристики из METRICS хранится отсортированный список
+    пар (значение, номер фигуры), поэтому подсчет фигур в диапазоне
+    значений выполняется за O(log n), а выборка - за O(log n + k).
+    В индекс характеристики попадают только фигуры, у которых она есть:
+    площадь и периметр - у 2D фигур, объем и площадь поверхности - у 3D.
+
+    При вызове сеттера фигуры (set_width, set_radius, set_side и т. д.)
+    коллекция пересчитывает только характеристики этой фигуры
+    и переставляет только ее записи в индексах.
+    """
+
+    METRICS = ('area', 'perimeter', 'volume', 'surface_area')
+
+    def __init__(self, shapes: Iterable[Union[Shape, ThreeDShape]] = ()):
+        """
+        Конструктор класса IndexedShapeCollection.
+
+        :param shapes: Начальные фигуры коллекции
+        """
+        self.__indexes: Dict[str, list] = {metric: [] for metric in self.METRICS}
+        # номер фигуры: фигура
+        self.__shapes: Dict[int, Union[Shape, ThreeDShape]] = {}
+        # id фигуры: (номер фигуры, {характеристика: значение})
+        self.__entries: Dict[int, tuple] = {}
+        self.__counter = 0
+        super().__init__(shapes)
+
+    def _metrics_of(self, shape) -> Dict[str, float]:
+        """
+        Вычисляет характеристики фигуры, которые есть у ее типа.
+
+        :param shape: Геометрическая фигура
+        :return: Словарь {характеристика: значение}
+        """
+        return {metric: getattr(shape, metric)() for metric in self.METRICS
+                if hasattr(shape, metric)}
+
+    def _on_add(self, shape):
+        """
+        Присваивает фигуре номер и добавляет ее характеристики в индексы.
+
+        :param shape: Добавленная фигура
+        """
+        number = self.__counter
+        self.__counter += 1
+        values = self._metrics_of(shape)
+        self.__shapes[number] = shape
+        self.__entries[id(shape)] = (number, values)
+        for metric, value in values.items():
+            insort(self.__indexes[metric], (value, number))
+
+    def _on_remove(self, shape):
+        """
+        Удаляет записи фигуры из индексов.
+
+        :param shape: Удаленная фигура
+        """
+        number, values = self.__entries.pop(id(shape))
+        del self.__shapes[number]
+        for metric, value in values.items():
+            index = self.__indexes[metric]
+            del index[bisect_left(index, (value, number))]
+
+    def _on_change(self, shape):
+        """
+        Переставляет в индексах только изменившиеся характеристики фигуры.
+
+        :param shape: Измененная фигура
+        """
+        number, values = self.__entries[id(shape)]
+        for metric, value in self._metrics_of(shape).items():
+            old = values[metric]
+            if value != old:
+                index = self.__indexes[metric]
+                del index[bisect_left(index, (old, number))]
+                insort(index, (value, number))
+                values[metric] = value
+
+    def _bounds(self, metric: str, low: Optional[float],
+                high: Optional[float]) -> tuple:
+        """
+        Находит границы диапазона [low, high] в индексе характеристики.
+
+        :param metric: Характеристика из METRICS
+        :param low: Нижняя граница (None - без ограничения)
+        :param high: Верхняя граница (None - без ограничения)
+        :return: Кортеж (индекс, первая позиция, позиция за последней)
+        :raises ValueError: Если характеристика неизвестна
+        """
+        if metric not in self.__indexes:
+            raise ValueError(f"Неизвестная характеристика: {metric}. "
+                             f"Допустимые значения: {', '.join(self.METRICS)}.")
+        index = self.__indexes[metric]
+        first = 0 if low is None else bisect_left(index, (low, -inf))
+        last = len(index) if high is None else bisect_right(index, (high, inf))
+        return index, first, max(first, last)
+
+    def count(self, metric: str, low: Optional[float] = None,
+              high: Optional[float] = None) -> int:
+        """
+        Подсчитывает фигуры, у которых характеристика лежит в [low, high].
+
+        :param metric: Характеристика из METRICS
+        :param low: Нижняя граница (None - без ограничения)
+        :param high: Верхняя граница (None - без ограничения)
+        :return: Количество фигур
+        """
+        _, first, last = self._bounds(metric, low, high)
+        return last - first
+
+    def select(self, metric: str, low: Optional[float] = None,
+               high: Optional[float] = None) -> List[Union[Shape, ThreeDShape]]:
+        """
+        Выбирает фигуры, у которых характеристика лежит в [low, high].
+
+        :param metric: Характеристика из METRICS
+        :param low: Нижняя граница (None - без ограничения)
+        :param high: Верхняя граница (None - без ограничения)
+        :return: Фигуры по возрастанию характеристики
+        """
+        index, first, last = self._bounds(metric, low, high)
+        return [self.__shapes[number] for _, number in index[first:last]]
+
+
+class _CompensatedSum:
+    """
+    Сумма с компенсацией ошибки округления (алгоритм Ноймайера).
+
+    Ошибка не накапливается с количеством слагаемых, поэтому сумма
+    остается точной после многократных добавлений и вычитаний.
+    """
+
+    __slots__ = ('__total', '__compensation')
+
+    def __init__(self):
+        """
+        Конструктор класса _CompensatedSum (сумма равна нулю).
+        """
+        self.__total = 0.0
+        self.__compensation = 0.0
+
+    def add(self, value: float):
+        """
+        Добавляет слагаемое, накапливая потерянные при округлении разряды.
+
+        :param value: Слагаемое (отрицательное - для вычитания)
+        """
+        total = self.__total + value
+        if abs(self.__total) >= abs(value):
+            self.__compensation += (self.__total - total) + value
+        else:
+            self.__compensation += (value - total) + self.__total
+        self.__total = total
+
+    def get_value(self) -> float:
+        """
+        Возвращает сумму с учетом накопленной поправки.
+
+        :return: Сумма
+        """
+        return self.__total + self.__compensation
+
+
+class ShapeCollection(_ObservedCollection):
+    """
+    Коллекция фигур с постоянно поддерживаемыми итогами.
+
+    Суммарная площадь 2D фигур, суммарные объем и площадь поверхности
+    3D фигур и количество фигур каждого типа обновляются при добавлении
+    и удалении фигур, а при вызове сеттера фигуры (включая set_unit)
+    к итогам применяется разность старых и новых характеристик этой
+    фигуры. Поэтому получение итогов выполняется за O(1).
+
+    Характеристики переводятся в единицу измерения коллекции. Суммы
+    вычисляются с компенсацией ошибки округления.
+    """
+
+    def __init__(self, shapes: Iterable[Union[Shape, ThreeDShape]] = (),
+                 unit: str = 'cm'):
+        """
+        Конструктор класса ShapeCollection.
+
+        :param shapes: Начальные фигуры коллекции
+        :param unit: Единица измерения итогов
+        :raises ValueError: Если единица неизвестна
+        """
+        if not isinstance(unit, str) or unit_code(unit) < 0:
+            raise ValueError(f"Неизвестная целевая единица измерения: {unit}")
+        self.__unit = unit
+        self.__area = _CompensatedSum()
+        self.__volume = _CompensatedSum()
+        self.__surface_area = _CompensatedSum()
+        self.__counts = Counter()
+        # id фигуры: (площадь, объем, площадь поверхности) в единице коллекции
+        self.__contributions: Dict[int, tuple] = {}
+        super().__init__(shapes)
+
+    def _contribution(self, shape) -> tuple:
+        """
+        Вычисляет вклад фигуры в итоги в единице измерения коллекции.
+
+        :param shape: Геометрическая фигура
+        :return: Кортеж (площадь, объем, площадь поверхности)
+        :raises ValueError: Если единица измерения фигуры неизвестна
+        """
+        factor = convert_units(1.0, shape.get_unit(), self.__unit)
+        if isinstance(shape, Shape):
+            return shape.area() * factor ** 2, 0.0, 0.0
+        return 0.0, shape.volume() * factor ** 3, shape.surface_area() * factor ** 2
+
+    def _apply(self, contribution: tuple, sign: float):
+        """
+        Добавляет вклад фигуры к итогам или вычитает его.
+
+        :param contribution: Кортеж (площадь, объем, площадь поверхности)
+        :param sign: 1.0 для добавления, -1.0 для вычитания
+        """
+        area, volume, surface_area = contribution
+        self.__area.add(sign * area)
+        self.__volume.add(sign * volume)
+        self.__surface_area.add(sign * surface_area)
+
+    def add(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Добавляет фигуру в коллекцию. Повторное добавление игнорируется.
+
+        :param shape: Геометрическая фигура
+        :raises TypeError: Если объект не является фигурой
+        :raises ValueError: Если единица измерения фигуры неизвестна
+        """
+        if isinstance(shape, (Shape, ThreeDShape)) and shape not in self:
+            convert_units(1.0, shape.get_unit(), self.__unit)
+        super().add(shape)
+
+    def _on_add(self, shape):
+        """
+        Добавляет вклад фигуры к итогам и учитывает ее тип.
+
+        :param shape: Добавленная фигура
+        """
+        contribution = self._contribution(shape)
+        self.__contributions[id(shape)] = contribution
+        self.__counts[shape.__class__.__name__] += 1
+        self._apply(contribution, 1.0)
+
+    def _on_remove(self, shape):
+        """
+        Вычитает вклад фигуры из итогов и из количества фигур ее типа.
+
+        :param shape: Удаленная фигура
+        """
+        self._apply(self.__contributions.pop(id(shape)), -1.0)
+        name = shape.__class__.__name__
+        self.__counts[name] -= 1
+        if not self.__counts[name]:
+            del self.__counts[name]
+
+    def _on_change(self, shape):
+        """
+        Применяет к итогам разность старых и новых характеристик фигуры.
+
+        Если новая единица измерения фигуры неизвестна, фигура остается
+        в коллекции с нулевым вкладом в суммы, а ошибка передается
+        вызвавшему сеттер коду.
+
+        :param shape: Измененная фигура
+        :raises ValueError: Если единица измерения фигуры неизвестна
+        """
+        key = id(shape)
+        self._apply(self.__contributions[key], -1.0)
+        self.__contributions[key] = (0.0, 0.0, 0.0)
+        contribution = self._contribution(shape)
+        self.__contributions[key] = contribution
+        self._apply(contribution, 1.0)
+
+    def get_unit(self) -> str:
+        """
+        Возвращает единицу измерения итогов.
+
+        :return: Единица измерения
+        """
+        return self.__unit
+
+    def get_total_area(self) -> float:
+        """
+        Возвращает суммарную площадь 2D фигур коллекции.
+
+        :return: Площадь в квадратных единицах коллекции
+        """
+        return self.__area.get_value()
+
+    def get_total_volume(self) -> float:
+        """
+        Возвращает суммарный объем 3D фигур коллекции.
+
+        :return: Объем в кубических единицах коллекции
+        """
+        return self.__volume.get_value()
+
+    def get_total_surface_area(self) -> float:
+        """
+        Возвращает суммарную площадь поверхности 3D фигур коллекции.
+
+        :return: Площадь в квадратных единицах коллекции
+        """
+        return self.__surface_area.get_value()
+
+    def get_count(self, kind_name: Optional[str] = None) -> int:
+        """
+        Возвращает количество фигур заданного типа или всех фигур.
+
+        :param kind_name: Название класса фигуры (None - все фигуры)
+        :return: Количество фигур
+        """
+        if kind_name is None:
+            return len(self)
+        return self.__counts.get(kind_name, 0)
+
+    def get_counts(self) -> Dict[str, int]:
+        """
+        Возвращает количество фигур каждого типа.
+
+        :return: Словарь {название класса: количество}
+        """
+        return dict(sorted(self.__counts.items()))
+
+if __name__ == '__main__':
+    ...
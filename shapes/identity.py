@@ -0,0 +1,161 @@
+"""
+Геометрическая идентичность фигур: удаление дубликатов и общие экземпляры.
+"""
+
+from sys import intern
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
+from shapes.shapes2d import Shape, Rectangle, Circle
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+
+
+def _distinct_indices(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                      tolerance: float) -> np.ndarray:
+    """
+    Находит индексы первых вхождений геометрически различных фигур.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param tolerance: Точность сравнения размеров в метрах
+    :return: Индексы в порядке исходных фигур
+    """
+    if tolerance <= 0:
+        raise ValueError("Точность должна быть положительным числом.")
+
+    if not isinstance(shapes, ShapeBatch):
+        first: Dict[tuple, int] = {}
+        for i, shape in enumerate(shapes):
+            first.setdefault(shape.geometry_key(tolerance), i)
+        return np.fromiter(first.values(), dtype=np.intp, count=len(first))
+
+    if not len(shapes):
+        return np.empty(0, dtype=np.intp)
+
+    # Ключ фигуры набора: тип и размеры в метрах, округленные до tolerance;
+    # стороны прямоугольника упорядочиваются, как в Rectangle.geometry_key
+    dim1, dim2 = shapes.to_unit('m').get_dimensions()
+    kinds = shapes.get_kinds()
+    rectangles = kinds == ShapeBatch.RECTANGLE
+    keys = np.column_stack([
+        kinds.astype(np.float64),
+        np.round(np.where(rectangles, np.minimum(dim1, dim2), dim1) / tolerance),
+        np.round(np.where(rectangles, np.maximum(dim1, dim2), 0.0) / tolerance),
+    ])
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return np.sort(first)
+
+
+def distinct(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+             tolerance: float = 1e-9, return_indices: bool = False):
+    """
+    Удаляет геометрически одинаковые фигуры, оставляя первое вхождение.
+
+    Фигуры считаются одинаковыми, если совпадают их ключи geometry_key:
+    тип и размеры в метрах с точностью tolerance. Для списка фигур ключи
+    собираются в словарь за один проход (линейное время), для ShapeBatch
+    ключи строятся векторно.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param tolerance: Точность сравнения размеров в метрах
+    :param return_indices: Вернуть индексы вместо фигур
+    :return: Фигуры (или их индексы) в исходном порядке
+    :raises ValueError: Если у фигур набора ShapeBatch неизвестные
+        единицы измерения
+    """
+    indices = _distinct_indices(shapes, tolerance)
+    if return_indices:
+        return indices
+    if isinstance(shapes, ShapeBatch):
+        return shapes.take(indices)
+    return [shapes[i] for i in indices.tolist()]
+
+
+class ShapeInterner:
+    """
+    Фабрика фигур, возвращающая общий экземпляр для одинаковых фигур.
+
+    Фигуры с одинаковым типом, размерами и единицей измерения создаются
+    один раз, что экономит память при большом количестве повторяющихся
+    фигур. Полученные фигуры являются общими: их нельзя изменять
+    сеттерами, иначе изменение затронет все места, где они используются.
+    """
+
+    _CLASSES = (Rectangle, Circle, Cube, Sphere)
+
+    def __init__(self):
+        """
+        Конструктор класса ShapeInterner.
+        """
+        # (класс, размеры, единица): фигура
+        self.__instances: Dict[tuple, Union[Shape, ThreeDShape]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__instances)
+
+    def create(self, cls: type, *dimensions: float,
+               unit: str = 'cm') -> Union[Shape, ThreeDShape]:
+        """
+        Возвращает общий экземпляр фигуры, создавая его при первом запросе.
+
+        :param cls: Класс фигуры (Rectangle, Circle, Cube или Sphere)
+        :param dimensions: Размеры в порядке аргументов конструктора класса
+        :param unit: Единица измерения
+        :return: Общий экземпляр фигуры
+        :raises TypeError: Если класс не поддерживается
+        """
+        if cls not in self._CLASSES:
+            raise TypeError(f"Неподдерживаемый тип фигуры: {getattr(cls, '__name__', cls)}")
+        key = (cls, dimensions, unit)
+        shape = self.__instances.get(key)
+        if shape is None:
+            shape = self.__instances[key] = cls(*dimensions, unit=intern(unit))
+        return shape
+
+    def from_batch(self, batch: ShapeBatch,
+                   trusted: bool = False) -> List[Union[Shape, ThreeDShape]]:
+        """
+        Преобразует набор в список фигур, в котором одинаковые строки
+        набора представлены одним общим экземпляром.
+
+        Объекты создаются только для различных строк набора, которые
+        еще не встречались этой фабрике.
+
+        :param batch: Набор фигур
+        :param trusted: Не проверять набор (если он уже проверен)
+        :return: Список фигур в порядке строк набора
+        :raises ValueError: Если в наборе есть некорректные фигуры
+        """
+        if not trusted:
+            batch.validate()
+        if not len(batch):
+            return []
+
+        kinds = batch.get_kinds()
+        dim1, dim2 = batch.get_dimensions()
+        dim2 = np.where(kinds == ShapeBatch.RECTANGLE, dim2, 0.0)
+        rows = np.column_stack([kinds, dim1, dim2, batch.get_unit_codes()])
+        unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+
+        units = batch.get_units()
+        shapes = []
+        for kind, first, second, code in unique.tolist():
+            cls = self._CLASSES[int(kind)]
+            dimensions = (first, second) if cls is Rectangle else (first,)
+            key = (cls, dimensions, units[int(code)])
+            shape = self.__instances.get(key)
+            if shape is None:
+                shape = self.__instances[key] = cls._unchecked(*dimensions,
+                                                               intern(units[int(code)]))
+            shapes.append(shape)
+        return [shapes[i] for i in inverse.reshape(-1).tolist()]
+
+    def clear(self):
+        """
+        Удаляет все сохраненные экземпляры.
+        """
+        self.__instances.clear()
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,282 @@
+"""
+Потоковое чтение описаний фигур из файлов CSV и JSONL.
+
+Каждая строка (запись) описывает одну фигуру полями:
+
+- type: rectangle, circle, cube или sphere (без учета регистра);
+- width, height: размеры прямоугольника;
+- radius: радиус круга или сферы;
+- side: сторона куба;
+- unit: единица измерения (по умолчанию cm).
+
+В CSV имена полей задаются строкой заголовка, лишние столбцы
+игнорируются. Номера записей в сообщениях об ошибках отсчитываются
+от начала читаемого диапазона. Файлы читаются построчно, поэтому расход памяти
+не зависит от размера файла.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
+from shapes.shapes2d import Shape, Rectangle, Circle
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+from shapes.store import STORE_SUFFIX, iter_store_batches
+
+FORMATS = ('csv', 'jsonl', 'store')
+
+# Тип фигуры: (код в ShapeBatch, поле первого размера, поле второго размера)
+_LAYOUTS = {
+    'rectangle': (ShapeBatch.RECTANGLE, 'width', 'height'),
+    'circle': (ShapeBatch.CIRCLE, 'radius', None),
+    'cube': (ShapeBatch.CUBE, 'side', None),
+    'sphere': (ShapeBatch.SPHERE, 'radius', None),
+}
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """
+    Определяет формат файла по расширению.
+
+    :param path: Путь к файлу
+    :return: 'csv', 'jsonl' или 'store' (двоичное хранилище shapes.store)
+    :raises ValueError: Если расширение не распознано
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == '.csv':
+        return 'csv'
+    if suffix in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if suffix == STORE_SUFFIX:
+        return 'store'
+    raise ValueError(f"Не удалось определить формат файла: {path}")
+
+
+def iter_records(path: Union[str, Path], fmt: Optional[str] = None,
+                 start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Построчно читает записи фигур из файла.
+
+    Можно прочитать только часть файла: строки, начинающиеся в байтовом
+    диапазоне [start, stop). Границы диапазона должны совпадать с началом
+    строк (см. split_file). Заголовок CSV всегда берется из начала файла.
+
+    :param path: Путь к файлу CSV или JSONL
+    :param fmt: Формат файла ('csv' или 'jsonl'); по умолчанию по расширению
+    :param start: Смещение первой читаемой строки в байтах
+    :param stop: Смещение, на котором чтение заканчивается (None - до конца)
+    :return: Генератор словарей с полями записи
+    :raises ValueError: Если строка JSONL не является объектом JSON
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"Неизвестный формат текстового файла: {fmt}")
+
+    with open(path, 'rb') as file:
+        if fmt == 'csv':
+            header = file.readline().decode('utf-8-sig')
+            fieldnames = next(csv.reader([header]), [])
+            start = max(start, file.tell())
+
+        file.seek(start)
+        lines = _iter_lines(file, start, stop)
+        if fmt == 'csv':
+            yield from csv.DictReader(lines, fieldnames=fieldnames)
+        else:
+            number = 0
+            for line in lines:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    record = json.loads(line)
+                except ValueError as error:
+                    # Сюда относятся и числа со слишком большим количеством цифр
+                    raise ValueError(f"Запись {number}: некорректный JSON: {error}") from None
+                if not isinstance(record, dict):
+                    raise ValueError(f"Запись {number}: запись должна быть объектом JSON")
+                yield record
+
+
+def _iter_lines(file, start: int, stop: Optional[int]) -> Iterator[str]:
+    """
+    Читает строки двоичного файла, начинающиеся до смещения stop.
+
+    :param file: Файл, открытый в двоичном режиме и установленный на start
+    :param start: Текущее смещение в файле
+    :param stop: Смещение, на котором чтение заканчивается (None - до конца)
+    :return: Генератор декодированных строк
+    """
+    position = start
+    for line in file:
+        if stop is not None and position >= stop:
+            break
+        position += len(line)
+        yield line.decode('utf-8')
+
+
+def split_file(path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Делит файл на байтовые диапазоны, выровненные по началу строк.
+
+    Записи CSV, содержащие переводы строк внутри кавычек, не поддерживаются.
+
+    :param path: Путь к файлу
+    :param parts: Желаемое количество диапазонов
+    :return: Список диапазонов (start, stop), покрывающих весь файл
+    """
+    if parts <= 0:
+        raise ValueError("Количество частей должно быть положительным числом.")
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as file:
+        for i in range(1, parts):
+            file.seek(max(size * i // parts - 1, bounds[-1]))
+            file.readline()
+            bounds.append(max(file.tell(), bounds[-1]))
+    bounds.append(size)
+
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def _record_error(line: Optional[int], message: str) -> ValueError:
+    """
+    Создает исключение для некорректной записи.
+
+    :param line: Номер записи или None, если запись разбирается отдельно
+        от файла
+    :param message: Текст ошибки со строчной буквы
+    :return: Исключение ValueError с номером записи в начале текста
+        (или с текстом ошибки с заглавной буквы, если номера нет)
+    """
+    if line is None:
+        return ValueError(message[:1].upper() + message[1:])
+    return ValueError(f"Запись {line}: {message}")
+
+
+def parse_record(record: Dict, line: Optional[int] = None) -> Tuple[int, float, float, str]:
+    """
+    Разбирает запись фигуры.
+
+    :param record: Словарь с полями записи
+    :param line: Номер записи для текста ошибок (по умолчанию текст
+        ошибки не содержит номера)
+    :return: Кортеж (код типа, первый размер, второй размер, единица)
+    :raises ValueError: Если запись некорректна
+    """
+    if not isinstance(record, dict):
+        raise _record_error(line, "запись должна быть объектом JSON")
+    kind_name = str(record.get('type', '')).strip().lower()
+    layout = _LAYOUTS.get(kind_name)
+    if layout is None:
+        raise _record_error(line, f"неизвестный тип фигуры: {record.get('type')}")
+
+    kind, first_field, second_field = layout
+    try:
+        first = float(record[first_field])
+        second = float(record[second_field]) if second_field else 0.0
+    except (KeyError, TypeError, ValueError, OverflowError):
+        raise _record_error(line, f"некорректные размеры фигуры {kind_name}") from None
+
+    unit = record.get('unit') or 'cm'
+    return kind, first, second, str(unit)
+
+
+def iter_batches(path: Union[str, Path], fmt: Optional[str] = None,
+                 chunk_size: int = 65536, start: int = 0,
+                 stop: Optional[int] = None) -> Iterator[ShapeBatch]:
+    """
+    Читает файл фигур порциями в виде наборов ShapeBatch.
+
+    Объекты фигур не создаются; в памяти одновременно находится
+    не более chunk_size записей. Двоичное хранилище (формат 'store')
+    читается без разбора через отображение в память; для него start
+    и stop задают номера записей, а не смещения в байтах.
+
+    :param path: Путь к файлу CSV, JSONL или хранилищу
+    :param fmt: Формат файла ('csv', 'jsonl' или 'store'); по умолчанию по расширению
+    :param chunk_size: Максимальное количество фигур в одном наборе
+    :param start: Смещение первой читаемой строки в байтах
+    :param stop: Смещение, на котором чтение заканчивается (None - до конца)
+    :return: Генератор наборов фигур
+    :raises ValueError: Если в файле есть некорректные записи
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом.")
+    if (fmt or detect_format(path)) == 'store':
+        yield from iter_store_batches(path, chunk_size, start, stop)
+        return
+
+    kinds, dim1, dim2, codes = [], [], [], []
+    units: Dict[str, int] = {}
+    first_line = 1
+
+    for line, record in enumerate(iter_records(path, fmt, start, stop), start=1):
+        kind, first, second, unit = parse_record(record, line)
+        kinds.append(kind)
+        dim1.append(first)
+        dim2.append(second)
+        codes.append(units.setdefault(unit, len(units)))
+
+        if len(kinds) == chunk_size:
+            yield _make_batch(kinds, dim1, dim2, codes, units, first_line)
+            kinds, dim1, dim2, codes = [], [], [], []
+            units = {}
+            first_line = line + 1
+
+    if kinds:
+        yield _make_batch(kinds, dim1, dim2, codes, units, first_line)
+
+
+def _make_batch(kinds, dim1, dim2, codes, units, first_line: int) -> ShapeBatch:
+    """
+    Создает набор фигур из порции записей и проверяет размеры.
+
+    :param kinds: Коды типов фигур
+    :param dim1: Первые размеры фигур
+    :param dim2: Вторые размеры фигур
+    :param codes: Коды единиц измерения (индексы в units)
+    :param units: Единицы измерения порции в порядке кодов
+    :param first_line: Номер первой записи порции (для текста ошибок)
+    :return: Набор фигур
+    :raises ValueError: Если размеры не являются положительными числами
+    """
+    if len(units) > 256:
+        raise ValueError("Порция содержит более 256 различных единиц измерения.")
+
+    batch = ShapeBatch(kinds, dim1, dim2, codes, list(units))
+    invalid = batch.invalid_rows()
+    if invalid.any():
+        lines = (np.flatnonzero(invalid) + first_line).tolist()
+        raise ValueError(f"Записи {lines}: размеры должны быть положительными числами.")
+    return batch
+
+
+def iter_shapes(path: Union[str, Path],
+                fmt: Optional[str] = None) -> Iterator[Union[Shape, ThreeDShape]]:
+    """
+    Построчно читает фигуры из файла и создает их объекты.
+
+    :param path: Путь к файлу CSV или JSONL
+    :param fmt: Формат файла ('csv' или 'jsonl'); по умолчанию по расширению
+    :return: Генератор фигур Rectangle, Circle, Cube и Sphere
+    """
+    for line, record in enumerate(iter_records(path, fmt), start=1):
+        kind, first, second, unit = parse_record(record, line)
+        if kind == ShapeBatch.RECTANGLE:
+            yield Rectangle(first, second, unit)
+        elif kind == ShapeBatch.CIRCLE:
+            yield Circle(first, unit)
+        elif kind == ShapeBatch.CUBE:
+            yield Cube(first, unit)
+        else:
+            yield Sphere(first, unit)
+
+if __name__ == '__main__':
+    ...
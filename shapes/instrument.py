@@ -0,0 +1,290 @@
+"""
+Необязательный учет вызовов методов фигур и вспомогательных функций.
+
+По умолчанию учет выключен и не влияет на скорость: функция enable()
+подменяет отслеживаемые методы классов и функции модулей обертками,
+которые считают вызовы и строят гистограмму времени выполнения,
+а disable() возвращает исходные объекты на место.
+
+Отслеживаются конструкторы, метрики и перевод единиц фигур из base,
+shapes2d и shapes3d, а также функции перевода единиц и сравнения из utils.
+Учет ведется только в текущем процессе.
+"""
+
+import sys
+import time
+from functools import wraps
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from shapes import base, shapes2d, shapes3d, utils
+
+# Отслеживаемые методы классов фигур
+METHODS = ('__init__', '_unchecked', 'area', 'perimeter', 'volume', 'surface_area', 'to_unit')
+
+# Классы фигур, методы которых отслеживаются
+TARGETS = (
+    (base, ('ShapeMixin',)),
+    (shapes2d, ('Shape', 'Rectangle', 'Circle', 'Polygon')),
+    (shapes3d, ('ThreeDShape', 'Cube', 'Sphere', 'Mesh')),
+)
+
+# Отслеживаемые функции модулей
+FUNCTIONS = (
+    (utils, ('convert_units', 'convert_units_array', 'compare_shapes_by_area')),
+)
+
+# Корзина гистограммы i содержит длительности от 2**(i-1) до 2**i - 1 нс
+_BUCKETS = 64
+
+
+class CallStats(NamedTuple):
+    """
+    Счетчики вызовов одного метода или функции.
+
+    Гистограмма - кортеж пар (верхняя граница в секундах, количество)
+    для непустых корзин, границы растут степенями двойки.
+    """
+
+    calls: int
+    total: float
+    minimum: float
+    maximum: float
+    histogram: Tuple[Tuple[float, int], ...]
+
+    def get_mean(self) -> float:
+        """
+        Возвращает среднее время вызова в секундах.
+
+        :return: Среднее время (0.0, если вызовов не было)
+        """
+        return self.total / self.calls if self.calls else 0.0
+
+    def get_quantile(self, fraction: float) -> float:
+        """
+        Оценивает квантиль времени вызова по гистограмме.
+
+        Возвращается верхняя граница корзины, поэтому оценка
+        превышает точное значение не более чем вдвое.
+
+        :param fraction: Доля от 0 до 1 (0.5 - медиана, 0.99 - p99)
+        :return: Оценка квантиля в секундах (0.0, если вызовов не было)
+        """
+        rank = fraction * self.calls
+        seen = 0
+        for bound, count in self.histogram:
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+
+class _Counter:
+    """
+    Накопитель вызовов одного метода или функции.
+    """
+
+    __slots__ = ('calls', 'total', 'minimum', 'maximum', 'buckets')
+
+    def __init__(self):
+        """
+        Конструктор класса _Counter (все счетчики нулевые).
+        """
+        self.calls = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = 0
+        self.buckets = [0] * _BUCKETS
+
+    def record(self, elapsed: int):
+        """
+        Учитывает один вызов.
+
+        :param elapsed: Длительность вызова в наносекундах
+        """
+        self.calls += 1
+        self.total += elapsed
+        if self.minimum is None or elapsed < self.minimum:
+            self.minimum = elapsed
+        if elapsed > self.maximum:
+            self.maximum = elapsed
+        self.buckets[min(elapsed.bit_length(), _BUCKETS - 1)] += 1
+
+    def stats(self) -> CallStats:
+        """
+        Переводит накопленные счетчики в секунды.
+
+        :return: Счетчики вызовов
+        """
+        histogram = tuple(((1 << index) * 1e-9, count)
+                          for index, count in enumerate(self.buckets) if count)
+        return CallStats(self.calls, self.total * 1e-9, (self.minimum or 0) * 1e-9,
+                         self.maximum * 1e-9, histogram)
+
+
+_counters: Dict[str, _Counter] = {}
+
+# Подмененные атрибуты: (владелец, имя, исходное значение)
+_patched: List[tuple] = []
+
+
+def _timed(function, counter: _Counter):
+    """
+    Создает обертку, измеряющую время каждого вызова функции.
+
+    :param function: Исходная функция
+    :param counter: Накопитель, в который записываются длительности
+    :return: Обертка с именем и документацией исходной функции
+    """
+    clock = time.perf_counter_ns
+    record = counter.record
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(clock() - start)
+
+    return wrapper
+
+
+def _patch(owner, name: str, value):
+    """
+    Подменяет атрибут и запоминает исходное значение для disable().
+
+    :param owner: Класс или модуль
+    :param name: Имя атрибута
+    :param value: Новое значение
+    """
+    _patched.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, value)
+
+
+def _counter(name: str) -> _Counter:
+    """
+    Возвращает накопитель вызова, создавая его при первом обращении.
+
+    Накопители сохраняются между enable() и disable(), поэтому
+    повторное включение продолжает прежние счетчики.
+
+    :param name: Имя вида 'Класс.метод' или 'модуль.функция'
+    :return: Накопитель вызовов
+    """
+    counter = _counters.get(name)
+    if counter is None:
+        counter = _counters[name] = _Counter()
+    return counter
+
+
+def _instrument_class(cls):
+    """
+    Подменяет обертками отслеживаемые методы METHODS, определенные
+    в самом классе (унаследованные методы учитываются в базовом классе).
+
+    :param cls: Класс фигуры
+    """
+    for name in METHODS:
+        attribute = cls.__dict__.get(name)
+        if attribute is None:
+            continue
+        counter = _counter(f"{cls.__name__}.{name}")
+        if isinstance(attribute, classmethod):
+            _patch(cls, name, classmethod(_timed(attribute.__func__, counter)))
+        else:
+            _patch(cls, name, _timed(attribute, counter))
+
+
+def _instrument_function(module, name: str):
+    """
+    Подменяет оберткой функцию модуля и все ее импортированные копии.
+
+    :param module: Модуль, в котором определена функция
+    :param name: Имя функции
+    """
+    original = getattr(module, name)
+    wrapper = _timed(original, _counter(f"{module.__name__.rpartition('.')[2]}.{name}"))
+
+    # Функция могла быть импортирована по имени в другие модули пакета
+    # и в исполняемый файл, поэтому подменяются все ссылки на нее
+    for loaded_name, loaded in list(sys.modules.items()):
+        if loaded is None or not (loaded_name == '__main__' or loaded_name == 'shapes'
+                                  or loaded_name.startswith('shapes.')):
+            continue
+        namespace = getattr(loaded, '__dict__', {})
+        for attribute, value in list(namespace.items()):
+            if value is original:
+                _patch(loaded, attribute, wrapper)
+
+
+def is_enabled() -> bool:
+    """
+    Проверяет, включен ли учет вызовов.
+
+    :return: True, если учет включен
+    """
+    return bool(_patched)
+
+
+def enable():
+    """
+    Включает учет вызовов. Повторный вызов ничего не делает.
+    """
+    if _patched:
+        return
+    for module, names in TARGETS:
+        for name in names:
+            _instrument_class(getattr(module, name))
+    for module, names in FUNCTIONS:
+        for name in names:
+            _instrument_function(module, name)
+
+
+def disable():
+    """
+    Выключает учет вызовов и возвращает исходные методы и функции.
+
+    Накопленные счетчики сохраняются до вызова reset().
+    """
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+
+
+def reset():
+    """
+    Обнуляет накопленные счетчики.
+    """
+    for counter in _counters.values():
+        counter.__init__()
+
+
+def snapshot() -> Dict[str, CallStats]:
+    """
+    Возвращает счетчики всех методов и функций, которые вызывались.
+
+    :return: Словарь {'Класс.метод' или 'модуль.функция': CallStats}
+    """
+    return {name: counter.stats()
+            for name, counter in sorted(_counters.items()) if counter.calls}
+
+
+HEADERS = ['Вызов', 'Количество', 'Всего, мс', 'Среднее, мкс',
+           'p50, мкс', 'p99, мкс', 'Макс., мкс']
+
+
+def rows(stats: Optional[Dict[str, CallStats]] = None) -> List[List[str]]:
+    """
+    Формирует строки таблицы счетчиков для print_table.
+
+    :param stats: Результат snapshot() (по умолчанию текущие счетчики)
+    :return: Список строк таблицы (столбцы соответствуют HEADERS)
+    """
+    stats = snapshot() if stats is None else stats
+    return [[name, str(item.calls), f"{item.total * 1e3:.3f}",
+             f"{item.get_mean() * 1e6:.2f}", f"{item.get_quantile(0.5) * 1e6:.2f}",
+             f"{item.get_quantile(0.99) * 1e6:.2f}", f"{item.maximum * 1e6:.2f}"]
+            for name, item in stats.items()]
+
+if __name__ == '__main__':
+    ...
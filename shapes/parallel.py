@@ -0,0 +1,192 @@
+"""
+Параллельная обработка больших наборов и файлов фигур в пуле процессов.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+from shapes.aggregate import ShapeAggregator
+from shapes.batch import ShapeBatch
+from shapes.ingest import detect_format, iter_batches, split_file
+from shapes.store import store_size
+
+METRICS = ('area', 'perimeter', 'volume', 'surface_area')
+
+
+def _default_workers(workers: Optional[int]) -> int:
+    """
+    Определяет количество процессов пула.
+
+    :param workers: Заданное количество процессов или None
+    :return: Количество процессов (по умолчанию - число ядер процессора)
+    :raises ValueError: Если количество не положительное
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Количество процессов должно быть положительным числом.")
+    return workers
+
+
+def _evaluate_slice(input_name: str, output_name: str, size: int,
+                    start: int, stop: int):
+    """
+    Вычисляет характеристики фигур [start, stop) набора в общей памяти.
+
+    Входной блок содержит массивы dim1, dim2 (float64) и kinds (uint8),
+    выходной - матрицу характеристик размером len(METRICS) x size.
+
+    :param input_name: Имя блока общей памяти с исходными данными
+    :param output_name: Имя блока общей памяти для результатов
+    :param size: Количество фигур во всем наборе
+    :param start: Номер первой фигуры диапазона
+    :param stop: Номер фигуры за последней в диапазоне
+    """
+    with ExitStack() as stack:
+        source = SharedMemory(name=input_name)
+        stack.callback(source.close)
+        target = SharedMemory(name=output_name)
+        stack.callback(target.close)
+        _evaluate_buffers(source.buf, target.buf, size, start, stop)
+
+
+def _create_block(stack: ExitStack, size: int) -> SharedMemory:
+    """
+    Создает блок общей памяти, который освобождается при закрытии stack.
+
+    :param stack: Стек освобождения ресурсов
+    :param size: Размер блока в байтах
+    :return: Блок общей памяти
+    """
+    block = SharedMemory(create=True, size=size)
+    stack.callback(block.unlink)
+    stack.callback(block.close)
+    return block
+
+
+def _evaluate_buffers(source, target, size: int, start: int, stop: int):
+    """
+    Вычисляет характеристики фигур [start, stop) по буферам блоков памяти.
+
+    :param source: Буфер с массивами dim1, dim2 и kinds
+    :param target: Буфер матрицы результатов len(METRICS) x size
+    :param size: Количество фигур во всем наборе
+    :param start: Номер первой фигуры диапазона
+    :param stop: Номер фигуры за последней в диапазоне
+    """
+    dim1 = np.ndarray(size, np.float64, source, 0)[start:stop]
+    dim2 = np.ndarray(size, np.float64, source, 8 * size)[start:stop]
+    kinds = np.ndarray(size, np.uint8, source, 16 * size)[start:stop]
+    results = np.ndarray((len(METRICS), size), np.float64, target)
+
+    batch = ShapeBatch(kinds, dim1, dim2, np.zeros(stop - start, np.uint8), [''])
+    for row, metric in enumerate(METRICS):
+        results[row, start:stop] = getattr(batch, metric)()
+
+
+def compute_metrics_parallel(batch: ShapeBatch, workers: Optional[int] = None,
+                             chunk_size: int = 1 << 20) -> Dict[str, np.ndarray]:
+    """
+    Вычисляет площадь, периметр, объем и площадь поверхности всех фигур
+    набора в пуле процессов.
+
+    Размеры фигур передаются процессам через общую память, и результаты
+    записываются ими туда же, без сериализации массивов.
+
+    :param batch: Набор фигур
+    :param workers: Количество процессов (по умолчанию число ядер)
+    :param chunk_size: Количество фигур в одной задаче
+    :return: Словарь {характеристика: массив значений}
+    """
+    workers = _default_workers(workers)
+    size = len(batch)
+    if workers == 1 or size <= chunk_size:
+        return {metric: getattr(batch, metric)() for metric in METRICS}
+
+    # Блоки освобождаются в обратном порядке, даже если создание
+    # второго блока завершилось ошибкой
+    with ExitStack() as stack:
+        source = _create_block(stack, 17 * size)
+        target = _create_block(stack, 8 * len(METRICS) * size)
+        dim1, dim2 = batch.get_dimensions()
+        np.ndarray(size, np.float64, source.buf, 0)[:] = dim1
+        np.ndarray(size, np.float64, source.buf, 8 * size)[:] = dim2
+        np.ndarray(size, np.uint8, source.buf, 16 * size)[:] = batch.get_kinds()
+
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_evaluate_slice, source.name, target.name,
+                                       size, start, min(start + chunk_size, size))
+                       for start in range(0, size, chunk_size)]
+            for future in futures:
+                future.result()
+
+        results = np.ndarray((len(METRICS), size), np.float64, target.buf).copy()
+        return dict(zip(METRICS, results))
+
+
+def _aggregate_range(path: str, fmt: Optional[str], chunk_size: int,
+                     start: int, stop: int, factory: Callable = ShapeAggregator):
+    """
+    Собирает статистику одной части файла в одном процессе.
+
+    :param path: Путь к файлу
+    :param fmt: Формат файла или None для определения по расширению
+    :param chunk_size: Максимальное количество фигур в одном наборе
+    :param start: Начало части (смещение в байтах или номер записи хранилища)
+    :param stop: Конец части (смещение в байтах или номер записи хранилища)
+    :param factory: Класс накопителя
+    :return: Накопитель со статистикой диапазона
+    """
+    aggregator = factory()
+    for batch in iter_batches(path, fmt, chunk_size, start, stop):
+        aggregator.add_batch(batch)
+    return aggregator
+
+
+def aggregate_file_parallel(path: Union[str, Path], fmt: Optional[str] = None,
+                            workers: Optional[int] = None,
+                            chunk_size: int = 65536,
+                            factory: Callable = ShapeAggregator):
+    """
+    Собирает статистику площади и объема для файла CSV, JSONL
+    или двоичного хранилища в пуле процессов.
+
+    Файл делится на диапазоны строк (записей для двоичного хранилища
+    shapes.store); каждый процесс читает свой диапазон
+    и возвращает только сводную статистику. Частичные результаты
+    объединяются в порядке диапазонов, поэтому при одном и том же
+    количестве процессов результат не зависит от порядка их завершения.
+
+    :param path: Путь к файлу с описаниями фигур
+    :param fmt: Формат файла ('csv', 'jsonl' или 'store'); по умолчанию по расширению
+    :param workers: Количество процессов (по умолчанию число ядер)
+    :param chunk_size: Количество фигур в одной порции внутри процесса
+    :param factory: Класс накопителя (ShapeAggregator или QuantileAggregator);
+        вызывается без аргументов в каждом процессе
+    :return: Накопитель статистики
+    """
+    workers = _default_workers(workers)
+    if (fmt or detect_format(path)) == 'store':
+        size = store_size(path)
+        bounds = [size * i // workers for i in range(workers + 1)]
+        ranges = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+    else:
+        ranges = split_file(path, workers)
+
+    result = factory()
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_aggregate_range, str(path), fmt, chunk_size,
+                                   start, stop, factory)
+                   for start, stop in ranges]
+        for future in futures:
+            result.merge(future.result())
+    return result
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,250 @@
+"""
+Форматированный вывод таблиц и отчетов о фигурах.
+"""
+
+import sys
+from itertools import islice
+from operator import methodcaller
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO
+
+from shapes.shapes2d import Polygon
+from shapes.shapes3d import Mesh
+
+# Количество строк таблицы, накапливаемых перед одной записью в поток
+_WRITE_CHUNK = 4096
+
+
+def _line_template(widths: Sequence[int]) -> str:
+    """
+    Создает шаблон строки таблицы для str.format с заданной шириной столбцов.
+
+    :param widths: Ширина каждого столбца
+    :return: Шаблон строки таблицы
+    """
+    return "|" + "".join(f" {{:<{width}}} |" for width in widths)
+
+
+def _separator(widths: Sequence[int]) -> str:
+    """
+    Создает разделительную линию таблицы.
+
+    :param widths: Ширина каждого столбца
+    :return: Строка вида +-----+----+
+    """
+    return "+" + "".join("-" * (width + 2) + "+" for width in widths)
+
+
+def _column_widths(headers: Sequence[str], rows: List[List[str]]) -> List[int]:
+    """
+    Вычисляет ширину столбцов по самой длинной ячейке с запасом в два символа.
+
+    :param headers: Заголовки столбцов
+    :param rows: Строки таблицы из строковых ячеек
+    :return: Ширина каждого столбца
+    """
+    widths = [len(header) for header in headers]
+    for i, column in enumerate(zip(*rows)):
+        widths[i] = max(widths[i], max(map(len, column)))
+    return [width + 2 for width in widths]
+
+
+def _write_rows(rows: Iterable[List[str]], template: str, separator: str,
+                stream: TextIO):
+    """
+    Записывает строки таблицы в поток порциями по _WRITE_CHUNK строк.
+
+    :param rows: Строки таблицы из строковых ячеек
+    :param template: Шаблон строки, созданный _line_template
+    :param separator: Разделительная линия, созданная _separator
+    :param stream: Поток вывода
+    """
+    buffer = []
+    for row in rows:
+        buffer.append(template.format(*row))
+        buffer.append(separator)
+        if len(buffer) >= 2 * _WRITE_CHUNK:
+            buffer.append('')
+            stream.write("\n".join(buffer))
+            buffer = []
+    if buffer:
+        buffer.append('')
+        stream.write("\n".join(buffer))
+
+
+def render_table(data: Iterable[Sequence], headers: Sequence[str],
+                 stream: Optional[TextIO] = None):
+    """
+    Выводит таблицу с рамками, выравнивая столбцы по самой длинной ячейке.
+
+    Каждая ячейка преобразуется в строку один раз, а вывод выполняется
+    крупными порциями вместо отдельного print на каждую строку.
+
+    :param data: Строки таблицы
+    :param headers: Заголовки столбцов
+    :param stream: Поток вывода (по умолчанию sys.stdout)
+    """
+    stream = stream or sys.stdout
+    rows = [[str(cell) for cell in row] for row in data]
+    widths = _column_widths(headers, rows)
+    separator = _separator(widths)
+    template = _line_template(widths)
+
+    stream.write(f"{separator}\n{template.format(*headers)}\n{separator}\n")
+    _write_rows(rows, template, separator, stream)
+
+
+def stream_table(data: Iterable[Sequence], headers: Sequence[str],
+                 widths: Optional[Sequence[int]] = None, sample: int = 1000,
+                 stream: Optional[TextIO] = None):
+    """
+    Выводит таблицу по мере поступления строк.
+
+    Ширина столбцов задается явно или вычисляется по первым sample строкам,
+    поэтому вывод начинается до получения всех данных, а в памяти хранится
+    не больше sample строк. Ячейки длиннее ширины столбца выводятся
+    полностью и сдвигают рамку этой строки.
+
+    :param data: Строки таблицы (например, генератор)
+    :param headers: Заголовки столбцов
+    :param widths: Ширина содержимого каждого столбца
+    :param sample: Количество строк для вычисления ширины столбцов
+    :param stream: Поток вывода (по умолчанию sys.stdout)
+    """
+    stream = stream or sys.stdout
+    rows = (list(map(str, row)) for row in data)
+
+    if widths is None:
+        head = list(islice(rows, sample))
+        widths = _column_widths(headers, head)
+    else:
+        if len(widths) != len(headers):
+            raise ValueError("Количество ширин должно совпадать с количеством столбцов.")
+        head = []
+        widths = [max(width, len(header)) + 2 for width, header in zip(widths, headers)]
+
+    separator = _separator(widths)
+    template = _line_template(widths)
+    stream.write(f"{separator}\n{template.format(*headers)}\n{separator}\n")
+    _write_rows(head, template, separator, stream)
+    _write_rows(rows, template, separator, stream)
+
+
+# Поля отчета о фигуре: (метод, подпись, формат значения, степень единицы)
+_REPORT_FIELDS = [
+    ('get_width', 'Ширина', '', ''),
+    ('get_height', 'Высота', '', ''),
+    ('get_radius', 'Радиус', '', ''),
+    ('get_side', 'Сторона', '', ''),
+    ('area', 'Площадь', '.2f', '²'),
+    ('perimeter', 'Периметр', '.2f', ''),
+    ('surface_area', 'Площадь поверхности', '.2f', '²'),
+    ('volume', 'Объем', '.2f', '³'),
+]
+
+# Класс фигуры: функция, формирующая отчет о фигуре этого класса
+_FORMATTERS: Dict[type, Callable[[object], str]] = {}
+
+
+def register_formatter(cls: type, formatter: Callable[[object], str]):
+    """
+    Регистрирует функцию формирования отчета для класса фигуры.
+
+    :param cls: Класс фигуры
+    :param formatter: Функция фигура -> текст отчета
+    """
+    _FORMATTERS[cls] = formatter
+
+
+def _format_polygon(shape: Polygon) -> str:
+    """
+    Формирует отчет о многоугольнике: количество вершин вместо размеров.
+
+    :param shape: Многоугольник
+    :return: Текст отчета
+    """
+    unit = shape.get_unit()
+    return (f"Фигура: Polygon\n"
+            f"  Вершины: {shape.get_vertex_count()}\n"
+            f"  Площадь: {shape.area():.2f}{unit}²\n"
+            f"  Периметр: {shape.perimeter():.2f}{unit}\n")
+
+
+def _format_mesh(shape: Mesh) -> str:
+    """
+    Формирует отчет о сетке: количество граней вместо размеров.
+
+    :param shape: Сетка
+    :return: Текст отчета
+    """
+    unit = shape.get_unit()
+    return (f"Фигура: Mesh\n"
+            f"  Грани: {shape.get_face_count()}\n"
+            f"  Площадь поверхности: {shape.surface_area():.2f}{unit}²\n"
+            f"  Объем: {shape.volume():.2f}{unit}³\n")
+
+
+register_formatter(Polygon, _format_polygon)
+register_formatter(Mesh, _format_mesh)
+
+
+def _compile_formatter(cls: type) -> Callable[[object], str]:
+    """
+    Создает функцию отчета для класса по набору его методов.
+
+    Методы класса проверяются один раз, и для класса заранее
+    составляется шаблон str.format со всеми строками отчета, поэтому
+    при выводе каждой фигуры нет проверок hasattr и склеивания строк.
+    Методы вызываются по имени, так что подмена методов класса
+    (например, shapes.instrument) учитывается и после создания функции.
+
+    :param cls: Класс фигуры
+    :return: Функция формирования отчета
+    """
+    callers = []
+    template = f"Фигура: {cls.__name__}\n"
+    for method, label, spec, power in _REPORT_FIELDS:
+        if hasattr(cls, method):
+            template += f"  {label}: {{{len(callers)}:{spec}}}{{unit}}{power}\n"
+            callers.append(methodcaller(method))
+    render = template.format
+
+    def formatter(shape) -> str:
+        return render(*[caller(shape) for caller in callers], unit=shape.get_unit())
+
+    register_formatter(cls, formatter)
+    return formatter
+
+
+def format_shape_info(shape) -> str:
+    """
+    Формирует отчет о фигуре: ее размеры и характеристики.
+
+    :param shape: Геометрическая фигура
+    :return: Строка с информацией о фигуре
+    """
+    formatter = _FORMATTERS.get(type(shape)) or _compile_formatter(type(shape))
+    return formatter(shape)
+
+
+def write_shape_reports(shapes: Iterable, stream: Optional[TextIO] = None,
+                        separator: str = "\n"):
+    """
+    Записывает отчеты о фигурах в поток крупными порциями.
+
+    :param shapes: Геометрические фигуры
+    :param stream: Поток вывода (по умолчанию sys.stdout)
+    :param separator: Текст после каждого отчета
+    """
+    stream = stream or sys.stdout
+    buffer = []
+    for shape in shapes:
+        buffer.append(format_shape_info(shape))
+        buffer.append(separator)
+        if len(buffer) >= 2 * _WRITE_CHUNK:
+            stream.write("".join(buffer))
+            buffer = []
+    if buffer:
+        stream.write("".join(buffer))
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,174 @@
+"""
+Компактная двоичная сериализация списков фигур.
+
+Функция dumps упаковывает список фигур Rectangle, Circle, Cube и Sphere
+в один буфер байтов, loads восстанавливает список. Буфер в несколько раз
+меньше результата pickle и разбирается векторно.
+
+Формат буфера (все числа little-endian):
+
+- заголовок, 16 байт:
+    - сигнатура b'SHPB' (4 байта);
+    - версия формата, uint8 (сейчас 1);
+    - зарезервировано, 1 байт (0);
+    - количество единиц измерения, uint16;
+    - количество фигур, uint64;
+- таблица единиц измерения: для каждой единицы длина в байтах (uint8)
+  и название в UTF-8;
+- записи фигур по 18 байт без выравнивания:
+    - код типа фигуры (коды ShapeBatch), uint8; старший бит установлен,
+      если у фигуры задано положение;
+    - код единицы измерения (индекс в таблице единиц), uint8;
+    - первый размер, float64;
+    - второй размер, float64 (0.0 для фигур с одним размером);
+- положения фигур, у которых установлен старший бит кода типа,
+  в порядке записей: три float64 (x, y, z), для плоских фигур z = 0.0.
+"""
+
+import struct
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
+from shapes.shapes2d import Shape, Rectangle, Circle
+from shapes.shapes3d import ThreeDShape, Cube, Sphere
+
+MAGIC = b'SHPB'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBxHQ')
+
+RECORD_DTYPE = np.dtype({
+    'names': ['kind', 'unit', 'dim1', 'dim2'],
+    'formats': ['u1', 'u1', '<f8', '<f8'],
+    'offsets': [0, 1, 2, 10],
+    'itemsize': 18,
+})
+
+POSITION_DTYPE = np.dtype(('<f8', 3))
+
+# Бит кода типа, означающий наличие положения
+POSITION_FLAG = 0x80
+
+_KINDS = {
+    Rectangle: ShapeBatch.RECTANGLE,
+    Circle: ShapeBatch.CIRCLE,
+    Cube: ShapeBatch.CUBE,
+    Sphere: ShapeBatch.SPHERE,
+}
+
+
+def _kind(shape) -> int:
+    """
+    Определяет код типа фигуры, в том числе для подклассов.
+
+    :param shape: Фигура
+    :return: Код типа ShapeBatch
+    :raises TypeError: Если фигура не поддерживается форматом
+    """
+    for cls, kind in _KINDS.items():
+        if isinstance(shape, cls):
+            return kind
+    raise TypeError(f"Неподдерживаемый тип фигуры: {shape.__class__.__name__}")
+
+
+def dumps(shapes: Sequence[Union[Shape, ThreeDShape]]) -> bytes:
+    """
+    Упаковывает список фигур в буфер байтов.
+
+    Сохраняются размеры, единицы измерения и положения фигур; кэш
+    характеристик и наблюдатели не сохраняются.
+
+    :param shapes: Фигуры Rectangle, Circle, Cube и Sphere
+    :return: Буфер в формате, описанном в документации модуля
+    :raises TypeError: Если встречена фигура неподдерживаемого типа
+    :raises ValueError: Если в данных более 256 различных единиц измерения
+    """
+    kinds = _KINDS
+    units: Dict[str, int] = {}
+    rows = []
+    positions = []
+
+    for shape in shapes:
+        kind = kinds.get(type(shape))
+        if kind is None:
+            kind = _kind(shape)
+        dimensions = shape._arguments()
+        position = shape.get_position()
+        if position is not None:
+            kind |= POSITION_FLAG
+            positions.append((position + (0.0,))[:3])
+        rows.append((kind, units.setdefault(shape.get_unit(), len(units)),
+                     dimensions[0], dimensions[1] if len(dimensions) > 1 else 0.0))
+
+    if len(units) > 256:
+        raise ValueError("Формат поддерживает не более 256 единиц измерения.")
+    records = np.array(rows, dtype=RECORD_DTYPE)
+
+    table = []
+    for unit in units:
+        encoded = unit.encode('utf-8')
+        if len(encoded) > 255:
+            raise ValueError(f"Слишком длинное название единицы измерения: {unit}")
+        table.append(bytes([len(encoded)]) + encoded)
+
+    return b''.join([HEADER.pack(MAGIC, VERSION, len(units), len(records)), *table,
+                     records.tobytes(),
+                     np.array(positions, dtype=POSITION_DTYPE.base).reshape(-1, 3).tobytes()])
+
+
+def loads(data: Union[bytes, bytearray, memoryview],
+          trusted: bool = False) -> List[Union[Shape, ThreeDShape]]:
+    """
+    Восстанавливает список фигур из буфера, созданного dumps.
+
+    По умолчанию записи проверяются одним векторным проходом, а объекты
+    создаются без повторных проверок в конструкторах.
+
+    :param data: Буфер байтов
+    :param trusted: Не проверять записи (для буферов из проверенных данных)
+    :return: Список фигур
+    :raises ValueError: Если буфер поврежден или содержит некорректные фигуры
+    """
+    data = memoryview(data).cast('B')
+    if len(data) < HEADER.size:
+        raise ValueError("Буфер не содержит фигуры: слишком короткий заголовок.")
+    magic, version, unit_count, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Буфер не содержит фигуры: неверная сигнатура.")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+
+    offset = HEADER.size
+    units = []
+    try:
+        for _ in range(unit_count):
+            length = data[offset]
+            units.append(bytes(data[offset + 1:offset + 1 + length]).decode('utf-8'))
+            offset += 1 + length
+    except (IndexError, UnicodeDecodeError):
+        raise ValueError("Буфер поврежден: некорректная таблица единиц измерения.") from None
+
+    end = offset + count * RECORD_DTYPE.itemsize
+    if end > len(data):
+        raise ValueError("Буфер поврежден: записи фигур обрезаны.")
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=offset)
+
+    placed = np.flatnonzero(records['kind'] & POSITION_FLAG)
+    if len(data) != end + len(placed) * POSITION_DTYPE.itemsize:
+        raise ValueError("Буфер поврежден: неверный размер блока положений.")
+    positions = np.frombuffer(data, dtype=POSITION_DTYPE, count=len(placed), offset=end)
+
+    batch = ShapeBatch.from_arrays(records['kind'] & (POSITION_FLAG - 1),
+                                   records['dim1'], records['dim2'],
+                                   records['unit'], units, trusted=trusted)
+    shapes = batch.to_shapes(trusted=True)
+
+    flat = batch.get_kinds()[placed] <= ShapeBatch.CIRCLE
+    for index, position, is_flat in zip(placed.tolist(), positions.tolist(), flat.tolist()):
+        shapes[index].set_position(position[:2] if is_flat else position)
+    return shapes
+
+if __name__ == '__main__':
+    ...
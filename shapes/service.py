@@ -0,0 +1,493 @@
+"""
+Сервис расчетов с объединением одновременных запросов в пакеты.
+
+Протокол: каждая строка запроса и ответа - объект JSON (UTF-8), строки
+разделяются символом '\n'. Запрос содержит необязательный идентификатор
+id, который возвращается в ответе без изменений, и операцию op:
+
+- metrics: характеристики фигуры
+    {"id": 1, "op": "metrics", "shape": {"type": "circle", "radius": 2}}
+    -> {"id": 1, "result": {"area": ..., "perimeter": ..., "volume": null,
+                            "surface_area": null, "unit": "cm"}}
+- convert: перевод значения (power: 1 - длина, 2 - площадь, 3 - объем)
+    {"id": 2, "op": "convert", "value": 1.5, "from": "m", "to": "cm", "power": 2}
+    -> {"id": 2, "result": 15000.0}
+- compare: сравнение фигур по площади (площади поверхности для 3D)
+    {"id": 3, "op": "compare", "first": {...}, "second": {...}, "message": true}
+    -> {"id": 3, "result": {"order": 1, "difference": ..., "message": "..."}}
+
+Фигуры описываются полями записей shapes.ingest (type, width, height,
+radius, side, unit). При ошибке ответ содержит поле error с текстом
+ошибки вместо result. Ответы на запросы одного соединения могут
+приходить не в порядке запросов; их сопоставляют по id. На строку
+длиннее LINE_LIMIT байт возвращается ответ с ошибкой без id.
+
+Одновременные запросы (от всех соединений) собираются в пакеты размером
+до batch_size или за время до max_wait и вычисляются векторно.
+"""
+
+import asyncio
+import json
+import math
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
+from shapes.ingest import parse_record
+from shapes.units import registry
+from shapes.utils import _AREA_TOLERANCE, comparison_messages
+
+OPERATIONS = ('metrics', 'convert', 'compare')
+
+# Максимальная длина строки запроса в байтах (лимит буфера StreamReader)
+LINE_LIMIT = 2 ** 16
+
+
+def _number(value) -> Optional[float]:
+    """
+    Преобразует результат в число для JSON (NaN - в null).
+
+    :param value: Число или скаляр NumPy
+    :return: Число или None
+    """
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _parse_shapes(records: Sequence) -> tuple:
+    """
+    Разбирает описания фигур в набор ShapeBatch.
+
+    :param records: Описания фигур (словари)
+    :return: Кортеж (набор корректных фигур, позиции корректных фигур,
+        {позиция: текст ошибки})
+    """
+    rows = []
+    positions = []
+    errors = {}
+    for position, record in enumerate(records):
+        try:
+            if not isinstance(record, dict):
+                raise ValueError("Фигура должна быть объектом JSON.")
+            # Номер записи не передается: текст ошибки не должен зависеть
+            # от того, с какими запросами объединен запрос
+            rows.append(parse_record(record))
+            positions.append(position)
+        except Exception as error:
+            # Ошибка разбора (в том числе переполнение при огромных числах)
+            # относится только к своей записи
+            errors[position] = str(error)
+
+    units: Dict[str, int] = {}
+    codes = [units.setdefault(unit, len(units)) for _, _, _, unit in rows]
+    batch = ShapeBatch([row[0] for row in rows], [row[1] for row in rows],
+                       [row[2] for row in rows], codes, list(units))
+
+    invalid = batch.invalid_rows()
+    if invalid.any():
+        for index in np.flatnonzero(invalid).tolist():
+            errors[positions[index]] = "Размеры фигуры должны быть положительными числами."
+        valid = np.flatnonzero(~invalid)
+        batch = batch.take(valid)
+        positions = [positions[index] for index in valid.tolist()]
+    return batch, positions, errors
+
+
+def _evaluate_metrics(requests: List[dict]) -> List[dict]:
+    """
+    Вычисляет ответы на запросы характеристик фигур.
+
+    :param requests: Запросы операции metrics
+    :return: Ответы в порядке запросов
+    """
+    batch, positions, errors = _parse_shapes([request.get('shape') for request in requests])
+    responses = [{'error': error} for error in
+                 (errors.get(position) for position in range(len(requests)))]
+
+    area, perimeter = batch.area(), batch.perimeter()
+    volume, surface_area = batch.volume(), batch.surface_area()
+    units, codes = batch.get_units(), batch.get_unit_codes()
+    for index, position in enumerate(positions):
+        responses[position] = {'result': {
+            'area': _number(area[index]),
+            'perimeter': _number(perimeter[index]),
+            'volume': _number(volume[index]),
+            'surface_area': _number(surface_area[index]),
+            'unit': units[codes[index]],
+        }}
+    return responses
+
+
+def _evaluate_convert(requests: List[dict]) -> List[dict]:
+    """
+    Вычисляет ответы на запросы перевода единиц измерения.
+
+    :param requests: Запросы операции convert
+    :return: Ответы в порядке запросов
+    """
+    responses: List[Optional[dict]] = [None] * len(requests)
+    values, sources, targets, powers, positions = [], [], [], [], []
+    for position, request in enumerate(requests):
+        value, power = request.get('value'), request.get('power', 1)
+        source, target = request.get('from'), request.get('to')
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            responses[position] = {'error': "Значение должно быть числом."}
+        elif not isinstance(source, str) or not isinstance(target, str):
+            responses[position] = {'error': "Единицы измерения должны быть строками."}
+        elif isinstance(power, bool) or not isinstance(power, int) or power not in (1, 2, 3):
+            responses[position] = {'error': "Степень должна быть равна 1, 2 или 3."}
+        else:
+            try:
+                value = float(value)
+            except OverflowError:
+                responses[position] = {'error': "Значение слишком велико."}
+                continue
+            values.append(value)
+            sources.append(source)
+            targets.append(target)
+            powers.append(power)
+            positions.append(position)
+
+    if positions:
+        source_codes = registry.codes(sources)
+        target_codes = registry.codes(targets)
+        powers = np.array(powers)
+        factors = np.full(len(positions), np.nan)
+        known = (source_codes >= 0) & (target_codes >= 0)
+        for power in (1, 2, 3):
+            mask = known & (powers == power)
+            factors[mask] = registry.get_factor_matrix(power)[source_codes[mask],
+                                                              target_codes[mask]]
+        results = np.array(values, dtype=np.float64) * factors
+
+        for index, position in enumerate(positions):
+            if source_codes[index] < 0:
+                responses[position] = {
+                    'error': f"Неизвестная исходная единица измерения: {sources[index]}"}
+            elif target_codes[index] < 0:
+                responses[position] = {
+                    'error': f"Неизвестная целевая единица измерения: {targets[index]}"}
+            else:
+                responses[position] = {'result': float(results[index])}
+    return responses
+
+
+def _evaluate_compare(requests: List[dict]) -> List[dict]:
+    """
+    Вычисляет ответы на запросы сравнения фигур по площади.
+
+    :param requests: Запросы операции compare
+    :return: Ответы в порядке запросов
+    """
+    shapes = [request.get('first') for request in requests] + \
+             [request.get('second') for request in requests]
+    batch, positions, errors = _parse_shapes(shapes)
+    count = len(requests)
+
+    responses = [None] * count
+    for position, error in errors.items():
+        responses[position % count] = {'error': error}
+
+    # Позиции в наборе для первой и второй фигуры каждого запроса
+    index = np.full(2 * count, -1, dtype=np.intp)
+    index[positions] = np.arange(len(positions))
+    first, second = index[:count], index[count:]
+    valid = np.flatnonzero((first >= 0) & (second >= 0))
+
+    areas = batch.comparable_area()
+    difference = areas[first[valid]] - areas[second[valid]]
+    # Точность сравнения совпадает с compare_shapes_by_area
+    order = np.where(np.abs(difference) < _AREA_TOLERANCE, 0,
+                     np.sign(difference)).astype(int)
+
+    wanted = [position for position in valid.tolist() if requests[position].get('message')]
+    messages = dict(zip(wanted, comparison_messages(
+        batch, [(first[position], second[position]) for position in wanted])))
+
+    for i, position in enumerate(valid.tolist()):
+        result = {'order': int(order[i]), 'difference': float(difference[i])}
+        if position in messages:
+            result['message'] = messages[position]
+        responses[position] = {'result': result}
+    return responses
+
+
+_EVALUATORS: Dict[str, Callable[[List[dict]], List[dict]]] = {
+    'metrics': _evaluate_metrics,
+    'convert': _evaluate_convert,
+    'compare': _evaluate_compare,
+}
+
+
+def evaluate(requests: Sequence[dict]) -> List[dict]:
+    """
+    Вычисляет ответы на пакет запросов.
+
+    Запросы группируются по операциям, и каждая группа вычисляется
+    векторно. Ошибка в одном запросе не влияет на остальные.
+
+    :param requests: Запросы (словари с полем op)
+    :return: Ответы в порядке запросов (с полем result или error и id запроса)
+    """
+    responses: List[Optional[dict]] = [None] * len(requests)
+    groups: Dict[str, List[int]] = {}
+    for position, request in enumerate(requests):
+        op = request.get('op') if isinstance(request, dict) else None
+        if op in _EVALUATORS:
+            groups.setdefault(op, []).append(position)
+        else:
+            responses[position] = {'error': f"Неизвестная операция: {op}. "
+                                            f"Допустимые значения: {', '.join(OPERATIONS)}."}
+
+    for op, positions in groups.items():
+        results = _EVALUATORS[op]([requests[position] for position in positions])
+        for position, response in zip(positions, results):
+            responses[position] = response
+
+    for request, response in zip(requests, responses):
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+    return responses
+
+
+class MicroBatcher:
+    """
+    Объединяет одновременные запросы в пакеты для совместного вычисления.
+
+    Пакет вычисляется, когда в нем набралось batch_size запросов или
+    с момента поступления первого запроса прошло max_wait секунд.
+    """
+
+    def __init__(self, process: Callable[[List], List], batch_size: int = 256,
+                 max_wait: float = 0.002):
+        """
+        Конструктор класса MicroBatcher.
+
+        :param process: Функция, вычисляющая список ответов по списку запросов
+        :param batch_size: Максимальное количество запросов в пакете
+        :param max_wait: Максимальное время ожидания пакета в секундах
+        """
+        if batch_size <= 0:
+            raise ValueError("Размер пакета должен быть положительным числом.")
+        if max_wait < 0:
+            raise ValueError("Время ожидания не может быть отрицательным.")
+        self.__process = process
+        self.__batch_size = batch_size
+        self.__max_wait = max_wait
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__worker: Optional[asyncio.Task] = None
+        self.__batches = 0
+        self.__requests = 0
+
+    async def submit(self, request):
+        """
+        Добавляет запрос в очередь и ожидает ответ.
+
+        :param request: Запрос
+        :return: Ответ на запрос
+        """
+        if self.__worker is None:
+            self.__queue = asyncio.Queue()
+            self.__worker = asyncio.get_running_loop().create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self.__queue.put_nowait((request, future))
+        return await future
+
+    def _resolve(self, pending: List[tuple]):
+        """
+        Вычисляет пакет и передает ответы ожидающим запросам.
+
+        Если пакет целиком вычислить не удалось, запросы вычисляются
+        по одному, и ошибка передается только запросу, который ее вызвал.
+
+        :param pending: Пары (запрос, future)
+        """
+        try:
+            responses = self.__process([request for request, _ in pending])
+        except Exception:
+            responses = None
+
+        for index, (request, future) in enumerate(pending):
+            if future.done():
+                continue
+            if responses is not None:
+                future.set_result(responses[index])
+                continue
+            try:
+                future.set_result(self.__process([request])[0])
+            except Exception as error:
+                future.set_exception(error)
+
+    async def _run(self):
+        """
+        Собирает запросы из очереди в пакеты и вычисляет их.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self.__queue
+        while True:
+            pending = [await queue.get()]
+            deadline = loop.time() + self.__max_wait
+            while len(pending) < self.__batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    pending.append(queue.get_nowait())
+
+            self.__batches += 1
+            self.__requests += len(pending)
+            self._resolve(pending)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Возвращает количество вычисленных пакетов и запросов.
+
+        :return: Словарь {'batches': ..., 'requests': ..., 'mean_batch': ...}
+        """
+        return {'batches': self.__batches, 'requests': self.__requests,
+                'mean_batch': self.__requests / self.__batches if self.__batches else 0.0}
+
+    async def close(self):
+        """
+        Останавливает обработку очереди.
+        """
+        if self.__worker is not None:
+            self.__worker.cancel()
+            try:
+                await self.__worker
+            except asyncio.CancelledError:
+                pass
+            self.__worker = None
+
+
+async def _read_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Читает строку запроса.
+
+    Строка длиннее лимита буфера потока пропускается целиком, до
+    символа '\n' включительно, чтобы ее продолжение не было принято
+    за следующий запрос.
+
+    :param reader: Поток чтения соединения
+    :return: Строка, b'' при закрытии соединения или None,
+        если строка превысила лимит
+    """
+    overrun = False
+    while True:
+        try:
+            line = await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as error:
+            line = error.partial
+        except asyncio.LimitOverrunError as error:
+            overrun = True
+            await reader.readexactly(error.consumed)
+            continue
+        return None if overrun else line
+
+
+async def _handle_connection(batcher: MicroBatcher, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter, max_pending: int = 1024):
+    """
+    Обслуживает одно соединение: каждая строка обрабатывается отдельной
+    задачей, поэтому запросы соединения могут попасть в один пакет.
+
+    Чтение приостанавливается, пока у соединения max_pending запросов
+    ожидают ответа, а запись каждого ответа ожидает освобождения буфера
+    отправки: клиент, который не читает ответы, не может накопить на
+    сервере неограниченное количество задач и данных.
+
+    :param batcher: Общий для всех соединений накопитель пакетов
+    :param reader: Поток чтения соединения
+    :param writer: Поток записи соединения
+    :param max_pending: Максимальное количество одновременно
+        обрабатываемых запросов соединения
+    """
+    pending = asyncio.Semaphore(max_pending)
+
+    async def send(response: dict):
+        writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def respond(line: bytes):
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {'error': "Некорректный JSON."}
+            else:
+                try:
+                    response = await batcher.submit(request)
+                except Exception as error:
+                    response = {'error': f"Ошибка обработки запроса: {error}"}
+                    if isinstance(request, dict) and 'id' in request:
+                        response['id'] = request['id']
+            await send(response)
+        finally:
+            pending.release()
+
+    tasks = set()
+    try:
+        while True:
+            line = await _read_line(reader)
+            if line is None:
+                await send({'error': f"Строка запроса длиннее {LINE_LIMIT} байт."})
+                continue
+            if not line:
+                break
+            if line.strip():
+                await pending.acquire()
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+    except ConnectionError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, path: Optional[str] = None,
+                batch_size: int = 256, max_wait: float = 0.002,
+                ready: Optional[Callable[[], None]] = None, max_pending: int = 1024):
+    """
+    Запускает сервер и обслуживает соединения до отмены задачи.
+
+    :param host: Адрес для TCP
+    :param port: Порт для TCP
+    :param path: Путь к Unix-сокету (если задан, TCP не используется)
+    :param batch_size: Максимальное количество запросов в пакете
+    :param max_wait: Максимальное время ожидания пакета в секундах
+    :param ready: Функция, вызываемая после начала приема соединений
+    :param max_pending: Максимальное количество одновременно
+        обрабатываемых запросов одного соединения
+    """
+    if max_pending <= 0:
+        raise ValueError("Количество одновременных запросов должно быть положительным числом.")
+    batcher = MicroBatcher(evaluate, batch_size, max_wait)
+
+    def handler(reader, writer):
+        return _handle_connection(batcher, reader, writer, max_pending)
+
+    if path:
+        server = await asyncio.start_unix_server(handler, path=path, limit=LINE_LIMIT)
+    else:
+        server = await asyncio.start_server(handler, host, port, limit=LINE_LIMIT)
+    try:
+        async with server:
+            if ready is not None:
+                ready()
+            await server.serve_forever()
+    finally:
+        await batcher.close()
+
+if __name__ == '__main__':
+    ...
@@ -4,23 +4,50 @@
 
 from abc import ABC, abstractmethod
 from math import pi
-from typing import Union
+from typing import List, Sequence, Union
 
-class Shape(ABC):
+import numpy as np
+
+from shapes.base import ShapeMixin
+from shapes.cache import cached_metric
+from shapes.validation import check_lengths, check_rows, numeric_column, unit_column
+
+
+class Shape(ShapeMixin, ABC):
     """
     Абстрактный базовый класс для всех геометрических фигур.
+
+    Единица измерения, положение (x, y), наблюдатели, перевод единиц
+    и геометрическая идентичность реализованы в ShapeMixin.
     """
 
-    def __init__(self, unit: str = 'cm'):
+    __slots__ = ('_area', '_perimeter')
+
+    _AXES = 2
+
+    def _init_unchecked(self, unit: str):
         """
-        Базовый конструктор класса Shape.
+        Инициализирует поля базового класса без проверки аргументов.
 
-        :param unit: Единица измерения
+        Слоты заполняются напрямую, без вызова _invalidate_metrics:
+        метод вызывается для каждой фигуры при массовом создании.
+
+        :param unit: Интернированная единица измерения
         """
-        if not isinstance(unit, str):
-            raise TypeError("Единица измерения должна быть строкой.")
+        self._unit = unit
+        self._position = None
+        self._observers = None
+        self._hash = None
+        self._area = None
+        self._perimeter = None
 
-        self.__unit = unit
+    def _invalidate_metrics(self):
+        """
+        Сбрасывает кэшированные характеристики и хэш после изменения фигуры.
+        """
+        self._area = None
+        self._perimeter = None
+        self._hash = None
 
     @abstractmethod
     def area(self) -> float:
@@ -40,35 +67,6 @@ class Shape(ABC):
         """
         pass
 
-    def get_unit(self) -> str:
-        """
-        Возвращает единицу измерения фигуры.
-
-        :return: Единица измерения
-        """
-        return self.__unit
-
-    def set_unit(self, unit: str):
-        """
-        Устанавливает новое значение единицы измерения.
-
-        :param unit: Новая единица измерения
-        """
-        if not isinstance(unit, str):
-            raise TypeError("Единица измерения должна быть строкой.")
-        self.__unit = unit
-
-    def __eq__(self, other: 'Shape') -> bool:
-        """
-        Сравнение фигур по площади.
-
-        :param other: Другая фигура для сравнения
-        :return: True если площади равны, иначе False
-        """
-        if not isinstance(other, Shape):
-            return NotImplemented
-        return abs(self.area() - other.area()) < 1e-10
-
     def __lt__(self, other: 'Shape') -> bool:
         """
         Сравнение фигур по площади (меньше).
@@ -91,29 +89,25 @@ class Shape(ABC):
             return NotImplemented
         return self.area() > other.area()
 
-    def __str__(self) -> str:
-        """
-        Возвращает строковое представление объекта Shape.
-
-        :return: Строковое представление
-        """
-        return f"{self.__class__.__name__}(unit={self.__unit})"
-
 
 class Rectangle(Shape):
     """
     Класс для представления прямоугольника.
     """
 
-    def __init__(self, width: float, height: float, unit: str = 'cm'):
+    __slots__ = ('__width', '__height')
+
+    def __init__(self, width: float, height: float, unit: str = 'cm',
+                 position: Sequence[float] = None):
         """
         Конструктор класса Rectangle.
 
         :param width: Ширина прямоугольника
         :param height: Высота прямоугольника
         :param unit: Единица измерения
+        :param position: Координаты левого нижнего угла (x, y)
         """
-        super().__init__(unit)
+        super().__init__(unit, position)
 
         if not all(isinstance(arg, (int, float)) for arg in [width, height]):
             raise TypeError("Ширина и высота должны быть числами.")
@@ -123,6 +117,50 @@ class Rectangle(Shape):
         self.__width = width
         self.__height = height
 
+    @classmethod
+    def _unchecked(cls, width: float, height: float, unit: str) -> 'Rectangle':
+        """
+        Создает прямоугольник без проверки аргументов.
+
+        :param width: Ширина прямоугольника
+        :param height: Высота прямоугольника
+        :param unit: Интернированная единица измерения
+        :return: Новый прямоугольник
+        """
+        rectangle = cls.__new__(cls)
+        rectangle._init_unchecked(unit)
+        rectangle.__width = width
+        rectangle.__height = height
+        return rectangle
+
+    @classmethod
+    def from_arrays(cls, widths, heights, unit: Union[str, Sequence[str]] = 'cm',
+                    trusted: bool = False) -> List['Rectangle']:
+        """
+        Создает прямоугольники из массивов размеров.
+
+        Все строки проверяются одной векторной операцией, и ошибка
+        перечисляет все некорректные строки, а не только первую.
+
+        :param widths: Ширины прямоугольников
+        :param heights: Высоты прямоугольников
+        :param unit: Общая единица измерения или единица для каждой фигуры
+        :param trusted: Не проверять положительность размеров (для уже
+            проверенных данных, например из хранилища shapes.store)
+        :return: Список прямоугольников
+        """
+        widths = numeric_column(widths, "Ширина и высота должны быть числами.")
+        heights = numeric_column(heights, "Ширина и высота должны быть числами.")
+        check_lengths(widths, heights)
+        if not trusted:
+            check_rows(~(widths > 0) | ~(heights > 0),
+                       "Ширина и высота должны быть положительными числами")
+
+        unchecked = cls._unchecked
+        return [unchecked(width, height, unit) for width, height, unit in
+                zip(widths.tolist(), heights.tolist(), unit_column(unit, len(widths)))]
+
+    @cached_metric
     def area(self) -> float:
         """
         Вычисляет площадь прямоугольника.
@@ -133,6 +171,7 @@ class Rectangle(Shape):
         """
         return self.__width * self.__height
 
+    @cached_metric
     def perimeter(self) -> float:
         """
         Вычисляет периметр прямоугольника.
@@ -169,7 +208,10 @@ class Rectangle(Shape):
             raise TypeError("Ширина должна быть числом.")
         if width <= 0:
             raise ValueError("Ширина должна быть положительным числом.")
+        changed = width != self.__width
         self.__width = width
+        if changed:
+            self._changed()
 
     def set_height(self, height: float):
         """
@@ -181,7 +223,49 @@ class Rectangle(Shape):
             raise TypeError("Высота должна быть числом.")
         if height <= 0:
             raise ValueError("Высота должна быть положительным числом.")
+        changed = height != self.__height
         self.__height = height
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет ограничивающий прямоугольник, совпадающий с самим
+        прямоугольником.
+
+        :return: Кортеж ((x_min, y_min), (x_max, y_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y = self._require_position()
+        return (x, y), (x + self.__width, y + self.__height)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает стороны прямоугольника по возрастанию, чтобы
+        прямоугольники a x b и b x a считались одинаковыми.
+
+        :return: Кортеж (меньшая сторона, большая сторона)
+        """
+        return (self.__width, self.__height) if self.__width <= self.__height \
+            else (self.__height, self.__width)
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает размеры прямоугольника в порядке аргументов _unchecked.
+
+        :return: Кортеж (ширина, высота)
+        """
+        return (self.__width, self.__height)
+
+    def _scaled(self, factor: float, unit: str) -> 'Rectangle':
+        """
+        Создает прямоугольник с размерами, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новый прямоугольник
+        """
+        return self._unchecked(self.__width * factor, self.__height * factor, unit)
 
     def __str__(self) -> str:
         """
@@ -200,14 +284,18 @@ class Circle(Shape):
     Класс для представления круга.
     """
 
-    def __init__(self, radius: float, unit: str = 'cm'):
+    __slots__ = ('__radius',)
+
+    def __init__(self, radius: float, unit: str = 'cm',
+                 position: Sequence[float] = None):
         """
         Конструктор класса Circle.
 
         :param radius: Радиус круга
         :param unit: Единица измерения
+        :param position: Координаты центра (x, y)
         """
-        super().__init__(unit)
+        super().__init__(unit, position)
 
         if not isinstance(radius, (int, float)):
             raise TypeError("Радиус должен быть числом.")
@@ -216,6 +304,44 @@ class Circle(Shape):
 
         self.__radius = radius
 
+    @classmethod
+    def _unchecked(cls, radius: float, unit: str) -> 'Circle':
+        """
+        Создает круг без проверки аргументов.
+
+        :param radius: Радиус круга
+        :param unit: Интернированная единица измерения
+        :return: Новый круг
+        """
+        circle = cls.__new__(cls)
+        circle._init_unchecked(unit)
+        circle.__radius = radius
+        return circle
+
+    @classmethod
+    def from_arrays(cls, radii, unit: Union[str, Sequence[str]] = 'cm',
+                    trusted: bool = False) -> List['Circle']:
+        """
+        Создает круги из массива радиусов.
+
+        Все строки проверяются одной векторной операцией, и ошибка
+        перечисляет все некорректные строки, а не только первую.
+
+        :param radii: Радиусы кругов
+        :param unit: Общая единица измерения или единица для каждой фигуры
+        :param trusted: Не проверять положительность радиусов (для уже
+            проверенных данных, например из хранилища shapes.store)
+        :return: Список кругов
+        """
+        radii = numeric_column(radii, "Радиус должен быть числом.")
+        if not trusted:
+            check_rows(~(radii > 0), "Радиус должен быть положительным числом")
+
+        unchecked = cls._unchecked
+        return [unchecked(radius, unit) for radius, unit in
+                zip(radii.tolist(), unit_column(unit, len(radii)))]
+
+    @cached_metric
     def area(self) -> float:
         """
         Вычисляет площадь круга.
@@ -226,6 +352,7 @@ class Circle(Shape):
         """
         return pi * self.__radius ** 2
 
+    @cached_metric
     def perimeter(self) -> float:
         """
         Вычисляет длину окружности.
@@ -254,7 +381,47 @@ class Circle(Shape):
             raise TypeError("Радиус должен быть числом.")
         if radius <= 0:
             raise ValueError("Радиус должен быть положительным числом.")
+        changed = radius != self.__radius
         self.__radius = radius
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет квадрат, описанный вокруг круга.
+
+        :return: Кортеж ((x_min, y_min), (x_max, y_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y = self._require_position()
+        radius = self.__radius
+        return (x - radius, y - radius), (x + radius, y + radius)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает размеры круга.
+
+        :return: Кортеж (радиус,)
+        """
+        return (self.__radius,)
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает радиус круга в порядке аргументов _unchecked.
+
+        :return: Кортеж (радиус,)
+        """
+        return (self.__radius,)
+
+    def _scaled(self, factor: float, unit: str) -> 'Circle':
+        """
+        Создает круг с размерами, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новый круг
+        """
+        return self._unchecked(self.__radius * factor, unit)
 
     def __str__(self) -> str:
         """
@@ -266,5 +433,212 @@ class Circle(Shape):
                 f"area={self.area():.2f}{self.get_unit()}², "
                 f"circumference={self.perimeter():.2f}{self.get_unit()})")
 
+
+def _closing_indices(offsets: np.ndarray, size: int) -> np.ndarray:
+    """
+    Вычисляет индекс следующей вершины для каждой вершины многоугольников,
+    записанных подряд: за последней вершиной многоугольника следует первая.
+
+    :param offsets: Начала многоугольников и общее количество вершин в конце
+    :param size: Общее количество вершин
+    :return: Массив индексов следующих вершин
+    """
+    following = np.arange(1, size + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+    return following
+
+
+def polygon_areas(coordinates: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет площади многоугольников по формуле шнурования (Гаусса).
+
+    Вершины всех многоугольников записаны подряд в одном массиве,
+    и вычисление выполняется векторно для всех многоугольников сразу.
+
+    :param coordinates: Массив вершин формы (M, 2)
+    :param offsets: Начала многоугольников в coordinates и M в конце
+        (у каждого многоугольника не менее одной вершины)
+    :return: Массив площадей
+    """
+    x = coordinates[:, 0]
+    y = coordinates[:, 1]
+    following = _closing_indices(offsets, len(coordinates))
+    cross = x * y[following] - x[following] * y
+    return 0.5 * np.abs(np.add.reduceat(cross, offsets[:-1]))
+
+
+def polygon_perimeters(coordinates: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет периметры многоугольников как суммы длин сторон.
+
+    :param coordinates: Массив вершин формы (M, 2)
+    :param offsets: Начала многоугольников в coordinates и M в конце
+    :return: Массив периметров
+    """
+    following = _closing_indices(offsets, len(coordinates))
+    sides = coordinates[following] - coordinates
+    return np.add.reduceat(np.hypot(sides[:, 0], sides[:, 1]), offsets[:-1])
+
+
+class Polygon(Shape):
+    """
+    Класс для представления простого многоугольника.
+
+    Вершины хранятся в непрерывном массиве float64 формы (N, 2)
+    в порядке обхода контура. Координаты вершин задаются относительно
+    положения фигуры (если оно задано).
+    """
+
+    __slots__ = ('__vertices',)
+
+    def __init__(self, vertices, unit: str = 'cm',
+                 position: Sequence[float] = None):
+        """
+        Конструктор класса Polygon.
+
+        :param vertices: Вершины: последовательность пар (x, y) или массив (N, 2)
+        :param unit: Единица измерения
+        :param position: Координаты начала системы координат вершин (x, y)
+        """
+        super().__init__(unit, position)
+        self.__vertices = self._vertex_array(vertices)
+
+    @staticmethod
+    def _vertex_array(vertices) -> np.ndarray:
+        """
+        Проверяет вершины и копирует их в массив только для чтения.
+
+        :param vertices: Вершины многоугольника
+        :return: Массив float64 формы (N, 2)
+        :raises TypeError: Если вершины не являются парами чисел
+        :raises ValueError: Если вершин меньше трех, координаты не конечны
+            или площадь многоугольника равна нулю
+        """
+        array = np.array(vertices)
+        if array.dtype.kind not in 'biuf' or array.ndim != 2 or array.shape[1] != 2:
+            raise TypeError("Вершины должны быть последовательностью пар чисел (x, y).")
+        if len(array) < 3:
+            raise ValueError("Многоугольник должен иметь не менее 3 вершин.")
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        if not np.isfinite(array).all():
+            raise ValueError("Координаты вершин должны быть конечными числами.")
+        if not polygon_areas(array, np.array([0, len(array)]))[0] > 0:
+            raise ValueError("Площадь многоугольника должна быть положительной.")
+        array.setflags(write=False)
+        return array
+
+    @classmethod
+    def _unchecked(cls, vertices: np.ndarray, unit: str) -> 'Polygon':
+        """
+        Создает многоугольник без проверки аргументов.
+
+        :param vertices: Массив вершин формы (N, 2) только для чтения
+        :param unit: Интернированная единица измерения
+        :return: Новый многоугольник
+        """
+        polygon = cls.__new__(cls)
+        polygon._init_unchecked(unit)
+        polygon.__vertices = vertices
+        return polygon
+
+    @cached_metric
+    def area(self) -> float:
+        """
+        Вычисляет площадь многоугольника.
+
+        Формула шнурования: |Σ (x_i * y_(i+1) - x_(i+1) * y_i)| / 2
+
+        :return: Площадь многоугольника
+        """
+        return float(polygon_areas(self.__vertices, np.array([0, len(self.__vertices)]))[0])
+
+    @cached_metric
+    def perimeter(self) -> float:
+        """
+        Вычисляет периметр многоугольника как сумму длин сторон.
+
+        :return: Периметр многоугольника
+        """
+        return float(polygon_perimeters(self.__vertices,
+                                        np.array([0, len(self.__vertices)]))[0])
+
+    def get_vertices(self) -> np.ndarray:
+        """
+        Возвращает вершины многоугольника.
+
+        :return: Массив формы (N, 2) только для чтения
+        """
+        return self.__vertices
+
+    def get_vertex_count(self) -> int:
+        """
+        Возвращает количество вершин многоугольника.
+
+        :return: Количество вершин
+        """
+        return len(self.__vertices)
+
+    def set_vertices(self, vertices):
+        """
+        Устанавливает новые вершины многоугольника.
+
+        :param vertices: Последовательность пар (x, y) или массив (N, 2)
+        """
+        vertices = self._vertex_array(vertices)
+        changed = not np.array_equal(vertices, self.__vertices)
+        self.__vertices = vertices
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет прямоугольник, описанный вокруг многоугольника.
+
+        :return: Кортеж ((x_min, y_min), (x_max, y_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y = self._require_position()
+        (x_min, y_min), (x_max, y_max) = (self.__vertices.min(axis=0).tolist(),
+                                          self.__vertices.max(axis=0).tolist())
+        return (x + x_min, y + y_min), (x + x_max, y + y_max)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает координаты вершин в порядке обхода.
+
+        :return: Кортеж (x_1, y_1, x_2, y_2, ...)
+        """
+        return tuple(self.__vertices.ravel().tolist())
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает вершины многоугольника в порядке аргументов _unchecked.
+
+        :return: Кортеж (массив вершин,)
+        """
+        return (self.__vertices,)
+
+    def _scaled(self, factor: float, unit: str) -> 'Polygon':
+        """
+        Создает многоугольник с координатами вершин, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новый многоугольник
+        """
+        vertices = self.__vertices * factor
+        vertices.setflags(write=False)
+        return self._unchecked(vertices, unit)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта Polygon.
+
+        :return: Строковое представление многоугольника
+        """
+        return (f"Polygon(vertices={len(self.__vertices)}, "
+                f"area={self.area():.2f}{self.get_unit()}², "
+                f"perimeter={self.perimeter():.2f}{self.get_unit()})")
+
 if __name__ == '__main__':
     ...
\ No newline at end of file
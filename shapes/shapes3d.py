@@ -3,50 +3,50 @@
 """
 
 from math import pi
-from typing import Union
+from typing import List, Sequence, Union
 
+import numpy as np
 
-class ThreeDShape:
+from shapes.base import ShapeMixin
+from shapes.cache import cached_metric
+from shapes.validation import check_rows, numeric_column, unit_column
+
+
+class ThreeDShape(ShapeMixin):
     """
     Базовый класс для всех 3D геометрических фигур.
-    """
 
-    def __init__(self, unit: str = 'cm'):
-        """
-        Базовый конструктор класса ThreeDShape.
+    Единица измерения, положение (x, y, z), наблюдатели, перевод единиц
+    и геометрическая идентичность реализованы в ShapeMixin.
+    """
 
-        :param unit: Единица измерения
-        """
-        if not isinstance(unit, str):
-            raise TypeError("Единица измерения должна быть строкой.")
+    __slots__ = ('_volume', '_surface_area')
 
-        self.__unit = unit
+    _AXES = 3
 
-    def get_unit(self) -> str:
+    def _init_unchecked(self, unit: str):
         """
-        Возвращает единицу измерения фигуры.
+        Инициализирует поля базового класса без проверки аргументов.
 
-        :return: Единица измерения
-        """
-        return self.__unit
+        Слоты заполняются напрямую, без вызова _invalidate_metrics:
+        метод вызывается для каждой фигуры при массовом создании.
 
-    def set_unit(self, unit: str):
+        :param unit: Интернированная единица измерения
         """
-        Устанавливает новое значение единицы измерения.
+        self._unit = unit
+        self._position = None
+        self._observers = None
+        self._hash = None
+        self._volume = None
+        self._surface_area = None
 
-        :param unit: Новая единица измерения
+    def _invalidate_metrics(self):
         """
-        if not isinstance(unit, str):
-            raise TypeError("Единица измерения должна быть строкой.")
-        self.__unit = unit
-
-    def __str__(self) -> str:
+        Сбрасывает кэшированные характеристики и хэш после изменения фигуры.
         """
-        Возвращает строковое представление объекта ThreeDShape.
-
-        :return: Строковое представление
-        """
-        return f"{self.__class__.__name__}(unit={self.__unit})"
+        self._volume = None
+        self._surface_area = None
+        self._hash = None
 
 
 class Cube(ThreeDShape):
@@ -54,14 +54,18 @@ class Cube(ThreeDShape):
     Класс для представления куба.
     """
 
-    def __init__(self, side: float, unit: str = 'cm'):
+    __slots__ = ('__side',)
+
+    def __init__(self, side: float, unit: str = 'cm',
+                 position: Sequence[float] = None):
         """
         Конструктор класса Cube.
 
         :param side: Длина стороны куба
         :param unit: Единица измерения
+        :param position: Координаты вершины с наименьшими координатами (x, y, z)
         """
-        super().__init__(unit)
+        super().__init__(unit, position)
 
         if not isinstance(side, (int, float)):
             raise TypeError("Длина стороны должна быть числом.")
@@ -70,6 +74,44 @@ class Cube(ThreeDShape):
 
         self.__side = side
 
+    @classmethod
+    def _unchecked(cls, side: float, unit: str) -> 'Cube':
+        """
+        Создает куб без проверки аргументов.
+
+        :param side: Длина стороны куба
+        :param unit: Интернированная единица измерения
+        :return: Новый объект Cube
+        """
+        cube = cls.__new__(cls)
+        cube._init_unchecked(unit)
+        cube.__side = side
+        return cube
+
+    @classmethod
+    def from_arrays(cls, sides, unit: Union[str, Sequence[str]] = 'cm',
+                    trusted: bool = False) -> List['Cube']:
+        """
+        Создает кубы из массива сторон.
+
+        Все строки проверяются одной векторной операцией, и ошибка
+        перечисляет все некорректные строки, а не только первую.
+
+        :param sides: Длины сторон кубов
+        :param unit: Общая единица измерения или единица для каждой фигуры
+        :param trusted: Не проверять положительность размеров (для уже
+            проверенных данных, например из хранилища shapes.store)
+        :return: Список объектов Cube
+        """
+        sides = numeric_column(sides, "Длина стороны должна быть числом.")
+        if not trusted:
+            check_rows(~(sides > 0), "Длина стороны должна быть положительным числом")
+
+        unchecked = cls._unchecked
+        return [unchecked(side, unit) for side, unit in
+                zip(sides.tolist(), unit_column(unit, len(sides)))]
+
+    @cached_metric
     def volume(self) -> float:
         """
         Вычисляет объем куба.
@@ -80,6 +122,7 @@ class Cube(ThreeDShape):
         """
         return self.__side ** 3
 
+    @cached_metric
     def surface_area(self) -> float:
         """
         Вычисляет площадь поверхности куба.
@@ -108,7 +151,47 @@ class Cube(ThreeDShape):
             raise TypeError("Длина стороны должна быть числом.")
         if side <= 0:
             raise ValueError("Длина стороны должна быть положительным числом.")
+        changed = side != self.__side
         self.__side = side
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет ограничивающий параллелепипед, совпадающий с самим кубом.
+
+        :return: Кортеж ((x_min, y_min, z_min), (x_max, y_max, z_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y, z = self._require_position()
+        side = self.__side
+        return (x, y, z), (x + side, y + side, z + side)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает размеры куба.
+
+        :return: Кортеж (сторона,)
+        """
+        return (self.__side,)
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает длину ребра куба в порядке аргументов _unchecked.
+
+        :return: Кортеж (длина ребра,)
+        """
+        return (self.__side,)
+
+    def _scaled(self, factor: float, unit: str) -> 'Cube':
+        """
+        Создает куб с размерами, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новый куб
+        """
+        return self._unchecked(self.__side * factor, unit)
 
     def __str__(self) -> str:
         """
@@ -126,14 +209,18 @@ class Sphere(ThreeDShape):
     Класс для представления сферы.
     """
 
-    def __init__(self, radius: float, unit: str = 'cm'):
+    __slots__ = ('__radius',)
+
+    def __init__(self, radius: float, unit: str = 'cm',
+                 position: Sequence[float] = None):
         """
         Конструктор класса Sphere.
 
         :param radius: Радиус сферы
         :param unit: Единица измерения
+        :param position: Координаты центра (x, y, z)
         """
-        super().__init__(unit)
+        super().__init__(unit, position)
 
         if not isinstance(radius, (int, float)):
             raise TypeError("Радиус должен быть числом.")
@@ -142,6 +229,44 @@ class Sphere(ThreeDShape):
 
         self.__radius = radius
 
+    @classmethod
+    def _unchecked(cls, radius: float, unit: str) -> 'Sphere':
+        """
+        Создает сферу без проверки аргументов.
+
+        :param radius: Радиус сферы
+        :param unit: Интернированная единица измерения
+        :return: Новый объект Sphere
+        """
+        sphere = cls.__new__(cls)
+        sphere._init_unchecked(unit)
+        sphere.__radius = radius
+        return sphere
+
+    @classmethod
+    def from_arrays(cls, radii, unit: Union[str, Sequence[str]] = 'cm',
+                    trusted: bool = False) -> List['Sphere']:
+        """
+        Создает сферы из массива радиусов.
+
+        Все строки проверяются одной векторной операцией, и ошибка
+        перечисляет все некорректные строки, а не только первую.
+
+        :param radii: Радиусы сфер
+        :param unit: Общая единица измерения или единица для каждой фигуры
+        :param trusted: Не проверять положительность размеров (для уже
+            проверенных данных, например из хранилища shapes.store)
+        :return: Список объектов Sphere
+        """
+        radii = numeric_column(radii, "Радиус должен быть числом.")
+        if not trusted:
+            check_rows(~(radii > 0), "Радиус должен быть положительным числом")
+
+        unchecked = cls._unchecked
+        return [unchecked(radius, unit) for radius, unit in
+                zip(radii.tolist(), unit_column(unit, len(radii)))]
+
+    @cached_metric
     def volume(self) -> float:
         """
         Вычисляет объем сферы.
@@ -152,6 +277,7 @@ class Sphere(ThreeDShape):
         """
         return (4 / 3) * pi * self.__radius ** 3
 
+    @cached_metric
     def surface_area(self) -> float:
         """
         Вычисляет площадь поверхности сферы.
@@ -180,7 +306,47 @@ class Sphere(ThreeDShape):
             raise TypeError("Радиус должен быть числом.")
         if radius <= 0:
             raise ValueError("Радиус должен быть положительным числом.")
+        changed = radius != self.__radius
         self.__radius = radius
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет куб, описанный вокруг сферы.
+
+        :return: Кортеж ((x_min, y_min, z_min), (x_max, y_max, z_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y, z = self._require_position()
+        radius = self.__radius
+        return (x - radius, y - radius, z - radius), (x + radius, y + radius, z + radius)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает размеры сферы.
+
+        :return: Кортеж (радиус,)
+        """
+        return (self.__radius,)
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает радиус сферы в порядке аргументов _unchecked.
+
+        :return: Кортеж (радиус,)
+        """
+        return (self.__radius,)
+
+    def _scaled(self, factor: float, unit: str) -> 'Sphere':
+        """
+        Создает сферу с размерами, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новая сфера
+        """
+        return self._unchecked(self.__radius * factor, unit)
 
     def __str__(self) -> str:
         """
@@ -192,5 +358,256 @@ class Sphere(ThreeDShape):
                 f"volume={self.volume():.2f}{self.get_unit()}³, "
                 f"surface_area={self.surface_area():.2f}{self.get_unit()}²)")
 
+
+# Количество граней, обрабатываемых за один шаг векторных вычислений,
+# чтобы промежуточные массивы не превышали нескольких десятков мегабайт
+_FACE_CHUNK = 1 << 18
+
+
+def _triangles(vertices: np.ndarray, faces: np.ndarray):
+    """
+    Перебирает треугольники сетки порциями по _FACE_CHUNK граней.
+
+    :param vertices: Массив вершин формы (V, 3)
+    :param faces: Массив индексов вершин граней формы (F, 3)
+    :return: Генератор кортежей (a, b, c) массивов вершин граней формы (n, 3)
+    """
+    for start in range(0, len(faces), _FACE_CHUNK):
+        chunk = faces[start:start + _FACE_CHUNK]
+        yield vertices[chunk[:, 0]], vertices[chunk[:, 1]], vertices[chunk[:, 2]]
+
+
+def mesh_surface_area(vertices: np.ndarray, faces: np.ndarray) -> float:
+    """
+    Вычисляет площадь поверхности треугольной сетки.
+
+    Формула: Σ |(b - a) × (c - a)| / 2 по всем граням.
+
+    :param vertices: Массив вершин формы (V, 3)
+    :param faces: Массив индексов вершин граней формы (F, 3)
+    :return: Площадь поверхности
+    """
+    total = 0.0
+    for a, b, c in _triangles(vertices, faces):
+        cross = np.cross(b - a, c - a)
+        total += 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross)).sum()
+    return float(total)
+
+
+def mesh_signed_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
+    """
+    Вычисляет объем, ограниченный треугольной сеткой, как сумму
+    ориентированных объемов тетраэдров (начало координат, a, b, c).
+
+    Формула: Σ a · (b × c) / 6 по всем граням. Для замкнутой сетки
+    с гранями, ориентированными наружу, результат положителен.
+
+    :param vertices: Массив вершин формы (V, 3)
+    :param faces: Массив индексов вершин граней формы (F, 3)
+    :return: Ориентированный объем
+    """
+    total = 0.0
+    for a, b, c in _triangles(vertices, faces):
+        total += np.einsum('ij,ij->', a, np.cross(b, c))
+    return float(total) / 6
+
+
+class Mesh(ThreeDShape):
+    """
+    Класс для представления тела, заданного треугольной сеткой.
+
+    Вершины хранятся в непрерывном массиве float64 формы (V, 3), грани -
+    в массиве индексов вершин формы (F, 3). Объем вычисляется для
+    замкнутой сетки с согласованной ориентацией граней. Координаты вершин
+    задаются относительно положения фигуры (если оно задано).
+    """
+
+    __slots__ = ('__vertices', '__faces')
+
+    def __init__(self, vertices, faces, unit: str = 'cm',
+                 position: Sequence[float] = None):
+        """
+        Конструктор класса Mesh.
+
+        :param vertices: Вершины: последовательность троек (x, y, z) или массив (V, 3)
+        :param faces: Грани: последовательность троек индексов вершин или массив (F, 3)
+        :param unit: Единица измерения
+        :param position: Координаты начала системы координат вершин (x, y, z)
+        """
+        super().__init__(unit, position)
+        self.__vertices, self.__faces = self._geometry_arrays(vertices, faces)
+
+    @staticmethod
+    def _geometry_arrays(vertices, faces) -> tuple:
+        """
+        Проверяет вершины и грани и копирует их в массивы только для чтения.
+
+        :param vertices: Вершины сетки
+        :param faces: Грани сетки
+        :return: Кортеж (массив вершин (V, 3), массив граней (F, 3))
+        :raises TypeError: Если вершины или грани имеют неверный тип или форму
+        :raises ValueError: Если координаты не конечны, индексы граней вне
+            диапазона или площадь поверхности равна нулю
+        """
+        vertices = np.array(vertices)
+        faces = np.array(faces)
+        if vertices.dtype.kind not in 'biuf' or vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise TypeError("Вершины должны быть последовательностью троек чисел (x, y, z).")
+        if faces.dtype.kind not in 'iu' or faces.ndim != 2 or faces.shape[1] != 3:
+            raise TypeError("Грани должны быть последовательностью троек индексов вершин.")
+        if not len(faces):
+            raise ValueError("Сетка должна иметь хотя бы одну грань.")
+
+        vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        faces = np.ascontiguousarray(faces, dtype=np.intp)
+        if not np.isfinite(vertices).all():
+            raise ValueError("Координаты вершин должны быть конечными числами.")
+        if faces.min() < 0 or faces.max() >= len(vertices):
+            raise ValueError("Индексы вершин граней выходят за пределы списка вершин.")
+        if not mesh_surface_area(vertices, faces) > 0:
+            raise ValueError("Площадь поверхности сетки должна быть положительной.")
+
+        vertices.setflags(write=False)
+        faces.setflags(write=False)
+        return vertices, faces
+
+    @classmethod
+    def _unchecked(cls, vertices: np.ndarray, faces: np.ndarray, unit: str) -> 'Mesh':
+        """
+        Создает сетку без проверки аргументов.
+
+        :param vertices: Массив вершин формы (V, 3) только для чтения
+        :param faces: Массив граней формы (F, 3) только для чтения
+        :param unit: Интернированная единица измерения
+        :return: Новая сетка
+        """
+        mesh = cls.__new__(cls)
+        mesh._init_unchecked(unit)
+        mesh.__vertices = vertices
+        mesh.__faces = faces
+        return mesh
+
+    @cached_metric
+    def volume(self) -> float:
+        """
+        Вычисляет объем тела, ограниченного сеткой.
+
+        Формула: |Σ a · (b × c)| / 6 по всем граням (a, b, c)
+
+        :return: Объем тела
+        """
+        return abs(mesh_signed_volume(self.__vertices, self.__faces))
+
+    @cached_metric
+    def surface_area(self) -> float:
+        """
+        Вычисляет площадь поверхности сетки.
+
+        Формула: Σ |(b - a) × (c - a)| / 2 по всем граням (a, b, c)
+
+        :return: Площадь поверхности
+        """
+        return mesh_surface_area(self.__vertices, self.__faces)
+
+    def get_vertices(self) -> np.ndarray:
+        """
+        Возвращает вершины сетки.
+
+        :return: Массив формы (V, 3) только для чтения
+        """
+        return self.__vertices
+
+    def get_faces(self) -> np.ndarray:
+        """
+        Возвращает грани сетки.
+
+        :return: Массив индексов вершин формы (F, 3) только для чтения
+        """
+        return self.__faces
+
+    def get_face_count(self) -> int:
+        """
+        Возвращает количество граней сетки.
+
+        :return: Количество граней
+        """
+        return len(self.__faces)
+
+    def set_geometry(self, vertices, faces):
+        """
+        Устанавливает новые вершины и грани сетки.
+
+        :param vertices: Последовательность троек (x, y, z) или массив (V, 3)
+        :param faces: Последовательность троек индексов вершин или массив (F, 3)
+        """
+        vertices, faces = self._geometry_arrays(vertices, faces)
+        changed = not (np.array_equal(vertices, self.__vertices) and
+                       np.array_equal(faces, self.__faces))
+        self.__vertices, self.__faces = vertices, faces
+        if changed:
+            self._changed()
+
+    def bounding_box(self) -> tuple:
+        """
+        Вычисляет параллелепипед, описанный вокруг сетки.
+
+        :return: Кортеж ((x_min, y_min, z_min), (x_max, y_max, z_max))
+        :raises ValueError: Если положение фигуры не задано
+        """
+        x, y, z = self._require_position()
+        used = self.__vertices[np.unique(self.__faces)]
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = (used.min(axis=0).tolist(),
+                                                        used.max(axis=0).tolist())
+        return (x + x_min, y + y_min, z + z_min), (x + x_max, y + y_max, z + z_max)
+
+    def _dimensions(self) -> tuple:
+        """
+        Возвращает координаты вершин в порядке их индексов.
+
+        :return: Кортеж (x_1, y_1, z_1, x_2, ...)
+        """
+        return tuple(self.__vertices.ravel().tolist())
+
+    def geometry_key(self, tolerance: float = 1e-9) -> tuple:
+        """
+        Возвращает ключ геометрической идентичности сетки: тип, координаты
+        вершин в метрах с точностью tolerance и индексы вершин граней.
+
+        :param tolerance: Точность сравнения координат в метрах
+        :return: Кортеж (название типа, координаты..., индексы...)
+        :raises ValueError: Если единица измерения фигуры неизвестна
+        """
+        return super().geometry_key(tolerance) + tuple(self.__faces.ravel().tolist())
+
+    def _arguments(self) -> tuple:
+        """
+        Возвращает вершины и грани сетки в порядке аргументов _unchecked.
+
+        :return: Кортеж (массив вершин, массив граней)
+        """
+        return (self.__vertices, self.__faces)
+
+    def _scaled(self, factor: float, unit: str) -> 'Mesh':
+        """
+        Создает сетку с координатами вершин, умноженными на factor.
+
+        :param factor: Коэффициент масштабирования
+        :param unit: Интернированная единица измерения
+        :return: Новая сетка
+        """
+        vertices = self.__vertices * factor
+        vertices.setflags(write=False)
+        return self._unchecked(vertices, self.__faces, unit)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта Mesh.
+
+        :return: Строковое представление сетки
+        """
+        return (f"Mesh(faces={len(self.__faces)}, "
+                f"volume={self.volume():.2f}{self.get_unit()}³, "
+                f"surface_area={self.surface_area():.2f}{self.get_unit()}²)")
+
 if __name__ == '__main__':
     ...
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Потоковая оценка квантилей (скетч KLL).
+
+Скетч хранит не все значения, а несколько уровней выборок: значение
+на уровне h представляет 2**h исходных значений. Когда уровень
+переполняется, он сортируется и на следующий уровень переносится
+каждое второе значение. Память ограничена O(k log(n / k)) значений,
+ошибка ранга квантиля - порядка 1 / k от количества значений.
+
+Скетчи объединяются (merge) без потери точности оценки, поэтому
+частичные результаты процессов можно складывать. Метод to_bytes
+сохраняет скетч в двоичном формате (все числа little-endian):
+
+- заголовок, 34 байта:
+    - сигнатура b'QSKT' (4 байта);
+    - версия формата, uint8 (сейчас 1);
+    - состояние чередования сжатий, uint8 (0 или 1);
+    - параметр точности k, uint16;
+    - количество добавленных значений, uint64;
+    - минимум и максимум, float64;
+    - количество уровней, uint16;
+- размеры уровней, uint32 на уровень;
+- значения уровней подряд, начиная с нулевого, float64.
+"""
+
+import struct
+from math import ceil
+from typing import Iterable, Sequence, Union
+
+import numpy as np
+
+MAGIC = b'QSKT'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBBHQddH')
+
+
+class QuantileSketch:
+    """
+    Объединяемый скетч квантилей KLL.
+
+    Значения добавляются по одному (add) или массивом (add_array);
+    значения NaN пропускаются. Минимум, максимум и количество значений
+    хранятся точно.
+    """
+
+    __slots__ = ('__k', '__levels', '__pending', '__count',
+                 '__minimum', '__maximum', '__coin')
+
+    def __init__(self, k: int = 200):
+        """
+        Конструктор класса QuantileSketch.
+
+        :param k: Параметр точности (размер верхнего уровня), от 8 до 65535
+        :raises ValueError: Если k вне допустимого диапазона
+        """
+        if not isinstance(k, int) or not 8 <= k <= 0xFFFF:
+            raise ValueError("Параметр точности k должен быть целым числом от 8 до 65535.")
+        self.__k = k
+        self.__levels = [np.empty(0)]
+        self.__pending = []
+        self.__count = 0
+        self.__minimum = float('inf')
+        self.__maximum = float('-inf')
+        self.__coin = 0
+
+    def _capacity(self, level: int) -> int:
+        """
+        Возвращает емкость уровня: верхний уровень вмещает k значений,
+        каждый следующий вниз - в полтора раза меньше.
+
+        :param level: Номер уровня
+        :return: Максимальное количество значений на уровне
+        """
+        depth = len(self.__levels) - level - 1
+        return max(2, int(ceil(self.__k * (2 / 3) ** depth)))
+
+    def _flush(self):
+        """
+        Переносит значения, добавленные по одному, на нулевой уровень.
+        """
+        if self.__pending:
+            pending = np.array(self.__pending, dtype=np.float64)
+            self.__pending = []
+            self._insert(pending)
+
+    def _insert(self, values: np.ndarray):
+        """
+        Добавляет значения без NaN на нулевой уровень и сжимает скетч.
+
+        :param values: Массив float64
+        """
+        if not len(values):
+            return
+        self.__count += len(values)
+        self.__minimum = min(self.__minimum, float(values.min()))
+        self.__maximum = max(self.__maximum, float(values.max()))
+        self.__levels[0] = np.concatenate([self.__levels[0], values])
+        self._compress()
+
+    def _compress(self):
+        """
+        Сжимает переполненные уровни, начиная с нижнего.
+
+        Из отсортированного уровня на следующий переносится каждое второе
+        значение (четные и нечетные позиции чередуются между сжатиями),
+        при нечетном размере наибольшее значение остается на уровне.
+        """
+        levels = self.__levels
+        level = 0
+        while level < len(levels):
+            if len(levels[level]) <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(levels):
+                levels.append(np.empty(0))
+            values = np.sort(levels[level])
+            kept = len(values) % 2
+            promoted = values[self.__coin:len(values) - kept:2]
+            self.__coin ^= 1
+            levels[level] = values[len(values) - kept:]
+            levels[level + 1] = np.concatenate([levels[level + 1], promoted])
+            # Емкость уровней зависит от их количества, поэтому проверка
+            # начинается заново
+            level = 0
+
+    def add(self, value: float):
+        """
+        Добавляет одно значение.
+
+        :param value: Значение (NaN пропускается)
+        """
+        if value == value:
+            self.__pending.append(value)
+            if len(self.__pending) >= self.__k:
+                self._flush()
+
+    def add_array(self, values: Union[Sequence[float], np.ndarray]):
+        """
+        Добавляет массив значений одной векторной операцией.
+
+        :param values: Последовательность или массив чисел (NaN пропускаются)
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._flush()
+        self._insert(values[~np.isnan(values)])
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Добавляет значения другого скетча.
+
+        Уровни складываются поэлементно, после чего скетч сжимается
+        с собственным параметром точности.
+
+        :param other: Другой скетч
+        """
+        self._flush()
+        other._flush()
+        if not other.get_count():
+            return
+        levels = self.__levels
+        for level, values in enumerate(other.__levels):
+            if level == len(levels):
+                levels.append(np.empty(0))
+            levels[level] = np.concatenate([levels[level], values])
+        self.__count += other.get_count()
+        self.__minimum = min(self.__minimum, other.get_min())
+        self.__maximum = max(self.__maximum, other.get_max())
+        self._compress()
+
+    def get_k(self) -> int:
+        """
+        Возвращает параметр точности.
+
+        :return: Параметр k
+        """
+        return self.__k
+
+    def get_count(self) -> int:
+        """
+        Возвращает количество добавленных значений.
+
+        :return: Количество значений
+        """
+        return self.__count + len(self.__pending)
+
+    def get_min(self) -> float:
+        """
+        Возвращает минимальное значение.
+
+        :return: Минимум (inf, если значений нет)
+        """
+        self._flush()
+        return self.__minimum
+
+    def get_max(self) -> float:
+        """
+        Возвращает максимальное значение.
+
+        :return: Максимум (-inf, если значений нет)
+        """
+        self._flush()
+        return self.__maximum
+
+    def get_retained(self) -> int:
+        """
+        Возвращает количество значений, хранимых скетчем.
+
+        :return: Количество хранимых значений
+        """
+        self._flush()
+        return sum(len(values) for values in self.__levels)
+
+    def quantiles(self, fractions: Iterable[float]) -> np.ndarray:
+        """
+        Оценивает несколько квантилей за одну сортировку.
+
+        :param fractions: Доли от 0 до 1 (0.5 - медиана, 0.99 - p99)
+        :return: Массив оценок (NaN, если значений нет)
+        :raises ValueError: Если доля вне диапазона [0, 1]
+        """
+        fractions = np.asarray(list(fractions), dtype=np.float64)
+        if ((fractions < 0) | (fractions > 1)).any():
+            raise ValueError("Доля квантиля должна быть в диапазоне от 0 до 1.")
+        self._flush()
+        if not self.__count:
+            return np.full(len(fractions), np.nan)
+
+        values = np.concatenate(self.__levels)
+        weights = np.concatenate([np.full(len(level), 1 << number, dtype=np.int64)
+                                  for number, level in enumerate(self.__levels)])
+        order = np.argsort(values, kind='stable')
+        ranks = np.cumsum(weights[order])
+        indices = np.searchsorted(ranks, fractions * self.__count, side='left')
+        result = values[order][np.minimum(indices, len(values) - 1)]
+        result[fractions == 0] = self.__minimum
+        result[fractions == 1] = self.__maximum
+        return result
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Оценивает квантиль.
+
+        :param fraction: Доля от 0 до 1 (0.5 - медиана, 0.99 - p99)
+        :return: Оценка квантиля (NaN, если значений нет)
+        :raises ValueError: Если доля вне диапазона [0, 1]
+        """
+        return float(self.quantiles([fraction])[0])
+
+    def to_bytes(self) -> bytes:
+        """
+        Сохраняет скетч в двоичном формате, описанном в документации модуля.
+
+        :return: Буфер байтов
+        """
+        self._flush()
+        levels = self.__levels
+        return b''.join([
+            HEADER.pack(MAGIC, VERSION, self.__coin, self.__k, self.__count,
+                        self.__minimum, self.__maximum, len(levels)),
+            np.array([len(values) for values in levels], dtype='<u4').tobytes(),
+            *(values.astype('<f8', copy=False).tobytes() for values in levels),
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> 'QuantileSketch':
+        """
+        Восстанавливает скетч из буфера, созданного to_bytes.
+
+        :param data: Буфер байтов
+        :return: Скетч
+        :raises ValueError: Если буфер поврежден
+        """
+        data = memoryview(data).cast('B')
+        if len(data) < HEADER.size:
+            raise ValueError("Буфер не содержит скетч: слишком короткий заголовок.")
+        magic, version, coin, k, count, minimum, maximum, level_count = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Буфер не содержит скетч: неверная сигнатура.")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия формата скетча: {version}")
+
+        offset = HEADER.size + 4 * level_count
+        if level_count < 1 or len(data) < offset:
+            raise ValueError("Буфер поврежден: некорректная таблица уровней.")
+        sizes = np.frombuffer(data, dtype='<u4', count=level_count, offset=HEADER.size)
+        if len(data) != offset + 8 * int(sizes.sum()):
+            raise ValueError("Буфер поврежден: неверный размер данных уровней.")
+
+        levels = []
+        for size in sizes.tolist():
+            levels.append(np.frombuffer(data, dtype='<f8', count=size,
+                                        offset=offset).astype(np.float64))
+            offset += 8 * size
+        if sum(len(values) << number for number, values in enumerate(levels)) != count:
+            raise ValueError("Буфер поврежден: веса уровней не совпадают с количеством.")
+
+        sketch = cls(k)
+        sketch.__levels = levels
+        sketch.__count = count
+        sketch.__minimum = minimum
+        sketch.__maximum = maximum
+        sketch.__coin = coin & 1
+        return sketch
+
+    def __reduce__(self) -> tuple:
+        """
+        Возвращает представление скетча для pickle в формате to_bytes.
+
+        :return: Кортеж (функция восстановления, ее аргументы)
+        """
+        return self.from_bytes, (self.to_bytes(),)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление объекта QuantileSketch.
+
+        :return: Строковое представление скетча
+        """
+        return (f"QuantileSketch(k={self.__k}, count={self.get_count()}, "
+                f"retained={self.get_retained()})")
+
+if __name__ == '__main__':
+    ...
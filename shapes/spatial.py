@@ -0,0 +1,375 @@
+"""
+Пространственный индекс размещенных фигур на равномерной сетке.
+"""
+
+import heapq
+from collections import defaultdict
+from itertools import combinations, product
+from math import floor, prod, sqrt
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from shapes.shapes2d import Shape, Circle
+from shapes.shapes3d import ThreeDShape, Sphere
+
+_BOX = 0
+_BALL = 1
+
+
+def _geometry(shape: Union[Shape, ThreeDShape]) -> tuple:
+    """
+    Возвращает описание геометрии фигуры для точных проверок.
+
+    Круги и сферы описываются центром и радиусом, остальные фигуры -
+    ограничивающим прямоугольником (параллелепипедом).
+
+    :param shape: Размещенная фигура
+    :return: (_BALL, центр, радиус) или (_BOX, минимум, максимум)
+    """
+    if isinstance(shape, (Circle, Sphere)):
+        return _BALL, shape.get_position(), shape.get_radius()
+    low, high = shape.bounding_box()
+    return _BOX, low, high
+
+
+def _box_distance(point: Sequence[float], low: Sequence[float],
+                  high: Sequence[float]) -> float:
+    """
+    Вычисляет расстояние от точки до прямоугольной области [low, high].
+
+    :param point: Координаты точки
+    :param low: Минимальные координаты области
+    :param high: Максимальные координаты области
+    :return: Расстояние (0, если точка внутри области)
+    """
+    return sqrt(sum(max(l - p, 0.0, p - h) ** 2 for p, l, h in zip(point, low, high)))
+
+
+def _distance(point: Sequence[float], geometry: tuple) -> float:
+    """
+    Вычисляет расстояние от точки до фигуры.
+
+    :param point: Координаты точки
+    :param geometry: Геометрия фигуры, созданная _geometry
+    :return: Расстояние (0, если точка внутри фигуры)
+    """
+    kind, first, second = geometry
+    if kind == _BALL:
+        return max(0.0, sqrt(sum((p - c) ** 2 for p, c in zip(point, first))) - second)
+    return _box_distance(point, first, second)
+
+
+def _touches_window(geometry: tuple, low: Sequence[float], high: Sequence[float]) -> bool:
+    """
+    Проверяет, имеет ли фигура общие точки с окном [low, high].
+
+    :param geometry: Геометрия фигуры, созданная _geometry
+    :param low: Минимальные координаты окна
+    :param high: Максимальные координаты окна
+    :return: True, если фигура касается окна или пересекает его
+    """
+    kind, first, second = geometry
+    if kind == _BALL:
+        return _box_distance(first, low, high) <= second
+    return all(l1 <= h2 and l2 <= h1 for l1, h1, l2, h2 in zip(first, second, low, high))
+
+
+def _overlap(first: tuple, second: tuple) -> bool:
+    """
+    Проверяет, пересекаются ли две фигуры по области ненулевой меры
+    (касание границами пересечением не считается).
+
+    :param first: Геометрия первой фигуры, созданная _geometry
+    :param second: Геометрия второй фигуры, созданная _geometry
+    :return: True, если фигуры пересекаются
+    """
+    if first[0] == _BOX and second[0] == _BOX:
+        return all(l1 < h2 and l2 < h1 for l1, h1, l2, h2 in
+                   zip(first[1], first[2], second[1], second[2]))
+    if first[0] == _BALL and second[0] == _BALL:
+        return sqrt(sum((a - b) ** 2 for a, b in zip(first[1], second[1]))) < first[2] + second[2]
+    ball, box = (first, second) if first[0] == _BALL else (second, first)
+    return _box_distance(ball[1], box[1], box[2]) < ball[2]
+
+
+class SpatialIndex:
+    """
+    Пространственный индекс фигур на равномерной сетке ячеек.
+
+    Каждая размещенная фигура регистрируется во всех ячейках, которые
+    пересекает ее ограничивающий прямоугольник (параллелепипед). Запросы
+    просматривают только ячейки рядом с областью запроса, поэтому при
+    размере ячейки порядка размера фигур они выполняются за время,
+    близкое к линейному по размеру ответа.
+
+    Индекс подписывается на изменения фигур: при перемещении (set_position)
+    или изменении размеров фигура перерегистрируется в нужных ячейках.
+    Фигуры без положения хранятся в индексе, но в запросах не участвуют.
+    """
+
+    def __init__(self, cell_size: float, dimensions: int = 2):
+        """
+        Конструктор класса SpatialIndex.
+
+        :param cell_size: Размер ячейки сетки
+        :param dimensions: Размерность пространства: 2 для Shape, 3 для ThreeDShape
+        """
+        if not isinstance(cell_size, (int, float)):
+            raise TypeError("Размер ячейки должен быть числом.")
+        if cell_size <= 0:
+            raise ValueError("Размер ячейки должен быть положительным числом.")
+        if dimensions not in (2, 3):
+            raise ValueError("Размерность пространства должна быть равна 2 или 3.")
+
+        self.__cell_size = cell_size
+        self.__dimensions = dimensions
+        self.__base = Shape if dimensions == 2 else ThreeDShape
+        self.__cells: Dict[tuple, Dict[int, None]] = defaultdict(dict)
+        # id фигуры: [фигура, порядковый номер, геометрия, ячейки]
+        self.__entries: Dict[int, list] = {}
+        self.__counter = 0
+        # Границы занятых ячеек (только расширяются, пока индекс не опустеет)
+        self.__extent: Optional[Tuple[list, list]] = None
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, shape) -> bool:
+        return id(shape) in self.__entries
+
+    def _cell(self, point: Sequence[float]) -> tuple:
+        """
+        Определяет ячейку сетки, в которой лежит точка.
+
+        :param point: Координаты точки
+        :return: Кортеж номеров ячейки по осям
+        """
+        return tuple(floor(value / self.__cell_size) for value in point)
+
+    def _cells_of(self, shape) -> Tuple[tuple, list]:
+        """
+        Вычисляет геометрию фигуры и ячейки, которые она занимает.
+
+        :param shape: Фигура индекса
+        :return: Кортеж (геометрия или None, список ячеек)
+        """
+        if shape.get_position() is None:
+            return None, []
+        geometry = _geometry(shape)
+        low, high = shape.bounding_box()
+        ranges = [range(first, last + 1) for first, last in
+                  zip(self._cell(low), self._cell(high))]
+        return geometry, list(product(*ranges))
+
+    def insert(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Добавляет фигуру в индекс.
+
+        :param shape: Фигура подходящей размерности
+        :raises TypeError: Если фигура не подходит индексу по размерности
+        """
+        if not isinstance(shape, self.__base):
+            raise TypeError(f"Индекс размерности {self.__dimensions} "
+                            f"не принимает фигуру {shape.__class__.__name__}.")
+        key = id(shape)
+        if key in self.__entries:
+            return
+
+        geometry, cells = self._cells_of(shape)
+        self.__entries[key] = [shape, self.__counter, geometry, cells]
+        self.__counter += 1
+        for cell in cells:
+            self.__cells[cell][key] = None
+        self._extend(cells)
+        shape._add_observer(self._on_change)
+
+    def remove(self, shape: Union[Shape, ThreeDShape]):
+        """
+        Удаляет фигуру из индекса.
+
+        :param shape: Ранее добавленная фигура
+        :raises KeyError: Если фигуры нет в индексе
+        """
+        key = id(shape)
+        entry = self.__entries.pop(key)
+        self._unregister(key, entry[3])
+        if not self.__cells:
+            self.__extent = None
+        shape._remove_observer(self._on_change)
+
+    def _extend(self, cells: list):
+        """
+        Расширяет границы занятых ячеек.
+
+        :param cells: Ячейки, в которых зарегистрирована фигура
+        """
+        if not cells:
+            return
+        if self.__extent is None:
+            self.__extent = (list(cells[0]), list(cells[0]))
+        low, high = self.__extent
+        for axis in range(self.__dimensions):
+            low[axis] = min(low[axis], min(cell[axis] for cell in cells))
+            high[axis] = max(high[axis], max(cell[axis] for cell in cells))
+
+    def _unregister(self, key: int, cells: list):
+        """
+        Удаляет фигуру из ячеек и освобождает опустевшие ячейки.
+
+        :param key: id фигуры
+        :param cells: Ячейки, из которых удаляется фигура
+        """
+        for cell in cells:
+            members = self.__cells[cell]
+            del members[key]
+            if not members:
+                del self.__cells[cell]
+
+    def _on_change(self, shape):
+        """
+        Перерегистрирует фигуру после ее перемещения или изменения размеров.
+
+        :param shape: Измененная фигура
+        """
+        key = id(shape)
+        entry = self.__entries[key]
+        geometry, cells = self._cells_of(shape)
+        old, new = set(entry[3]), set(cells)
+        self._unregister(key, old - new)
+        for cell in new - old:
+            self.__cells[cell][key] = None
+        self._extend(cells)
+        entry[2], entry[3] = geometry, cells
+
+    def _members(self, cells) -> List[list]:
+        """
+        Возвращает записи фигур из заданных ячеек без повторов,
+        в порядке добавления фигур в индекс.
+
+        :param cells: Ячейки сетки
+        :return: Список записей [фигура, номер, геометрия, ячейки]
+        """
+        keys = {}
+        for cell in cells:
+            members = self.__cells.get(cell)
+            if members:
+                keys.update(members)
+        entries = [self.__entries[key] for key in keys]
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+
+    def query_window(self, low: Sequence[float],
+                     high: Sequence[float]) -> List[Union[Shape, ThreeDShape]]:
+        """
+        Находит фигуры, имеющие общие точки с окном [low, high].
+
+        :param low: Минимальные координаты окна
+        :param high: Максимальные координаты окна
+        :return: Фигуры в порядке добавления в индекс
+        """
+        if len(low) != self.__dimensions or len(high) != self.__dimensions:
+            raise ValueError(f"Окно должно задаваться {self.__dimensions} координатами.")
+        ranges = [range(first, last + 1) for first, last in
+                  zip(self._cell(low), self._cell(high))]
+        cells = product(*ranges)
+        if len(self.__cells) < prod(map(len, ranges)):
+            cells = [cell for cell in self.__cells
+                     if all(first.start <= index < first.stop
+                            for first, index in zip(ranges, cell))]
+        return [entry[0] for entry in self._members(cells)
+                if _touches_window(entry[2], low, high)]
+
+    def _ring(self, center: tuple, radius: int) -> list:
+        """
+        Возвращает ячейки на расстоянии radius (по Чебышеву) от ячейки center.
+
+        :param center: Индексы центральной ячейки
+        :param radius: Расстояние в ячейках
+        :return: Список ячеек кольца
+        """
+        ranges = [range(index - radius, index + radius + 1) for index in center]
+        return [cell for cell in product(*ranges)
+                if max(abs(a - b) for a, b in zip(cell, center)) == radius]
+
+    def nearest(self, point: Sequence[float], k: int = 1) -> List[Union[Shape, ThreeDShape]]:
+        """
+        Находит k фигур, ближайших к точке.
+
+        Расстояние до фигуры, содержащей точку, равно нулю. Ячейки
+        просматриваются кольцами вокруг точки, начиная с первого кольца,
+        задевающего занятые ячейки, пока оставшиеся кольца не могут
+        содержать более близких фигур. Когда кольцо становится больше
+        количества занятых ячеек, оставшиеся фигуры проверяются одним
+        проходом, поэтому время запроса не зависит от удаленности точки.
+
+        :param point: Координаты точки
+        :param k: Количество фигур
+        :return: Фигуры по возрастанию расстояния
+        """
+        if len(point) != self.__dimensions:
+            raise ValueError(f"Точка должна задаваться {self.__dimensions} координатами.")
+        if k <= 0:
+            return []
+
+        center = self._cell(point)
+        placed = sum(1 for entry in self.__entries.values() if entry[2] is not None)
+        best = []  # куча (-расстояние, -номер, фигура)
+        seen = set()
+
+        def consider(entry):
+            seen.add(entry[1])
+            item = (-_distance(point, entry[2]), -entry[1], entry[0])
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item[:2] > best[0][:2]:
+                heapq.heapreplace(best, item)
+
+        # Кольца ближе границ занятых ячеек пусты
+        radius = 0
+        if self.__extent is not None:
+            low, high = self.__extent
+            radius = max(max(first - index, index - last, 0)
+                         for index, first, last in zip(center, low, high))
+
+        while len(seen) < placed:
+            if (2 * radius + 1) ** self.__dimensions > len(self.__cells):
+                for entry in sorted(self.__entries.values(), key=lambda entry: entry[1]):
+                    if entry[2] is not None and entry[1] not in seen:
+                        consider(entry)
+                break
+
+            for entry in self._members(self._ring(center, radius)):
+                if entry[1] not in seen:
+                    consider(entry)
+
+            # Непросмотренные ячейки не ближе radius * cell_size от точки
+            if len(best) == k and -best[0][0] <= radius * self.__cell_size:
+                break
+            radius += 1
+
+        return [shape for _, _, shape in sorted(best, key=lambda item: (-item[0], -item[1]))]
+
+    def overlapping_pairs(self) -> List[tuple]:
+        """
+        Находит все пары пересекающихся фигур.
+
+        Проверяются только фигуры из общих ячеек сетки, а не все пары.
+
+        :return: Пары фигур в порядке добавления в индекс
+        """
+        pairs = {}
+        for members in self.__cells.values():
+            if len(members) < 2:
+                continue
+            entries = sorted((self.__entries[key] for key in members),
+                             key=lambda entry: entry[1])
+            for first, second in combinations(entries, 2):
+                key = (first[1], second[1])
+                if key not in pairs and _overlap(first[2], second[2]):
+                    pairs[key] = (first[0], second[0])
+                elif key not in pairs:
+                    pairs[key] = None
+        return [pair for _, pair in sorted(pairs.items()) if pair is not None]
+
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,188 @@
+"""
+Двоичное хранилище фигур с записями фиксированного размера.
+
+Формат файла (все числа little-endian):
+
+- заголовок, 32 байта:
+    - сигнатура b'SHPSTORE' (8 байт);
+    - версия формата, uint32 (сейчас 1);
+    - количество единиц измерения, uint32;
+    - количество записей, uint64;
+    - смещение таблицы единиц измерения, uint64;
+- записи фигур по 24 байта, начиная со смещения 32:
+    - код типа фигуры (коды ShapeBatch), uint8;
+    - код единицы измерения (индекс в таблице единиц), uint8;
+    - 6 байт выравнивания;
+    - первый размер, float64;
+    - второй размер, float64;
+- таблица единиц измерения: для каждой единицы длина в байтах (uint8)
+  и название в UTF-8.
+
+Чтение отображает файл в память (mmap): столбцы ShapeBatch являются
+представлениями записей файла без копирования.
+"""
+
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
+
+MAGIC = b'SHPSTORE'
+VERSION = 1
+
+# Расширение файлов хранилища
+STORE_SUFFIX = '.shapes'
+
+HEADER = struct.Struct('<8sIIQQ')
+
+RECORD_DTYPE = np.dtype({
+    'names': ['kind', 'unit', 'dim1', 'dim2'],
+    'formats': ['u1', 'u1', '<f8', '<f8'],
+    'offsets': [0, 1, 8, 16],
+    'itemsize': 24,
+})
+
+
+def write_store(path: Union[str, Path],
+                batches: Union[ShapeBatch, Iterable[ShapeBatch]]) -> int:
+    """
+    Записывает фигуры в двоичное хранилище.
+
+    Наборы записываются по очереди, поэтому можно передать генератор
+    (например, shapes.ingest.iter_batches) и не держать все фигуры в памяти.
+
+    :param path: Путь к файлу хранилища
+    :param batches: Набор фигур или последовательность наборов
+    :return: Количество записанных фигур
+    :raises ValueError: Если в данных более 256 различных единиц измерения
+    """
+    if isinstance(batches, ShapeBatch):
+        batches = [batches]
+
+    units: Dict[str, int] = {}
+    count = 0
+
+    with open(path, 'wb') as file:
+        file.write(bytes(HEADER.size))
+
+        for batch in batches:
+            # Перекодируем единицы набора в единицы всего хранилища
+            mapping = np.array([units.setdefault(unit, len(units))
+                                for unit in batch.get_units()], dtype=np.intp)
+            if len(units) > 256:
+                raise ValueError("Хранилище поддерживает не более 256 единиц измерения.")
+
+            records = np.zeros(len(batch), dtype=RECORD_DTYPE)
+            records['kind'] = batch.get_kinds()
+            if len(batch):
+                records['unit'] = mapping[batch.get_unit_codes()]
+            records['dim1'], records['dim2'] = batch.get_dimensions()
+            file.write(records.tobytes())
+            count += len(batch)
+
+        units_offset = file.tell()
+        for unit in units:
+            encoded = unit.encode('utf-8')
+            if len(encoded) > 255:
+                raise ValueError(f"Слишком длинное название единицы измерения: {unit}")
+            file.write(bytes([len(encoded)]) + encoded)
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, len(units), count, units_offset))
+
+    return count
+
+
+def _read_header(file, path) -> tuple:
+    """
+    Читает и проверяет заголовок хранилища.
+
+    :param file: Файл, открытый в двоичном режиме
+    :param path: Путь к файлу (для текста ошибок)
+    :return: Кортеж (количество единиц, количество записей, смещение таблицы единиц)
+    :raises ValueError: Если файл не является хранилищем фигур
+    """
+    header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"Файл не является хранилищем фигур: {path}")
+    magic, version, unit_count, count, units_offset = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Файл не является хранилищем фигур: {path}")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия хранилища: {version}")
+    return unit_count, count, units_offset
+
+
+def open_store(path: Union[str, Path], trusted: bool = False) -> ShapeBatch:
+    """
+    Открывает двоичное хранилище фигур через отображение файла в память.
+
+    Данные не копируются и не разбираются: столбцы возвращаемого набора
+    ссылаются на записи файла и загружаются с диска по мере обращения.
+    По умолчанию записи проверяются одним векторным проходом; для файлов,
+    записанных write_store из проверенных данных, проверку можно отключить.
+
+    :param path: Путь к файлу хранилища
+    :param trusted: Не проверять записи
+    :return: Набор фигур (только для чтения)
+    :raises ValueError: Если файл не является хранилищем фигур
+        или содержит некорректные записи
+    """
+    with open(path, 'rb') as file:
+        unit_count, count, units_offset = _read_header(file, path)
+        file.seek(units_offset)
+        units = []
+        for _ in range(unit_count):
+            length = file.read(1)[0]
+            units.append(file.read(length).decode('utf-8'))
+
+    if count:
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode='r',
+                            offset=HEADER.size, shape=(count,))
+    else:
+        records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    return ShapeBatch.from_arrays(records['kind'], records['dim1'], records['dim2'],
+                                  records['unit'], units, trusted=trusted)
+
+
+def iter_store_batches(path: Union[str, Path], chunk_size: int = 65536,
+                       start: int = 0, stop: Optional[int] = None,
+                       trusted: bool = False) -> Iterator[ShapeBatch]:
+    """
+    Читает хранилище порциями без копирования данных.
+
+    :param path: Путь к файлу хранилища
+    :param chunk_size: Максимальное количество фигур в одном наборе
+    :param start: Номер первой читаемой записи
+    :param stop: Номер записи, на которой чтение заканчивается (None - до конца)
+    :param trusted: Не проверять записи
+    :return: Генератор наборов фигур
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом.")
+
+    batch = open_store(path, trusted=True)
+    stop = len(batch) if stop is None else min(stop, len(batch))
+    for offset in range(start, stop, chunk_size):
+        chunk = batch.take(slice(offset, min(offset + chunk_size, stop)))
+        if not trusted:
+            chunk.validate()
+        yield chunk
+
+
+def store_size(path: Union[str, Path]) -> int:
+    """
+    Возвращает количество фигур в хранилище по его заголовку.
+
+    :param path: Путь к файлу хранилища
+    :return: Количество записей
+    """
+    with open(path, 'rb') as file:
+        return _read_header(file, path)[1]
+
+if __name__ == '__main__':
+    ...
@@ -0,0 +1,256 @@
+"""
+Единицы измерения длины и коэффициенты перевода между ними.
+"""
+
+from sys import intern
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# Коэффициенты перевода в метры
+UNIT_FACTORS = {
+    'mm': 0.001,  # миллиметры в метры
+    'cm': 0.01,  # сантиметры в метры
+    'dm': 0.1,  # дециметры в метры
+    'm': 1.0,  # метры
+    'km': 1000.0,  # километры в метры
+}
+
+# Английские единицы длины в метрах
+IMPERIAL_FACTORS = {
+    'in': 0.0254,  # дюймы в метры
+    'ft': 0.3048,  # футы в метры
+    'yd': 0.9144,  # ярды в метры
+    'mi': 1609.344,  # мили в метры
+}
+
+
+class UnitRegistry:
+    """
+    Реестр единиц измерения длины с предвычисленными коэффициентами.
+
+    Каждой единице присваивается целочисленный код. Для всех пар единиц
+    заранее вычисляются коэффициенты перевода длины, площади (квадраты
+    коэффициентов) и объема (кубы коэффициентов), поэтому перевод
+    сводится к поиску кода в словаре и обращению к матрице.
+
+    Поиск единицы не учитывает регистр: вариант написания, найденный
+    через lower(), запоминается, и повторные обращения выполняются
+    одним поиском в словаре.
+    """
+
+    def __init__(self, factors: Dict[str, float]):
+        """
+        Конструктор класса UnitRegistry.
+
+        :param factors: Словарь {единица: длина единицы в метрах}
+        """
+        self.__units: List[str] = []
+        self.__factors: List[float] = []
+        self.__codes: Dict[str, int] = {}
+        self.__matrices = ()
+        for unit, factor in factors.items():
+            self._add(unit, factor)
+        self._build()
+
+    def _add(self, unit: str, factor: float):
+        """
+        Добавляет единицу в списки реестра без пересчета матриц.
+
+        :param unit: Название единицы измерения
+        :param factor: Длина единицы в метрах
+        :raises TypeError: Если название не является непустой строкой
+        :raises ValueError: Если коэффициент не положительный, единица уже
+            зарегистрирована или реестр заполнен
+        """
+        if not isinstance(unit, str) or not unit:
+            raise TypeError("Единица измерения должна быть непустой строкой.")
+        if not isinstance(factor, (int, float)) or factor <= 0:
+            raise ValueError("Коэффициент перевода должен быть положительным числом.")
+        if unit.lower() in self.__units:
+            raise ValueError(f"Единица измерения уже зарегистрирована: {unit}")
+        if len(self.__units) >= 256:
+            raise ValueError("Реестр поддерживает не более 256 единиц измерения.")
+        unit = intern(unit.lower())
+        self.__codes[unit] = len(self.__units)
+        self.__units.append(unit)
+        self.__factors.append(float(factor))
+
+    def _build(self):
+        """
+        Вычисляет матрицы коэффициентов перевода длины, площади и объема.
+        """
+        factors = np.array(self.__factors)
+        linear = factors[:, np.newaxis] / factors[np.newaxis, :]
+        matrices = (linear, linear ** 2, linear ** 3)
+        for matrix in matrices:
+            matrix.setflags(write=False)
+        self.__matrices = matrices
+
+    def register(self, unit: str, factor: float) -> int:
+        """
+        Добавляет единицу измерения в реестр.
+
+        :param unit: Название единицы
+        :param factor: Длина единицы в метрах
+        :return: Код новой единицы
+        :raises ValueError: Если единица уже зарегистрирована
+        """
+        self._add(unit, factor)
+        self._build()
+        return self.__codes[unit.lower()]
+
+    def code(self, unit: str) -> int:
+        """
+        Возвращает код единицы измерения (без учета регистра).
+
+        :param unit: Единица измерения
+        :return: Код единицы или -1, если единица неизвестна
+        """
+        code = self.__codes.get(unit)
+        if code is None:
+            code = self.__codes.get(unit.lower(), -1)
+            if code >= 0:
+                self.__codes[intern(unit)] = code
+        return code
+
+    def codes(self, units: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+        """
+        Возвращает коды для последовательности единиц измерения.
+
+        Каждая уникальная строка ищется в реестре только один раз.
+
+        :param units: Последовательность единиц измерения
+        :return: Массив кодов (-1 для неизвестных единиц)
+        """
+        names, inverse = np.unique(np.asarray(units, dtype=str), return_inverse=True)
+        codes = np.array([self.code(str(name)) for name in names], dtype=np.intp)
+        return codes[inverse.reshape(-1)]
+
+    def get_units(self) -> Tuple[str, ...]:
+        """
+        Возвращает названия единиц в порядке их кодов.
+
+        :return: Кортеж единиц измерения
+        """
+        return tuple(self.__units)
+
+    def get_meters(self, unit: str) -> float:
+        """
+        Возвращает длину единицы измерения в метрах.
+
+        :param unit: Единица измерения
+        :return: Длина единицы в метрах
+        :raises ValueError: Если единица неизвестна
+        """
+        code = self.code(unit)
+        if code < 0:
+            raise ValueError(f"Неизвестная единица измерения: {unit}")
+        return self.__factors[code]
+
+    def get_factor_matrix(self, power: int = 1) -> np.ndarray:
+        """
+        Возвращает матрицу коэффициентов перевода (только для чтения).
+
+        :param power: 1 - длина, 2 - площадь, 3 - объем
+        :return: Матрица, где [i, j] переводит значение из единицы
+            с кодом i в единицу с кодом j
+        """
+        if power not in (1, 2, 3):
+            raise ValueError("Степень должна быть равна 1, 2 или 3.")
+        return self.__matrices[power - 1]
+
+    def factor(self, from_unit: str, to_unit: str, power: int = 1) -> float:
+        """
+        Возвращает коэффициент перевода между двумя единицами.
+
+        :param from_unit: Исходная единица измерения
+        :param to_unit: Целевая единица измерения
+        :param power: 1 - длина, 2 - площадь, 3 - объем
+        :return: Коэффициент перевода
+        :raises ValueError: Если указана неизвестная единица измерения
+        """
+        from_code, to_code = self._code_pair(from_unit, to_unit)
+        return float(self.get_factor_matrix(power)[from_code, to_code])
+
+    def convert(self, value: float, from_unit: str, to_unit: str, power: int = 1) -> float:
+        """
+        Переводит значение из одной единицы измерения в другую.
+
+        Длина переводится так же, как в исходной функции convert_units:
+        сначала в метры, затем в целевую единицу (value * f_from / f_to),
+        поэтому результат совпадает с ней до последнего бита. Площадь
+        и объем умножаются на коэффициент из матрицы.
+
+        :param value: Значение для перевода
+        :param from_unit: Исходная единица измерения
+        :param to_unit: Целевая единица измерения
+        :param power: 1 - длина, 2 - площадь, 3 - объем
+        :return: Переведенное значение
+        :raises ValueError: Если указана неизвестная единица измерения
+        """
+        from_code, to_code = self._code_pair(from_unit, to_unit)
+        if power == 1:
+            return value * self.__factors[from_code] / self.__factors[to_code]
+        return value * float(self.get_factor_matrix(power)[from_code, to_code])
+
+    def _code_pair(self, from_unit: str, to_unit: str) -> Tuple[int, int]:
+        """
+        Возвращает коды исходной и целевой единиц измерения.
+
+        :param from_unit: Исходная единица измерения
+        :param to_unit: Целевая единица измерения
+        :return: Кортеж (код исходной единицы, код целевой единицы)
+        :raises ValueError: Если указана неизвестная единица измерения
+        """
+        from_code = self.code(from_unit)
+        to_code = self.code(to_unit)
+        if from_code < 0:
+            raise ValueError(f"Неизвестная исходная единица измерения: {from_unit}")
+        if to_code < 0:
+            raise ValueError(f"Неизвестная целевая единица измерения: {to_unit}")
+        return from_code, to_code
+
+
+# Общий реестр единиц измерения пакета
+registry = UnitRegistry({**UNIT_FACTORS, **IMPERIAL_FACTORS})
+
+
+def unit_code(unit: str) -> int:
+    """
+    Возвращает код единицы измерения в общем реестре (без учета регистра).
+
+    :param unit: Единица измерения
+    :return: Код единицы или -1, если единица неизвестна
+    """
+    return registry.code(unit)
+
+
+def unit_codes(units: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    """
+    Возвращает коды для последовательности единиц измерения в общем реестре.
+
+    :param units: Последовательность единиц измерения
+    :return: Массив кодов (-1 для неизвестных единиц)
+    """
+    return registry.codes(units)
+
+
+def canonical_dimensions(dimensions: Sequence[float], unit: str,
+                         tolerance: float) -> tuple:
+    """
+    Переводит размеры в метры и округляет их до кратных tolerance.
+
+    :param dimensions: Размеры фигуры
+    :param unit: Единица измерения размеров
+    :param tolerance: Точность сравнения размеров в метрах
+    :return: Кортеж целых чисел (размер в метрах / tolerance)
+    :raises ValueError: Если единица неизвестна или точность не положительна
+    """
+    if tolerance <= 0:
+        raise ValueError("Точность должна быть положительным числом.")
+    factor = registry.get_meters(unit) / tolerance
+    return tuple(round(value * factor) for value in dimensions)
+
+if __name__ == '__main__':
+    ...
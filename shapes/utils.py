@@ -2,20 +2,27 @@
 Вспомогательные функции для работы с геометрическими фигурами.
 """
 
-from typing import Union, List
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from shapes.batch import ShapeBatch
 from shapes.shapes2d import Shape
 from shapes.shapes3d import ThreeDShape
+from shapes.units import registry, unit_code, unit_codes
 
 
-def convert_units(value: float, from_unit: str, to_unit: str) -> float:
+def convert_units(value: float, from_unit: str, to_unit: str, power: int = 1) -> float:
     """
     Конвертирует значение из одних единиц измерения в другие.
 
-    Поддерживаемые единицы: mm, cm, dm, m, km
+    Поддерживаемые единицы: mm, cm, dm, m, km, in, ft, yd, mi
+    и единицы, добавленные в shapes.units.registry
 
     :param value: Значение для конвертации
     :param from_unit: Исходная единица измерения
     :param to_unit: Целевая единица измерения
+    :param power: 1 - длина, 2 - площадь, 3 - объем
     :return: Конвертированное значение
     :raises ValueError: Если указана неизвестная единица измерения
     """
@@ -24,27 +31,85 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     if not all(isinstance(unit, str) for unit in [from_unit, to_unit]):
         raise TypeError("Единицы измерения должны быть строками.")
 
-    conversion_factors = {
-        'mm': 0.001,  # миллиметры в метры
-        'cm': 0.01,  # сантиметры в метры
-        'dm': 0.1,  # дециметры в метры
-        'm': 1.0,  # метры
-        'km': 1000.0,  # километры в метры
-    }
+    return registry.convert(value, from_unit, to_unit, power)
+
+
+def _resolve_unit_codes(units, size: int, description: str) -> np.ndarray:
+    """
+    Преобразует общую единицу или единицы для каждого элемента в массив кодов.
+
+    :param units: Строка, последовательность строк или массив целых кодов
+    :param size: Количество конвертируемых значений
+    :param description: "исходная" или "целевая" (для текста ошибок)
+    :return: Массив кодов длины size
+    :raises ValueError: Если есть неизвестные единицы измерения
+    """
+    if isinstance(units, str):
+        code = unit_code(units)
+        if code < 0:
+            raise ValueError(f"Неизвестная {description} единица измерения: {units}")
+        return np.full(size, code, dtype=np.intp)
+
+    array = np.asarray(units)
+    if array.dtype.kind in 'iu':
+        codes = array.astype(np.intp)
+        codes[(codes < 0) | (codes >= len(registry.get_units()))] = -1
+    elif array.dtype.kind == 'U' or (array.dtype.kind == 'O' and
+                                      all(isinstance(unit, str) for unit in array.flat)):
+        codes = unit_codes(array)
+    else:
+        raise TypeError("Единицы измерения должны быть строками или кодами единиц.")
+
+    if codes.shape != (size,):
+        raise ValueError("Количество единиц измерения должно совпадать "
+                         "с количеством значений.")
 
-    from_unit_lower = from_unit.lower()
-    to_unit_lower = to_unit.lower()
+    bad = np.flatnonzero(codes < 0)
+    if len(bad):
+        raise ValueError(f"Неизвестная {description} единица измерения "
+                         f"в позициях {bad.tolist()}: "
+                         f"{sorted(set(str(unit) for unit in array[bad].tolist()))}")
+    return codes
 
-    if from_unit_lower not in conversion_factors:
-        raise ValueError(f"Неизвестная исходная единица измерения: {from_unit}")
-    if to_unit_lower not in conversion_factors:
-        raise ValueError(f"Неизвестная целевая единица измерения: {to_unit}")
 
-    # Конвертируем в метры, затем в целевую единицу
-    value_in_meters = value * conversion_factors[from_unit_lower]
-    converted_value = value_in_meters / conversion_factors[to_unit_lower]
+def convert_units_array(values: Union[Sequence[float], np.ndarray],
+                        from_unit: Union[str, Sequence[str], np.ndarray],
+                        to_unit: Union[str, Sequence[str], np.ndarray]) -> np.ndarray:
+    """
+    Конвертирует массив значений из одних единиц измерения в другие.
+
+    Единицы можно задать одной строкой для всех значений или
+    последовательностью строк (либо кодов shapes.units.registry)
+    для каждого значения отдельно. Коэффициенты берутся из заранее
+    вычисленной матрицы коэффициентов реестра за один проход.
+
+    :param values: Значения для конвертации
+    :param from_unit: Исходная единица (или единицы) измерения
+    :param to_unit: Целевая единица (или единицы) измерения
+    :return: Массив конвертированных значений
+    :raises ValueError: Если указаны неизвестные единицы измерения
+        (с перечислением позиций ошибочных элементов)
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iuf' or values.ndim != 1:
+        raise TypeError("Значения должны быть одномерной последовательностью чисел.")
 
-    return converted_value
+    from_codes = _resolve_unit_codes(from_unit, len(values), "исходная")
+    to_codes = _resolve_unit_codes(to_unit, len(values), "целевая")
+
+    return values * registry.get_factor_matrix()[from_codes, to_codes]
+
+
+def _comparable_area(shape: Union[Shape, ThreeDShape]) -> float:
+    """
+    Возвращает площадь 2D фигуры или площадь поверхности 3D фигуры.
+
+    :param shape: Геометрическая фигура
+    :return: Площадь, по которой сравниваются фигуры
+    """
+    if isinstance(shape, Shape):
+        return shape.area()
+    return shape.surface_area()
 
 
 def compare_shapes_by_area(shape1: Union[Shape, ThreeDShape],
@@ -62,27 +127,282 @@ def compare_shapes_by_area(shape1: Union[Shape, ThreeDShape],
         raise TypeError("Оба аргумента должны быть геометрическими фигурами.")
 
     # Получаем площади/площади поверхностей
-    if isinstance(shape1, Shape):
-        area1 = shape1.area()
-    else:
-        area1 = shape1.surface_area()
+    area1 = _comparable_area(shape1)
+    area2 = _comparable_area(shape2)
 
-    if isinstance(shape2, Shape):
-        area2 = shape2.area()
-    else:
-        area2 = shape2.surface_area()
+    return _comparison_message(shape1.__class__.__name__, area1,
+                               shape2.__class__.__name__, area2)
+
+
+# Площади, отличающиеся меньше чем на это значение, считаются равными
+_AREA_TOLERANCE = 1e-10
+
+
+def _comparison_message(name1: str, area1: float, name2: str, area2: float) -> str:
+    """
+    Формирует текст результата сравнения двух фигур по площади.
 
+    :param name1: Название типа первой фигуры
+    :param area1: Площадь первой фигуры
+    :param name2: Название типа второй фигуры
+    :param area2: Площадь второй фигуры
+    :return: Строка с результатом сравнения
+    """
     # Сравниваем с заданной точностью
-    if abs(area1 - area2) < 1e-10:
+    if abs(area1 - area2) < _AREA_TOLERANCE:
         return f"Фигуры имеют одинаковую площадь ({area1:.2f})"
     elif area1 > area2:
         diff = area1 - area2
-        return (f"{shape1.__class__.__name__} больше {shape2.__class__.__name__} "
-                f"на {diff:.2f} единиц²")
+        return f"{name1} больше {name2} на {diff:.2f} единиц²"
     else:
         diff = area2 - area1
-        return (f"{shape1.__class__.__name__} меньше {shape2.__class__.__name__} "
-                f"на {diff:.2f} единиц²")
+        return f"{name1} меньше {name2} на {diff:.2f} единиц²"
+
+
+def _areas_of(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch]) -> np.ndarray:
+    """
+    Вычисляет площади (площади поверхности для 3D) всех фигур один раз.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :return: Массив площадей
+    :raises TypeError: Если среди фигур есть объекты неверного типа
+    """
+    if isinstance(shapes, ShapeBatch):
+        return shapes.comparable_area()
+    if not all(isinstance(shape, (Shape, ThreeDShape)) for shape in shapes):
+        raise TypeError("Все элементы должны быть геометрическими фигурами.")
+    return np.fromiter((_comparable_area(shape) for shape in shapes),
+                       dtype=np.float64, count=len(shapes))
+
+
+def _select(shapes, indices: np.ndarray, return_indices: bool):
+    """
+    Возвращает выбранные фигуры или их индексы.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param indices: Индексы выбранных фигур
+    :param return_indices: Вернуть индексы вместо фигур
+    :return: Массив индексов, список фигур или ShapeBatch
+    """
+    if return_indices:
+        return indices
+    if isinstance(shapes, ShapeBatch):
+        return shapes.take(indices)
+    return [shapes[i] for i in indices.tolist()]
+
+
+def _top_k_indices(areas: np.ndarray, k: int, largest: bool) -> np.ndarray:
+    """
+    Находит индексы k наибольших или наименьших значений частичной
+    сортировкой (argpartition), без полной сортировки массива.
+
+    :param areas: Массив площадей
+    :param k: Количество элементов
+    :param largest: True для наибольших значений, False для наименьших
+    :return: Индексы, упорядоченные от лучшего к худшему
+    """
+    if not isinstance(k, int):
+        raise TypeError("Количество фигур должно быть целым числом.")
+    if k < 0:
+        raise ValueError("Количество фигур не может быть отрицательным.")
+
+    keys = -areas if largest else areas
+    k = min(k, len(keys))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(keys):
+        candidates = np.argpartition(keys, k - 1)[:k]
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind='stable')]
+
+
+def top_k_by_area(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                  k: int, return_indices: bool = False):
+    """
+    Находит k фигур с наибольшей площадью (площадью поверхности для 3D).
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param k: Количество фигур
+    :param return_indices: Вернуть индексы вместо фигур
+    :return: Фигуры (или их индексы) по убыванию площади
+    """
+    indices = _top_k_indices(_areas_of(shapes), k, largest=True)
+    return _select(shapes, indices, return_indices)
+
+
+def bottom_k_by_area(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                     k: int, return_indices: bool = False):
+    """
+    Находит k фигур с наименьшей площадью (площадью поверхности для 3D).
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param k: Количество фигур
+    :param return_indices: Вернуть индексы вместо фигур
+    :return: Фигуры (или их индексы) по возрастанию площади
+    """
+    indices = _top_k_indices(_areas_of(shapes), k, largest=False)
+    return _select(shapes, indices, return_indices)
+
+
+def rank_by_area(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                 descending: bool = False) -> np.ndarray:
+    """
+    Вычисляет ранг каждой фигуры по площади (площади поверхности для 3D).
+
+    Ранги начинаются с 1; фигуры с равной площадью получают ранги
+    в порядке их следования.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param descending: Ранг 1 у наибольшей фигуры вместо наименьшей
+    :return: Массив рангов в порядке исходных фигур
+    """
+    areas = _areas_of(shapes)
+    order = np.argsort(-areas if descending else areas, kind='stable')
+    ranks = np.empty(len(areas), dtype=np.intp)
+    ranks[order] = np.arange(1, len(areas) + 1)
+    return ranks
+
+
+def select_by_area_range(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                         low: float, high: float, return_indices: bool = False):
+    """
+    Выбирает фигуры с площадью (площадью поверхности для 3D) в диапазоне
+    [low, high].
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :param low: Нижняя граница площади
+    :param high: Верхняя граница площади
+    :param return_indices: Вернуть индексы вместо фигур
+    :return: Фигуры (или их индексы) в исходном порядке
+    """
+    if low > high:
+        raise ValueError("Нижняя граница не может быть больше верхней.")
+    areas = _areas_of(shapes)
+    indices = np.flatnonzero((areas >= low) & (areas <= high))
+    return _select(shapes, indices, return_indices)
+
+
+def _pair_areas(shapes, others) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Вычисляет площади строк и столбцов матрицы попарного сравнения.
+
+    :param shapes: Фигуры строк матрицы (последовательность или ShapeBatch)
+    :param others: Фигуры столбцов матрицы или None, чтобы сравнивать
+        фигуры shapes между собой
+    :return: Кортеж (площади строк, площади столбцов)
+    """
+    areas = _areas_of(shapes)
+    return areas, (areas if others is None else _areas_of(others))
+
+
+def _order(difference: np.ndarray) -> np.ndarray:
+    """
+    Преобразует разности площадей в порядок: 1, -1 или 0 для равных
+    (с точностью compare_shapes_by_area) площадей.
+
+    :param difference: Массив разностей площадей
+    :return: Массив int8 того же размера
+    """
+    order = np.sign(difference).astype(np.int8)
+    order[np.abs(difference) < _AREA_TOLERANCE] = 0
+    return order
+
+
+def area_difference_matrix(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                           others: Optional[Union[Sequence[Union[Shape, ThreeDShape]],
+                                                  ShapeBatch]] = None) -> np.ndarray:
+    """
+    Вычисляет разности площадей (площадей поверхности для 3D) всех пар фигур.
+
+    Площадь каждой фигуры вычисляется один раз, а матрица строится одной
+    операцией с транслированием массивов. Матрица занимает 8 * N * M байт;
+    для больших наборов используйте iter_area_difference_tiles.
+
+    :param shapes: Фигуры строк матрицы
+    :param others: Фигуры столбцов матрицы (по умолчанию те же фигуры)
+    :return: Матрица, где [i, j] - площадь shapes[i] минус площадь others[j]
+    """
+    areas, other_areas = _pair_areas(shapes, others)
+    return areas[:, np.newaxis] - other_areas[np.newaxis, :]
+
+
+def area_order_matrix(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                      others: Optional[Union[Sequence[Union[Shape, ThreeDShape]],
+                                             ShapeBatch]] = None) -> np.ndarray:
+    """
+    Вычисляет результат сравнения по площади для всех пар фигур.
+
+    :param shapes: Фигуры строк матрицы
+    :param others: Фигуры столбцов матрицы (по умолчанию те же фигуры)
+    :return: Матрица int8, где [i, j] равно 1, если shapes[i] больше
+        others[j], -1, если меньше, и 0 для одинаковой площади
+    """
+    return _order(area_difference_matrix(shapes, others))
+
+
+def iter_area_difference_tiles(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                               others: Optional[Union[Sequence[Union[Shape, ThreeDShape]],
+                                                      ShapeBatch]] = None,
+                               tile_size: int = 2048,
+                               order: bool = False) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """
+    Вычисляет матрицу разностей площадей блоками tile_size x tile_size.
+
+    В памяти одновременно находится только один блок, поэтому матрицу
+    можно обработать для наборов, не помещающихся в память целиком.
+
+    :param shapes: Фигуры строк матрицы
+    :param others: Фигуры столбцов матрицы (по умолчанию те же фигуры)
+    :param tile_size: Размер стороны блока
+    :param order: Возвращать порядок (как area_order_matrix) вместо разностей
+    :return: Генератор кортежей (первая строка, первый столбец, блок)
+    """
+    if not isinstance(tile_size, int) or tile_size <= 0:
+        raise ValueError("Размер блока должен быть положительным целым числом.")
+
+    areas, other_areas = _pair_areas(shapes, others)
+    for row in range(0, len(areas), tile_size):
+        rows = areas[row:row + tile_size, np.newaxis]
+        for column in range(0, len(other_areas), tile_size):
+            tile = rows - other_areas[np.newaxis, column:column + tile_size]
+            yield row, column, _order(tile) if order else tile
+
+
+def comparison_messages(shapes: Union[Sequence[Union[Shape, ThreeDShape]], ShapeBatch],
+                        pairs: Iterable[Tuple[int, int]],
+                        others: Optional[Union[Sequence[Union[Shape, ThreeDShape]],
+                                               ShapeBatch]] = None) -> Iterator[str]:
+    """
+    Формирует тексты сравнения (как compare_shapes_by_area) только для
+    заданных пар фигур, например выводимых в отчет.
+
+    Тексты создаются по мере перебора генератора.
+
+    :param shapes: Фигуры строк матрицы
+    :param pairs: Пары индексов (строка, столбец)
+    :param others: Фигуры столбцов матрицы (по умолчанию те же фигуры)
+    :return: Генератор строк с результатом сравнения
+    """
+    describe_first = _describer(shapes)
+    describe_second = describe_first if others is None else _describer(others)
+    for i, j in pairs:
+        yield _comparison_message(*describe_first(i), *describe_second(j))
+
+
+def _describer(shapes):
+    """
+    Создает функцию, возвращающую название типа и площадь фигуры по индексу.
+
+    :param shapes: Последовательность фигур или ShapeBatch
+    :return: Функция индекс -> (название типа, площадь)
+    """
+    if isinstance(shapes, ShapeBatch):
+        kinds = shapes.get_kinds()
+        areas = shapes.comparable_area()
+        return lambda i: (ShapeBatch.KIND_NAMES[kinds[i]], float(areas[i]))
+    return lambda i: (shapes[i].__class__.__name__, _comparable_area(shapes[i]))
+
 
 def create_shapes_demo() -> List[Union[Shape, ThreeDShape]]:
     """
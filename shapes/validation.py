@@ -0,0 +1,113 @@
+"""
+Векторизованная проверка столбцов данных при массовом создании фигур.
+"""
+
+from itertools import repeat
+from sys import intern
+from typing import Iterable, Sequence, Union
+
+import numpy as np
+
+from shapes.units import registry
+
+
+def numeric_column(values, message: str) -> np.ndarray:
+    """
+    Преобразует последовательность чисел в одномерный массив float64.
+
+    :param values: Последовательность или массив чисел
+    :param message: Текст ошибки, если значения не являются числами
+    :return: Массив float64
+    :raises TypeError: Если тип данных не числовой
+    """
+    array = np.asarray(values)
+    if array.dtype.kind not in 'biuf' or array.ndim != 1:
+        raise TypeError(message)
+    return array.astype(np.float64, copy=False)
+
+
+def check_rows(invalid: np.ndarray, message: str):
+    """
+    Проверяет, что ни одна строка не отмечена как ошибочная.
+
+    :param invalid: Булева маска ошибочных строк
+    :param message: Текст ошибки (без точки в конце)
+    :raises ValueError: Со списком всех ошибочных строк
+    """
+    if invalid.any():
+        raise ValueError(f"{message} (строки {np.flatnonzero(invalid).tolist()}).")
+
+
+def check_lengths(*columns):
+    """
+    Проверяет, что все столбцы имеют одинаковую длину.
+
+    :param columns: Столбцы данных
+    :raises ValueError: Если длины различаются
+    """
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError("Все массивы должны иметь одинаковую длину.")
+
+
+def position_tuple(position, dimensions: int) -> tuple:
+    """
+    Проверяет координаты положения фигуры.
+
+    :param position: Последовательность координат
+    :param dimensions: Ожидаемое количество координат (2 или 3)
+    :return: Кортеж координат
+    :raises TypeError: Если координаты не являются числами
+    """
+    try:
+        coordinates = tuple(position)
+    except TypeError:
+        raise TypeError(f"Положение должно быть последовательностью "
+                        f"из {dimensions} чисел.") from None
+    if len(coordinates) != dimensions or \
+            not all(isinstance(value, (int, float)) for value in coordinates):
+        raise TypeError(f"Положение должно быть последовательностью из {dimensions} чисел.")
+    return coordinates
+
+
+def unit_column(unit: Union[str, Sequence[str]], size: int) -> Iterable[str]:
+    """
+    Возвращает единицу измерения для каждой строки.
+
+    Одинаковые единицы представлены одним и тем же (интернированным)
+    объектом строки. Каждая уникальная единица ищется в реестре
+    shapes.units.registry только один раз.
+
+    :param unit: Общая единица или единицы для каждой строки
+    :param size: Количество строк
+    :return: Итерируемый объект с единицами
+    :raises TypeError: Если единицы не являются строками
+    :raises ValueError: Если есть неизвестные единицы измерения
+        (со списком всех строк с такими единицами)
+    """
+    if isinstance(unit, str):
+        if registry.code(unit) < 0:
+            raise ValueError(f"Неизвестная единица измерения: {unit}.")
+        return repeat(intern(unit), size)
+
+    units = list(unit)
+    if len(units) != size:
+        raise ValueError("Количество единиц измерения должно совпадать "
+                         "с количеством фигур.")
+    invalid = np.array([not isinstance(item, str) for item in units], dtype=bool)
+    if invalid.any():
+        raise TypeError(f"Единица измерения должна быть строкой "
+                        f"(строки {np.flatnonzero(invalid).tolist()}).")
+    interned = {}
+    column = [interned.setdefault(item, intern(item)) for item in units]
+    if interned:
+        names = list(interned)
+        unknown = [name for name, code in zip(names, registry.codes(names).tolist())
+                   if code < 0]
+        if unknown:
+            unknown_set = set(unknown)
+            check_rows(np.array([item in unknown_set for item in column], dtype=bool),
+                       f"Неизвестная единица измерения: {', '.join(unknown)}")
+    return column
+
+if __name__ == '__main__':
+    ...
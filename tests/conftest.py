@@ -0,0 +1,108 @@
+"""
+Общие данные тестов пакета shapes.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+from shapes import Rectangle, Circle, Cube, Sphere
+
+
+@pytest.fixture
+def mixed_shapes():
+    """
+    Фигуры четырех типов в нескольких единицах измерения.
+    """
+    return [
+        Rectangle(10.0, 5.0, 'cm'),
+        Rectangle(3.0, 7.0, 'm'),
+        Circle(4.0, 'cm'),
+        Circle(25.0, 'mm'),
+        Cube(2.0, 'm'),
+        Cube(15.0, 'cm'),
+        Sphere(3.0, 'cm'),
+        Sphere(1.5, 'dm'),
+    ]
+
+
+def sample_records(size: int, seed: int = 0) -> list:
+    """
+    Создает записи фигур всех типов в нескольких единицах измерения.
+
+    :param size: Количество записей
+    :param seed: Начальное значение генератора случайных чисел
+    :return: Список словарей с полями записей
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        unit = ('mm', 'cm', 'm')[i % 3]
+        kind = ('rectangle', 'circle', 'cube', 'sphere')[i % 4]
+        if kind == 'rectangle':
+            record = {'type': kind, 'width': rng.uniform(1, 50), 'height': rng.uniform(1, 50)}
+        elif kind == 'cube':
+            record = {'type': kind, 'side': rng.uniform(1, 50)}
+        else:
+            record = {'type': kind, 'radius': rng.uniform(1, 50)}
+        record['unit'] = unit
+        records.append(record)
+    return records
+
+
+def write_csv(path: Path, records: list):
+    """
+    Записывает записи фигур в файл CSV.
+
+    :param path: Путь к файлу
+    :param records: Записи, созданные sample_records
+    """
+    fields = ['type', 'width', 'height', 'radius', 'side', 'unit']
+    lines = [','.join(fields)]
+    lines += [','.join(str(record.get(field, '')) for field in fields) for record in records]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def write_jsonl(path: Path, records: list):
+    """
+    Записывает записи фигур в файл JSONL.
+
+    :param path: Путь к файлу
+    :param records: Записи, созданные sample_records
+    """
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+
+
+@pytest.fixture
+def shape_files(tmp_path):
+    """
+    Одинаковые записи фигур в файлах CSV и JSONL.
+    """
+    records = sample_records(2000)
+    csv_path, jsonl_path = tmp_path / 'shapes.csv', tmp_path / 'shapes.jsonl'
+    write_csv(csv_path, records)
+    write_jsonl(jsonl_path, records)
+    return records, csv_path, jsonl_path
+
+
+def run_app(*args: str, script: str = 'shapes_app.py') -> str:
+    """
+    Запускает исполняемый файл из каталога bin и возвращает его вывод.
+
+    :param args: Аргументы командной строки
+    :param script: Имя исполняемого файла
+    :return: Стандартный вывод
+    """
+    environment = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run([sys.executable, str(ROOT / 'bin' / script), *map(str, args)],
+                            capture_output=True, text=True, env=environment, check=True)
+    return result.stdout
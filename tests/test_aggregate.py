@@ -0,0 +1,86 @@
+"""
+Тесты группировки и статистики характеристик фигур.
+"""
+
+import pytest
+
+from shapes import (ShapeAggregator, ShapeBatch, PolygonBatch, Polygon, Rectangle, Circle,
+                    Cube, Sphere, aggregate, convert_units)
+
+
+def manual_groups(shapes, unit=None):
+    groups = {}
+    for shape in shapes:
+        factor = 1.0 if unit is None else convert_units(1.0, shape.get_unit(), unit)
+        key = (shape.__class__.__name__, unit or shape.get_unit())
+        if hasattr(shape, 'area'):
+            values = {'area': [shape.area() * factor ** 2], 'volume': []}
+        else:
+            values = {'area': [shape.surface_area() * factor ** 2],
+                      'volume': [shape.volume() * factor ** 3]}
+        group = groups.setdefault(key, {'area': [], 'volume': []})
+        for metric, items in values.items():
+            group[metric] += items
+    return groups
+
+
+def assert_matches(aggregator, expected):
+    groups = aggregator.get_groups()
+    assert list(groups) == sorted(expected)
+    for key, metrics in expected.items():
+        for metric, values in metrics.items():
+            summary = groups[key][metric]
+            assert summary.get_count() == len(values)
+            if values:
+                assert summary.get_total() == pytest.approx(sum(values))
+                assert summary.get_min() == pytest.approx(min(values))
+                assert summary.get_max() == pytest.approx(max(values))
+                assert summary.get_mean() == pytest.approx(sum(values) / len(values))
+
+
+@pytest.mark.parametrize('unit', [None, 'm'])
+def test_list_and_batch_match_manual_grouping(mixed_shapes, unit):
+    expected = manual_groups(mixed_shapes, unit)
+    assert_matches(aggregate(mixed_shapes, unit), expected)
+    assert_matches(aggregate(ShapeBatch.from_shapes(mixed_shapes), unit), expected)
+
+    one_by_one = ShapeAggregator(unit)
+    one_by_one.add_shapes(mixed_shapes)
+    assert_matches(one_by_one, expected)
+
+
+def test_polygons_are_grouped():
+    polygons = [Polygon([(0, 0), (2, 0), (0, 2)], 'cm'), Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])]
+    result = aggregate(polygons + [Rectangle(1.0, 1.0)])
+    assert result.get_groups()[('Polygon', 'cm')]['area'].get_total() == pytest.approx(3.0)
+
+    batch_result = aggregate(PolygonBatch.from_polygons(polygons), unit='mm')
+    assert batch_result.get_groups()[('Polygon', 'mm')]['area'].get_total() == pytest.approx(300.0)
+
+
+def test_merge_equals_single_pass(mixed_shapes):
+    first, second = ShapeAggregator('cm'), ShapeAggregator('cm')
+    first.add_batch(ShapeBatch.from_shapes(mixed_shapes[:3]))
+    second.add_batch(ShapeBatch.from_shapes(mixed_shapes[3:]))
+    first.merge(second)
+    assert first.rows() == aggregate(mixed_shapes, 'cm').rows()
+
+    with pytest.raises(ValueError):
+        first.merge(ShapeAggregator('m'))
+
+
+def test_rows_format():
+    rows = aggregate([Rectangle(2.0, 3.0, 'm'), Rectangle(1.0, 1.0, 'm'), Cube(2.0, 'm')]).rows()
+    assert rows == [
+        ['Cube', 'm', '1', '24.00 m²', '24.00 m²', '24.00 m²', '24.00 m²',
+         '8.00 m³', '8.00 m³', '8.00 m³', '8.00 m³'],
+        ['Rectangle', 'm', '2', '7.00 m²', '3.50 m²', '1.00 m²', '6.00 m²', '-', '-', '-', '-'],
+    ]
+    assert len(rows[0]) == len(ShapeAggregator.HEADERS)
+
+
+def test_empty_and_invalid():
+    assert aggregate([]).rows() == []
+    with pytest.raises(ValueError):
+        ShapeAggregator('parsec')
+    assert aggregate([Circle(1.0), Sphere(1.0)], 'mm').get_unit() == 'mm'
@@ -0,0 +1,69 @@
+"""
+Тесты колоночного набора фигур ShapeBatch.
+"""
+
+from math import isnan
+
+import numpy as np
+import pytest
+
+from shapes import ShapeBatch, Rectangle, Circle, Cube, Sphere, Shape
+
+
+def test_metrics_match_shape_objects(mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes)
+    assert len(batch) == len(mixed_shapes)
+
+    for i, shape in enumerate(mixed_shapes):
+        if isinstance(shape, Shape):
+            assert batch.area()[i] == pytest.approx(shape.area())
+            assert batch.perimeter()[i] == pytest.approx(shape.perimeter())
+            assert isnan(batch.volume()[i]) and isnan(batch.surface_area()[i])
+        else:
+            assert batch.volume()[i] == pytest.approx(shape.volume())
+            assert batch.surface_area()[i] == pytest.approx(shape.surface_area())
+            assert isnan(batch.area()[i]) and isnan(batch.perimeter()[i])
+
+
+def test_units_are_shared_codes(mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes)
+    units = batch.get_units()
+    assert [units[code] for code in batch.get_unit_codes()] == \
+        [shape.get_unit() for shape in mixed_shapes]
+    assert len(units) == len(set(units))
+
+
+def test_to_shapes_round_trip(mixed_shapes):
+    restored = ShapeBatch.from_shapes(mixed_shapes).to_shapes()
+    assert [type(shape) for shape in restored] == [type(shape) for shape in mixed_shapes]
+    assert [str(shape) for shape in restored] == [str(shape) for shape in mixed_shapes]
+
+
+def test_take_selects_rows(mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes)
+    part = batch.take(np.array([0, 4]))
+    assert part.get_kinds().tolist() == [ShapeBatch.RECTANGLE, ShapeBatch.CUBE]
+    assert part.comparable_area().tolist() == pytest.approx([50.0, 24.0])
+
+
+def test_unsupported_shape_is_rejected():
+    class Square(Rectangle):
+        pass
+
+    # Подклассы поддерживаемых фигур допускаются, прочие объекты - нет
+    assert ShapeBatch.from_shapes([Square(1.0, 2.0)]).area().tolist() == [2.0]
+    with pytest.raises(TypeError):
+        ShapeBatch.from_shapes([object()])
+
+
+def test_empty_batch():
+    batch = ShapeBatch.from_shapes([])
+    assert len(batch) == 0
+    assert batch.area().shape == (0,)
+
+
+def test_kind_names_match_classes():
+    shapes = [Rectangle(1.0, 1.0), Circle(1.0), Cube(1.0), Sphere(1.0)]
+    batch = ShapeBatch.from_shapes(shapes)
+    assert [ShapeBatch.KIND_NAMES[kind] for kind in batch.get_kinds()] == \
+        [shape.__class__.__name__ for shape in shapes]
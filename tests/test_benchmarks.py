@@ -0,0 +1,54 @@
+"""
+Тесты набора тестов производительности benchmarks/run.py.
+"""
+
+import importlib.util
+import json
+
+import pytest
+
+from conftest import ROOT
+
+
+@pytest.fixture(scope='module')
+def runner():
+    spec = importlib.util.spec_from_file_location('benchmarks_run', ROOT / 'benchmarks' / 'run.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_case_runs(runner, tmp_path):
+    output = tmp_path / 'result.json'
+    assert runner.main(['--sizes', '20', '--repeat', '1', '--output', str(output)]) == 0
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert {item['case'] for item in report['results']} == set(runner.CASES)
+    assert all(item['size'] == 20 and item['seconds'] >= 0 for item in report['results'])
+    assert {'python', 'numpy', 'platform', 'timestamp'} <= report['meta'].keys()
+
+
+def test_baseline_comparison(runner, tmp_path):
+    fast = tmp_path / 'fast.json'
+    slow = tmp_path / 'slow.json'
+    case = 'utils.convert_units'
+    for path, seconds in ((fast, 1e-12), (slow, 1e3)):
+        path.write_text(json.dumps({'results': [{'case': case, 'size': 20,
+                                                 'seconds': seconds}]}), encoding='utf-8')
+
+    arguments = ['--sizes', '20', '--repeat', '1', '--cases', case,
+                 '--output', str(tmp_path / 'result.json'), '--baseline']
+    assert runner.main(arguments + [str(fast)]) == 1
+    assert runner.main(arguments + [str(slow)]) == 0
+
+
+def test_compare_matches_case_and_size(runner):
+    results = [{'case': 'a', 'size': 10, 'seconds': 1.2},
+               {'case': 'a', 'size': 100, 'seconds': 1.0},
+               {'case': 'b', 'size': 10, 'seconds': 1.0}]
+    baseline = [{'case': 'a', 'size': 10, 'seconds': 1.0},
+                {'case': 'a', 'size': 100, 'seconds': 1.0}]
+    comparisons = runner.compare(results, baseline, threshold=0.1)
+    assert [(item['size'], item['regression']) for item in comparisons] == \
+        [(10, True), (100, False)]
+    assert comparisons[0]['ratio'] == pytest.approx(1.2)
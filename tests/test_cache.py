@@ -0,0 +1,53 @@
+"""
+Тесты кэширования характеристик фигур.
+"""
+
+from math import pi
+
+import pytest
+
+from shapes import Rectangle, Circle, Cube, Sphere, metric_cache_info, reset_metric_cache_info
+
+
+@pytest.fixture(autouse=True)
+def clean_counters():
+    reset_metric_cache_info()
+    yield
+    reset_metric_cache_info()
+
+
+def test_repeated_calls_hit_cache():
+    shape = Rectangle(2.0, 3.0)
+    assert shape.area() == 6.0
+    assert shape.area() == 6.0
+    assert metric_cache_info() == (1, 1)
+
+
+def test_setters_invalidate_cache():
+    rectangle = Rectangle(2.0, 3.0)
+    assert rectangle.area() == 6.0 and rectangle.perimeter() == 10.0
+    rectangle.set_width(4.0)
+    assert rectangle.area() == 12.0 and rectangle.perimeter() == 14.0
+
+    circle = Circle(1.0)
+    assert circle.area() == pytest.approx(pi)
+    circle.set_radius(2.0)
+    assert circle.area() == pytest.approx(4 * pi)
+
+    cube = Cube(1.0)
+    assert cube.volume() == 1.0
+    cube.set_side(2.0)
+    assert cube.volume() == 8.0 and cube.surface_area() == 24.0
+
+    sphere = Sphere(1.0)
+    assert sphere.surface_area() == pytest.approx(4 * pi)
+    sphere.set_radius(2.0)
+    assert sphere.surface_area() == pytest.approx(16 * pi)
+
+
+def test_failed_setter_keeps_cache():
+    shape = Rectangle(2.0, 3.0)
+    shape.area()
+    with pytest.raises(ValueError):
+        shape.set_width(-1.0)
+    assert shape.area() == 6.0
@@ -0,0 +1,68 @@
+"""
+Тесты коллекции фигур с постоянно поддерживаемыми итогами.
+"""
+
+import random
+
+import pytest
+
+from shapes import ShapeCollection, Rectangle, Circle, Cube, Sphere, convert_units
+
+
+@pytest.fixture
+def shapes():
+    rng = random.Random(3)
+    return [Rectangle(rng.uniform(1, 10), rng.uniform(1, 10)) if i % 4 == 0 else
+            Circle(rng.uniform(1, 10)) if i % 4 == 1 else
+            Cube(rng.uniform(1, 10)) if i % 4 == 2 else Sphere(rng.uniform(1, 10))
+            for i in range(200)]
+
+
+def totals(shapes, unit):
+    area = volume = surface = 0.0
+    for shape in shapes:
+        factor = convert_units(1.0, shape.get_unit(), unit)
+        if hasattr(shape, 'area'):
+            area += shape.area() * factor ** 2
+        else:
+            volume += shape.volume() * factor ** 3
+            surface += shape.surface_area() * factor ** 2
+    return area, volume, surface
+
+
+def test_totals_follow_changes(shapes):
+    collection = ShapeCollection(shapes[:100], unit='m')
+    for shape in shapes[100:]:
+        collection.add(shape)
+    for shape in shapes[:50]:
+        collection.remove(shape)
+    for shape in shapes[50:80]:
+        shape.set_unit('mm')
+    for shape in shapes[80:90]:
+        if hasattr(shape, 'set_radius'):
+            shape.set_radius(0.25)
+
+    rest = shapes[50:]
+    expected = totals(rest, 'm')
+    assert collection.get_total_area() == pytest.approx(expected[0], rel=1e-12)
+    assert collection.get_total_volume() == pytest.approx(expected[1], rel=1e-12)
+    assert collection.get_total_surface_area() == pytest.approx(expected[2], rel=1e-12)
+    assert collection.get_count() == len(rest)
+    assert sum(collection.get_counts().values()) == len(rest)
+    assert collection.get_count('Sphere') == sum(isinstance(s, Sphere) for s in rest)
+
+
+def test_empty_totals_are_exact(shapes):
+    collection = ShapeCollection(shapes)
+    collection.clear()
+    assert (collection.get_total_area(), collection.get_total_volume()) == (0.0, 0.0)
+    assert collection.get_counts() == {}
+
+
+def test_unknown_units():
+    with pytest.raises(ValueError):
+        ShapeCollection(unit='parsec')
+    with pytest.raises(ValueError):
+        ShapeCollection([Rectangle(1.0, 1.0, 'parsec')])
+    with pytest.raises(TypeError):
+        ShapeCollection([object()])
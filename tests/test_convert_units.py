@@ -0,0 +1,62 @@
+"""
+Тесты векторизованного перевода единиц измерения.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import ShapeBatch, convert_units, convert_units_array
+
+
+def test_array_matches_scalar_conversion():
+    values = [1.0, 2.5, 100.0]
+    for source, target in [('cm', 'm'), ('in', 'mm'), ('km', 'ft')]:
+        expected = [convert_units(value, source, target) for value in values]
+        assert convert_units_array(values, source, target).tolist() == pytest.approx(expected)
+
+
+def test_scalar_length_matches_baseline_formula():
+    meters = {'mm': 0.001, 'cm': 0.01, 'dm': 0.1, 'm': 1.0, 'km': 1000.0}
+    for value in (0.1, 1.0, 3.7, 12345.678):
+        for source in meters:
+            for target in meters:
+                # Совпадение до последнего бита: сначала в метры, затем в целевую единицу
+                assert convert_units(value, source, target) == \
+                    value * meters[source] / meters[target]
+    with pytest.raises(ValueError, match="исходная"):
+        convert_units(1.0, 'parsec', 'm')
+
+
+def test_per_element_units():
+    result = convert_units_array([1.0, 1.0, 1.0], ['m', 'cm', 'mm'], 'mm')
+    assert result.tolist() == pytest.approx([1000.0, 10.0, 1.0])
+
+
+def test_unknown_units_report_positions():
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        convert_units_array([1.0, 2.0], ['m', 'parsec'], 'cm')
+    with pytest.raises(ValueError):
+        convert_units_array([1.0], 'cm', 'parsec')
+
+
+def test_mismatched_unit_count():
+    with pytest.raises(ValueError):
+        convert_units_array([1.0, 2.0], ['m'], 'cm')
+
+
+def test_non_numeric_values():
+    with pytest.raises(TypeError):
+        convert_units_array(['a', 'b'], 'm', 'cm')
+
+
+def test_batch_to_unit(mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes).to_unit('m')
+    assert batch.get_units() == ('m',)
+    expected = [convert_units(1.0, shape.get_unit(), 'm', 2) for shape in mixed_shapes]
+    original = ShapeBatch.from_shapes(mixed_shapes).comparable_area()
+    assert batch.comparable_area() == pytest.approx(original * np.array(expected))
+
+
+def test_batch_to_unknown_unit(mixed_shapes):
+    with pytest.raises(ValueError):
+        ShapeBatch.from_shapes(mixed_shapes).to_unit('parsec')
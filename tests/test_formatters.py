@@ -0,0 +1,60 @@
+"""
+Тесты отчетов о фигурах.
+"""
+
+import io
+
+from shapes import Rectangle, Circle
+from shapes.report import format_shape_info, register_formatter, write_shape_reports
+
+
+def reference_info(shape) -> str:
+    """
+    Формирует отчет так же, как прежняя display_shape_info с проверками hasattr.
+    """
+    unit = shape.get_unit()
+    info = f"Фигура: {shape.__class__.__name__}\n"
+    for method, label in [('get_width', 'Ширина'), ('get_height', 'Высота'),
+                          ('get_radius', 'Радиус'), ('get_side', 'Сторона')]:
+        if hasattr(shape, method):
+            info += f"  {label}: {getattr(shape, method)()}{unit}\n"
+    if hasattr(shape, 'area'):
+        info += f"  Площадь: {shape.area():.2f}{unit}²\n"
+    if hasattr(shape, 'perimeter'):
+        info += f"  Периметр: {shape.perimeter():.2f}{unit}\n"
+    if hasattr(shape, 'surface_area'):
+        info += f"  Площадь поверхности: {shape.surface_area():.2f}{unit}²\n"
+    if hasattr(shape, 'volume'):
+        info += f"  Объем: {shape.volume():.2f}{unit}³\n"
+    return info
+
+
+def test_format_shape_info_matches_reference(mixed_shapes):
+    for shape in mixed_shapes:
+        assert format_shape_info(shape) == reference_info(shape)
+
+
+def test_subclass_gets_compiled_formatter():
+    class Square(Rectangle):
+        __slots__ = ()
+
+        def get_side(self):
+            return self.get_width()
+
+    square = Square(2.0, 2.0, 'mm')
+    assert format_shape_info(square) == reference_info(square)
+    assert '  Сторона: 2.0mm\n' in format_shape_info(square)
+
+
+def test_registered_formatter_is_used():
+    class Marked(Circle):
+        __slots__ = ()
+
+    register_formatter(Marked, lambda shape: f"Метка {shape.get_radius()}\n")
+    assert format_shape_info(Marked(3.0)) == "Метка 3.0\n"
+
+
+def test_write_shape_reports(mixed_shapes):
+    stream = io.StringIO()
+    write_shape_reports(mixed_shapes, stream)
+    assert stream.getvalue() == "".join(reference_info(shape) + "\n" for shape in mixed_shapes)
@@ -0,0 +1,75 @@
+"""
+Тесты массового создания фигур с векторизованной проверкой.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import ShapeBatch, Rectangle, Circle, Cube, Sphere
+
+
+def test_shape_constructors_match_init():
+    rectangles = Rectangle.from_arrays([1.0, 2.0], np.array([3, 4]), ['cm', 'mm'])
+    assert [str(shape) for shape in rectangles] == \
+        [str(Rectangle(1.0, 3.0, 'cm')), str(Rectangle(2.0, 4.0, 'mm'))]
+    assert [shape.area() for shape in Circle.from_arrays([1.0, 2.0], 'm')] == \
+        [Circle(1.0, 'm').area(), Circle(2.0, 'm').area()]
+    assert [shape.volume() for shape in Cube.from_arrays(np.arange(1, 4))] == [1.0, 8.0, 27.0]
+    assert Sphere.from_arrays([2.0])[0].get_radius() == 2.0
+
+
+def test_errors_list_every_invalid_row():
+    with pytest.raises(ValueError, match=r'\[1, 3\]'):
+        Rectangle.from_arrays([1.0, -1.0, 2.0, 1.0], [1.0, 1.0, 2.0, np.nan])
+    with pytest.raises(ValueError, match=r'\[0, 2\]'):
+        Cube.from_arrays([0.0, 1.0, -5.0])
+    with pytest.raises(TypeError):
+        Circle.from_arrays(['1', '2'])
+    with pytest.raises(ValueError):
+        Rectangle.from_arrays([1.0, 2.0], [1.0])
+
+
+def test_unknown_units_list_every_row():
+    with pytest.raises(ValueError, match="furlong"):
+        Rectangle.from_arrays([1], [2], ['furlong'])
+    with pytest.raises(ValueError, match=r"furlong, parsec \(строки \[0, 2, 3\]\)"):
+        Cube.from_arrays([1.0, 2.0, 3.0, 4.0], ['furlong', 'CM', 'parsec', 'furlong'])
+    with pytest.raises(ValueError, match="parsec"):
+        Sphere.from_arrays([1.0], 'parsec')
+    assert Circle.from_arrays([1.0], ['IN'])[0].get_unit() == 'IN'
+
+
+def test_trusted_skips_value_checks():
+    assert Sphere.from_arrays([-1.0], trusted=True)[0].get_radius() == -1.0
+
+
+def test_batch_from_arrays():
+    batch = ShapeBatch.from_arrays([0, 1, 2, 3], [1.0, 2.0, 3.0, 4.0], [5.0, 0, 0, 0],
+                                   [0, 1, 0, 1], ['cm', 'm'])
+    assert batch.get_units() == ('cm', 'm')
+    assert batch.comparable_area()[0] == 5.0
+
+
+@pytest.mark.parametrize('kinds, dim1, codes, rows', [
+    ([0, 7], [1.0, 1.0], [0, 0], r'\[1\]'),
+    ([0, 1], [1.0, 1.0], [0, 5], r'\[1\]'),
+    ([0, 1, 2], [1.0, 0.0, -1.0], [0, 0, 0], r'\[1, 2\]'),
+])
+def test_batch_from_arrays_rejects_invalid_rows(kinds, dim1, codes, rows):
+    with pytest.raises(ValueError, match=rows):
+        ShapeBatch.from_arrays(kinds, dim1, [1.0] * len(kinds), codes, ['cm'])
+
+
+def test_batch_from_arrays_type_checks():
+    with pytest.raises(TypeError):
+        ShapeBatch.from_arrays([0.5], [1.0], [1.0], [0], ['cm'])
+    with pytest.raises(TypeError):
+        ShapeBatch.from_arrays([0], [1.0], [1.0], [0], [1])
+
+
+def test_too_many_units():
+    units = [f"unit{i}" for i in range(300)]
+    with pytest.raises(ValueError, match='256'):
+        ShapeBatch.from_arrays([0], [1.0], [1.0], [257], units, trusted=True)
+    with pytest.raises(ValueError, match='256'):
+        ShapeBatch([0], [1.0], [1.0], [0], units)
@@ -0,0 +1,114 @@
+"""
+Тесты геометрической идентичности фигур.
+"""
+
+import random
+
+import pytest
+
+from shapes import (ShapeBatch, ShapeInterner, Rectangle, Circle, Polygon, Cube, Sphere,
+                    distinct)
+
+
+@pytest.fixture
+def shapes():
+    rng = random.Random(18)
+    base = [Rectangle(2.0, 3.0, 'cm'), Circle(1.5, 'cm'), Cube(4.0, 'cm'), Sphere(2.5, 'cm')]
+    result = list(base)
+    for _ in range(100):
+        shape = rng.choice(base)
+        # Те же фигуры в других единицах и прямоугольники с переставленными сторонами
+        unit = rng.choice(['mm', 'cm', 'm'])
+        result.append(shape.to_unit(unit))
+    result.append(Rectangle(3.0, 2.0, 'cm'))
+    result.append(Circle(1.6, 'cm'))
+    return result
+
+
+def linear_distinct(shapes):
+    result = []
+    for shape in shapes:
+        if not any(shape == kept for kept in result):
+            result.append(shape)
+    return result
+
+
+def test_distinct_matches_linear_scan(shapes):
+    expected = linear_distinct(shapes)
+    assert distinct(shapes) == expected
+    assert len(expected) == 5
+    assert all(a is b for a, b in zip(distinct(shapes), expected))
+
+    indices = distinct(ShapeBatch.from_shapes(shapes), return_indices=True)
+    assert indices.tolist() == distinct(shapes, return_indices=True).tolist()
+    assert distinct(ShapeBatch.from_shapes(shapes)).to_shapes() == expected
+
+
+def test_distinct_tolerance():
+    shapes = [Circle(1.0, 'm'), Circle(1.0004, 'm')]
+    assert len(distinct(shapes)) == 2
+    assert len(distinct(shapes, tolerance=1e-3)) == 1
+    with pytest.raises(ValueError):
+        distinct(shapes, tolerance=0)
+
+
+def test_equality_and_hash_follow_geometry():
+    assert Rectangle(2.0, 3.0, 'cm') == Rectangle(30.0, 20.0, 'mm')
+    assert hash(Rectangle(2.0, 3.0, 'cm')) == hash(Rectangle(0.03, 0.02, 'm'))
+    assert Sphere(1.0, 'm') == Sphere(100.0, 'cm')
+    assert hash(Sphere(1.0, 'm')) == hash(Sphere(1000.0, 'mm'))
+    assert len({Cube(1.0, 'm'), Cube(100.0, 'cm'), Cube(2.0, 'm')}) == 2
+
+    # Одинаковая площадь поверхности, но разная геометрия
+    cube = Cube(2.0, 'm')
+    sphere = Sphere((24.0 / (4 * 3.141592653589793)) ** 0.5, 'm')
+    assert cube.surface_area() == pytest.approx(sphere.surface_area())
+    assert cube != sphere
+    assert Rectangle(4.0, 1.0) != Rectangle(2.0, 2.0)
+    assert Rectangle(1.0, 1.0) != Circle(1.0)
+
+
+def test_unknown_units_use_raw_dimensions():
+    inch = Circle(1.0, 'inch')
+    assert inch == Circle(1.0, 'inch') and hash(inch) == hash(Circle(1.0, 'inch'))
+    assert inch.geometry_key() == ('Circle', 'inch', 1.0)
+    assert inch != Circle(1.0, 'in') and inch != Circle(2.0, 'inch')
+    assert len({inch, Circle(1.0, 'inch'), Cube(1.0, 'inch')}) == 2
+    assert distinct([inch, Circle(1.0, 'inch'), Circle(1.0, 'in')]) == [inch, Circle(1.0, 'in')]
+
+
+def test_hash_is_cached_until_change():
+    polygon = Polygon([(0, 0), (4, 0), (0, 3)])
+    first = hash(polygon)
+    assert polygon._hash == first
+    polygon.set_vertices([(0, 0), (8, 0), (0, 3)])
+    assert polygon._hash is None
+    assert hash(polygon) != first
+    assert polygon == Polygon([(0, 0), (80, 0), (0, 30)], 'mm')
+
+    circle = Circle(1.0, 'm')
+    hash(circle)
+    circle.set_unit('cm')
+    assert circle == Circle(10.0, 'mm') and circle != Circle(1.0, 'm')
+
+
+def test_interner_shares_instances():
+    interner = ShapeInterner()
+    first = interner.create(Rectangle, 2.0, 3.0, unit='m')
+    assert interner.create(Rectangle, 2.0, 3.0, unit='m') is first
+    assert interner.create(Rectangle, 2.0, 3.0, unit='cm') is not first
+    assert len(interner) == 2
+    with pytest.raises(TypeError):
+        interner.create(dict, 1.0)
+
+    batch = ShapeBatch.from_shapes([Rectangle(2.0, 3.0, 'm'), Circle(1.0, 'm'),
+                                    Circle(1.0, 'm'), Rectangle(2.0, 3.0, 'm')])
+    shapes = interner.from_batch(batch)
+    assert shapes == batch.to_shapes()
+    assert shapes[0] is first
+    assert shapes[1] is shapes[2]
+    assert len(interner) == 3
+
+    interner.clear()
+    assert len(interner) == 0
+    assert interner.create(Rectangle, 2.0, 3.0, unit='m') is not first
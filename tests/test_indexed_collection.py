@@ -0,0 +1,74 @@
+"""
+Тесты коллекции с отсортированными индексами характеристик.
+"""
+
+import random
+
+import pytest
+
+from shapes import (IndexedShapeCollection, ShapeCollection, SpatialIndex, Rectangle, Circle,
+                    Cube, Sphere)
+
+
+@pytest.fixture
+def shapes():
+    rng = random.Random(3)
+    return [Rectangle(rng.uniform(1, 10), rng.uniform(1, 10)) if i % 4 == 0 else
+            Circle(rng.uniform(1, 10)) if i % 4 == 1 else
+            Cube(rng.uniform(1, 10)) if i % 4 == 2 else Sphere(rng.uniform(1, 10))
+            for i in range(200)]
+
+
+def linear_select(shapes, metric, low, high):
+    values = [(getattr(shape, metric)(), i) for i, shape in enumerate(shapes)
+              if hasattr(shape, metric) and low <= getattr(shape, metric)() <= high]
+    return [shapes[i] for _, i in sorted(values)]
+
+
+def test_indexed_select_matches_linear_scan(shapes):
+    collection = IndexedShapeCollection(shapes)
+    for metric in IndexedShapeCollection.METRICS:
+        selected = collection.select(metric, 10.0, 100.0)
+        assert selected == linear_select(shapes, metric, 10.0, 100.0)
+        assert collection.count(metric, 10.0, 100.0) == len(selected)
+    assert collection.count('area') == 100
+    with pytest.raises(ValueError):
+        collection.count('weight')
+
+
+def test_indexed_collection_follows_setters(shapes):
+    collection = IndexedShapeCollection(shapes)
+    for shape in shapes[:40]:
+        if isinstance(shape, Rectangle):
+            shape.set_width(shape.get_width() * 2)
+        elif isinstance(shape, Cube):
+            shape.set_side(0.5)
+        else:
+            shape.set_radius(shape.get_radius() + 1)
+    collection.remove(shapes[0])
+    collection.discard(shapes[0])
+    rest = shapes[1:]
+    for metric in IndexedShapeCollection.METRICS:
+        assert collection.select(metric, 0.0, 500.0) == linear_select(rest, metric, 0.0, 500.0)
+
+    # Удаленная фигура больше не отслеживается
+    shapes[0].set_height(1000.0)
+    assert shapes[0] not in collection
+    assert collection.count('area', 900.0) == 0
+
+
+def test_failing_observer_does_not_stop_others():
+    rectangle = Rectangle(1.0, 2.0, 'cm', position=(0.0, 0.0))
+    collection = ShapeCollection([rectangle])
+    index = SpatialIndex(cell_size=1.0)
+    index.insert(rectangle)
+
+    with pytest.raises(ValueError):
+        rectangle.set_unit('parsec')
+    # Коллекция отклоняет каждое изменение, но индекс все равно обновляется
+    with pytest.raises(ValueError):
+        rectangle.set_width(10.0)
+    assert index.query_window((9.0, 0.0), (9.5, 0.5)) == [rectangle]
+
+    rectangle.set_unit('cm')
+    assert collection.get_total_area() == pytest.approx(20.0)
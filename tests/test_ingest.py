@@ -0,0 +1,77 @@
+"""
+Тесты потокового чтения файлов фигур и отчета shapes_app.py.
+"""
+
+import pytest
+
+from conftest import run_app, write_jsonl
+from shapes import ShapeBatch, aggregate
+from shapes.ingest import iter_batches, iter_records, iter_shapes, parse_record, split_file
+
+
+def test_csv_and_jsonl_give_same_batches(shape_files):
+    records, csv_path, jsonl_path = shape_files
+    for path in (csv_path, jsonl_path):
+        batches = list(iter_batches(path, chunk_size=300))
+        assert [len(batch) for batch in batches] == [300] * 6 + [200]
+        assert sum(len(batch) for batch in batches) == len(records)
+
+    csv_areas = [batch.comparable_area() for batch in iter_batches(csv_path)]
+    jsonl_areas = [batch.comparable_area() for batch in iter_batches(jsonl_path)]
+    assert csv_areas[0].tolist() == pytest.approx(jsonl_areas[0].tolist())
+
+
+def test_iter_shapes_matches_batches(shape_files):
+    _, csv_path, _ = shape_files
+    shapes = list(iter_shapes(csv_path))
+    batch = next(iter_batches(csv_path, chunk_size=len(shapes)))
+    assert ShapeBatch.from_shapes(shapes).comparable_area().tolist() == \
+        pytest.approx(batch.comparable_area().tolist())
+
+
+def test_split_file_covers_all_records(shape_files):
+    records, csv_path, jsonl_path = shape_files
+    for path in (csv_path, jsonl_path):
+        ranges = split_file(path, 7)
+        assert ranges[0][0] == 0 and all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert sum(len(list(iter_records(path, None, start, stop)))
+                   for start, stop in ranges) == len(records)
+
+
+def test_parse_record():
+    assert parse_record({'type': 'Rectangle', 'width': '2', 'height': 3}) == (0, 2.0, 3.0, 'cm')
+    assert parse_record({'type': 'sphere', 'radius': 1, 'unit': 'm'}) == (3, 1.0, 0.0, 'm')
+    with pytest.raises(ValueError, match='Запись 5'):
+        parse_record({'type': 'hexagon'}, 5)
+    with pytest.raises(ValueError, match='Запись 2'):
+        parse_record({'type': 'circle'}, 2)
+    with pytest.raises(ValueError, match='Запись 3'):
+        parse_record({'type': 'cube', 'side': 10 ** 400}, 3)
+    with pytest.raises(ValueError, match='Запись 4'):
+        parse_record(['cube'], 4)
+
+
+@pytest.mark.parametrize('line', ['{"type": "cube", "side":', '[1, 2]', '"cube"'])
+def test_malformed_jsonl_reports_record_number(tmp_path, line):
+    path = tmp_path / 'bad.jsonl'
+    path.write_text('{"type": "cube", "side": 1}\n\n' + line + '\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='Запись 2'):
+        list(iter_batches(path))
+
+
+def test_invalid_dimensions_report_record_numbers(tmp_path):
+    path = tmp_path / 'bad.jsonl'
+    write_jsonl(path, [{'type': 'cube', 'side': 1}, {'type': 'cube', 'side': -1},
+                       {'type': 'circle', 'radius': 0}])
+    with pytest.raises(ValueError, match=r'\[2, 3\]'):
+        list(iter_batches(path))
+
+
+def test_report_matches_aggregate(shape_files):
+    _, csv_path, jsonl_path = shape_files
+    output = run_app(csv_path, '--chunk-size', 500)
+    assert output == run_app(jsonl_path)
+
+    lines = [[cell.strip() for cell in line.split('|')[1:-1]]
+             for line in output.splitlines() if line.startswith('|')]
+    assert lines[1:] == aggregate(list(iter_shapes(csv_path))).rows()
@@ -0,0 +1,105 @@
+"""
+Тесты учета вызовов методов фигур и функций.
+"""
+
+import pytest
+
+import shapes
+from shapes import instrument, shapes2d, shapes3d, utils, Rectangle, Circle, Cube
+from shapes.instrument import CallStats
+
+from conftest import run_app
+
+
+@pytest.fixture
+def counters():
+    instrument.reset()
+    yield instrument
+    instrument.disable()
+    instrument.reset()
+
+
+def originals():
+    result = {}
+    for module, names in instrument.TARGETS:
+        for name in names:
+            cls = getattr(module, name)
+            for method in instrument.METHODS:
+                if method in cls.__dict__:
+                    result[name, method] = cls.__dict__[method]
+    result['utils.convert_units'] = utils.convert_units
+    result['shapes.convert_units'] = shapes.convert_units
+    result['shapes.compare_shapes_by_area'] = shapes.compare_shapes_by_area
+    return result
+
+
+def test_enable_and_disable_restore_originals(counters):
+    before = originals()
+    assert not counters.is_enabled()
+    counters.enable()
+    assert counters.is_enabled()
+    patched = originals()
+    assert all(patched[key] is not value for key, value in before.items())
+    # Повторное включение не оборачивает обертки
+    counters.enable()
+    assert originals() == patched
+    assert Rectangle.area.__doc__ == before['Rectangle', 'area'].__doc__
+
+    counters.disable()
+    assert not counters.is_enabled()
+    assert all(originals()[key] is value for key, value in before.items())
+
+
+def test_snapshot_counts_calls(counters):
+    counters.enable()
+    rectangle = Rectangle(2.0, 3.0)
+    for _ in range(3):
+        rectangle.area()
+    Circle(1.0).perimeter()
+    Cube(2.0).to_unit('m')
+    shapes.convert_units(1.0, 'm', 'cm')
+    utils.compare_shapes_by_area(rectangle, Circle(1.0))
+    counters.disable()
+    # Вызовы после выключения не учитываются
+    rectangle.area()
+
+    stats = counters.snapshot()
+    assert stats['Rectangle.__init__'].calls == 1
+    # compare_shapes_by_area вычисляет площадь еще раз
+    assert stats['Rectangle.area'].calls == 4
+    # Общий конструктор 2D и 3D фигур
+    assert stats['ShapeMixin.__init__'].calls == 4
+    assert stats['Circle.perimeter'].calls == 1
+    assert stats['ShapeMixin.to_unit'].calls == 1
+    assert stats['utils.convert_units'].calls == 1
+    assert stats['utils.compare_shapes_by_area'].calls == 1
+    assert 'Sphere.volume' not in stats
+
+    item = stats['Rectangle.area']
+    assert sum(count for _, count in item.histogram) == item.calls
+    assert item.minimum <= item.get_mean() <= item.maximum
+    assert item.get_quantile(0.5) <= item.get_quantile(0.99) <= item.maximum
+    assert [row[:2] for row in counters.rows(stats)] == \
+        [[name, str(value.calls)] for name, value in stats.items()]
+
+    counters.reset()
+    assert counters.snapshot() == {}
+
+
+def test_call_stats_quantiles():
+    stats = CallStats(4, 10e-9, 1e-9, 6e-9, ((2e-9, 1), (4e-9, 2), (8e-9, 1)))
+    assert stats.get_mean() == pytest.approx(2.5e-9)
+    assert stats.get_quantile(0.25) == 2e-9
+    assert stats.get_quantile(0.5) == 4e-9
+    assert stats.get_quantile(1.0) == 6e-9
+    assert CallStats(0, 0.0, 0.0, 0.0, ()).get_quantile(0.5) == 0.0
+
+
+def test_stats_option_keeps_report():
+    plain = run_app()
+    with_stats = run_app('--stats')
+    assert with_stats.startswith(plain)
+    tail = with_stats[len(plain):]
+    assert 'Счетчики вызовов:' in tail
+    assert '| Rectangle.area ' in tail
+    assert 'Кэш характеристик: попаданий' in tail
@@ -0,0 +1,92 @@
+"""
+Тесты тел, заданных треугольной сеткой.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from shapes import Mesh, Cube, aggregate, compare_shapes_by_area
+from shapes import shapes3d
+from shapes.report import format_shape_info
+
+TETRAHEDRON = ([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+               [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])
+
+
+def cube_mesh(side):
+    vertices = [(x, y, z) for x in (0, side) for y in (0, side) for z in (0, side)]
+    # Грани ориентированы наружу
+    quads = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    faces = []
+    for a, b, c, d in quads:
+        faces += [(a, b, c), (a, c, d)]
+    return vertices, faces
+
+
+def test_tetrahedron_metrics():
+    mesh = Mesh(*TETRAHEDRON, unit='m')
+    assert mesh.get_face_count() == 4
+    assert mesh.volume() == pytest.approx(1 / 6)
+    assert mesh.surface_area() == pytest.approx(1.5 + math.sqrt(3) / 2)
+    # Ориентация граней не влияет на знак объема
+    inverted = Mesh(TETRAHEDRON[0], [face[::-1] for face in TETRAHEDRON[1]], unit='m')
+    assert inverted.volume() == pytest.approx(1 / 6)
+
+
+def test_cube_mesh_matches_cube():
+    mesh = Mesh(*cube_mesh(2.0), unit='m')
+    cube = Cube(2.0, 'm')
+    assert mesh.volume() == pytest.approx(cube.volume())
+    assert mesh.surface_area() == pytest.approx(cube.surface_area())
+    assert compare_shapes_by_area(mesh, cube) == "Фигуры имеют одинаковую площадь (24.00)"
+
+    mesh.set_position((1.0, 2.0, 3.0))
+    assert mesh.bounding_box() == ((1.0, 2.0, 3.0), (3.0, 4.0, 5.0))
+
+
+def test_chunked_kernels_match_single_pass(monkeypatch):
+    rng = np.random.default_rng(21)
+    vertices = rng.uniform(-1, 1, size=(50, 3))
+    faces = rng.integers(0, 50, size=(1000, 3))
+    expected = (shapes3d.mesh_surface_area(vertices, faces),
+                shapes3d.mesh_signed_volume(vertices, faces))
+    monkeypatch.setattr(shapes3d, '_FACE_CHUNK', 7)
+    assert shapes3d.mesh_surface_area(vertices, faces) == pytest.approx(expected[0])
+    assert shapes3d.mesh_signed_volume(vertices, faces) == pytest.approx(expected[1])
+
+
+def test_to_unit_and_identity():
+    mesh = Mesh(*cube_mesh(2.0), unit='m')
+    converted = mesh.to_unit('cm')
+    assert converted.get_unit() == 'cm'
+    assert converted.volume() == pytest.approx(8e6)
+    assert converted.surface_area() == pytest.approx(24e4)
+    assert converted == mesh
+    assert hash(converted) == hash(mesh)
+    assert mesh != Mesh(*cube_mesh(3.0), unit='m')
+    with pytest.raises(ValueError):
+        mesh.get_vertices()[0, 0] = 1.0
+
+
+@pytest.mark.parametrize('vertices, faces, error', [
+    (TETRAHEDRON[0], np.empty((0, 3), dtype=int), ValueError),
+    (TETRAHEDRON[0], [(0, 1, 4)], ValueError),
+    ([(0, 0, 0), (1, 0, 0), (2, 0, 0)], [(0, 1, 2)], ValueError),
+    ([(0, 0, float('inf')), (1, 0, 0), (0, 1, 0)], [(0, 1, 2)], ValueError),
+    ([(0, 0), (1, 0), (0, 1)], [(0, 1, 2)], TypeError),
+    (TETRAHEDRON[0], [(0.5, 1, 2)], TypeError),
+])
+def test_invalid_meshes(vertices, faces, error):
+    with pytest.raises(error):
+        Mesh(vertices, faces)
+
+
+def test_aggregate_and_report():
+    mesh = Mesh(*TETRAHEDRON)
+    group = aggregate([mesh, Mesh(*cube_mesh(1.0))]).get_groups()[('Mesh', 'cm')]
+    assert group['volume'].get_total() == pytest.approx(1 / 6 + 1)
+    lines = format_shape_info(mesh).splitlines()
+    assert lines == ['Фигура: Mesh', '  Грани: 4', '  Площадь поверхности: 2.37cm²',
+                     '  Объем: 0.17cm³']
@@ -0,0 +1,78 @@
+"""
+Тесты попарного сравнения фигур по площади.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from shapes import (ShapeBatch, Rectangle, Circle, Cube, Sphere, compare_shapes_by_area,
+                    area_difference_matrix, area_order_matrix, iter_area_difference_tiles,
+                    comparison_messages)
+from shapes.utils import _comparable_area
+
+
+@pytest.fixture
+def shapes():
+    rng = random.Random(17)
+    units = ['mm', 'cm', 'm']
+    factories = [lambda d, u: Rectangle(d, d / 2, u), Circle, Cube, Sphere]
+    result = [rng.choice(factories)(rng.uniform(0.5, 20.0), rng.choice(units)) for _ in range(60)]
+    # Одинаковые площади дают 0 в матрице порядка
+    return result + [Rectangle(2.0, 2.0, 'cm'), Rectangle(4.0, 1.0, 'cm')]
+
+
+def expected_order(first, second):
+    message = compare_shapes_by_area(first, second)
+    if 'больше' in message:
+        return 1
+    if 'меньше' in message:
+        return -1
+    return 0
+
+
+def test_matrices_match_pairwise_comparison(shapes):
+    areas = [_comparable_area(shape) for shape in shapes]
+    difference = area_difference_matrix(shapes)
+    assert difference.shape == (len(shapes), len(shapes))
+    assert np.allclose(difference, np.subtract.outer(areas, areas))
+
+    expected = [[expected_order(a, b) for b in shapes] for a in shapes]
+    assert area_order_matrix(shapes).tolist() == expected
+    assert area_order_matrix(ShapeBatch.from_shapes(shapes)).tolist() == expected
+    assert area_order_matrix(shapes)[-1, -2] == 0
+
+
+def test_rectangular_matrix(shapes):
+    rows, columns = shapes[:10], ShapeBatch.from_shapes(shapes[10:25])
+    order = area_order_matrix(rows, columns)
+    assert order.shape == (10, 15)
+    assert order.tolist() == [[expected_order(a, b) for b in shapes[10:25]] for a in rows]
+
+
+@pytest.mark.parametrize('order', [False, True])
+@pytest.mark.parametrize('tile_size', [1, 7, 2048])
+def test_tiles_reassemble_full_matrix(shapes, tile_size, order):
+    full = area_order_matrix(shapes) if order else area_difference_matrix(shapes)
+    assembled = np.full(full.shape, 99, dtype=full.dtype)
+    for row, column, tile in iter_area_difference_tiles(shapes, tile_size=tile_size, order=order):
+        assert tile.shape[0] <= tile_size and tile.shape[1] <= tile_size
+        assembled[row:row + tile.shape[0], column:column + tile.shape[1]] = tile
+    assert np.array_equal(assembled, full)
+
+
+def test_tile_size_is_validated(shapes):
+    with pytest.raises(ValueError):
+        list(iter_area_difference_tiles(shapes, tile_size=0))
+
+
+def test_messages_match_compare_shapes_by_area(shapes):
+    pairs = [(0, 1), (5, 3), (len(shapes) - 1, len(shapes) - 2), (7, 7)]
+    expected = [compare_shapes_by_area(shapes[i], shapes[j]) for i, j in pairs]
+    assert list(comparison_messages(shapes, pairs)) == expected
+    assert list(comparison_messages(ShapeBatch.from_shapes(shapes), pairs)) == expected
+
+    others = shapes[::-1]
+    assert list(comparison_messages(shapes, pairs, ShapeBatch.from_shapes(others))) == \
+        [compare_shapes_by_area(shapes[i], others[j]) for i, j in pairs]
@@ -0,0 +1,75 @@
+"""
+Тесты параллельной обработки наборов и файлов фигур.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+import shapes.parallel
+from conftest import run_app
+from shapes import ShapeAggregator, ShapeBatch
+from shapes.ingest import iter_batches
+from shapes.parallel import METRICS, aggregate_file_parallel, compute_metrics_parallel
+
+
+def test_metrics_match_serial(shape_files):
+    _, csv_path, _ = shape_files
+    batch = next(iter_batches(csv_path))
+    result = compute_metrics_parallel(batch, workers=2, chunk_size=300)
+    for metric in METRICS:
+        np.testing.assert_array_equal(result[metric], getattr(batch, metric)())
+
+
+def test_single_worker_skips_pool():
+    batch = ShapeBatch([0, 2], [1.0, 2.0], [3.0, 0.0], [0, 0], ['cm'])
+    result = compute_metrics_parallel(batch, workers=1)
+    assert result['area'][0] == 3.0 and result['volume'][1] == 8.0
+
+
+def test_shared_memory_released_when_allocation_fails(monkeypatch):
+    created = []
+
+    def allocate(create=False, size=0):
+        if created:
+            raise OSError("нет памяти")
+        created.append(SharedMemory(create=create, size=size))
+        return created[-1]
+
+    monkeypatch.setattr(shapes.parallel, 'SharedMemory', allocate)
+    batch = ShapeBatch([0] * 4, [1.0] * 4, [2.0] * 4, [0] * 4, ['cm'])
+    with pytest.raises(OSError):
+        compute_metrics_parallel(batch, workers=2, chunk_size=2)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0].name)
+
+
+def test_invalid_worker_count():
+    batch = ShapeBatch([0], [1.0], [1.0], [0], ['cm'])
+    with pytest.raises(ValueError):
+        compute_metrics_parallel(batch, workers=0)
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+def test_file_aggregate_matches_serial(shape_files, workers):
+    _, csv_path, jsonl_path = shape_files
+    for path in (csv_path, jsonl_path):
+        serial = ShapeAggregator()
+        for batch in iter_batches(path, chunk_size=256):
+            serial.add_batch(batch)
+        parallel = aggregate_file_parallel(path, workers=workers, chunk_size=256)
+
+        assert parallel.get_groups().keys() == serial.get_groups().keys()
+        for key, group in serial.get_groups().items():
+            for metric, summary in group.items():
+                other = parallel.get_groups()[key][metric]
+                assert other.get_count() == summary.get_count()
+                assert other.get_total() == pytest.approx(summary.get_total())
+                assert (other.get_min(), other.get_max()) == \
+                    (summary.get_min(), summary.get_max())
+
+
+def test_report_with_workers_matches_serial(shape_files):
+    _, csv_path, _ = shape_files
+    assert run_app(csv_path, '--workers', 2) == run_app(csv_path)
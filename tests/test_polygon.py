@@ -0,0 +1,120 @@
+"""
+Тесты многоугольников и наборов многоугольников.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from shapes import Polygon, PolygonBatch
+from shapes.report import format_shape_info
+
+
+def reference_area(vertices):
+    total = 0.0
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        total += x1 * y2 - x2 * y1
+    return abs(total) / 2
+
+
+def reference_perimeter(vertices):
+    return sum(math.dist(a, b) for a, b in zip(vertices, vertices[1:] + vertices[:1]))
+
+
+def random_polygon(rng):
+    # Вершины на окружности в порядке возрастания угла дают простой многоугольник
+    count = rng.randint(3, 12)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+    radius = rng.uniform(0.5, 10.0)
+    center = rng.uniform(-5, 5), rng.uniform(-5, 5)
+    vertices = [(center[0] + radius * math.cos(a), center[1] + radius * math.sin(a))
+                for a in angles]
+    if rng.random() < 0.5:
+        vertices.reverse()
+    return vertices
+
+
+@pytest.fixture
+def vertex_lists():
+    rng = random.Random(20)
+    return [random_polygon(rng) for _ in range(50)]
+
+
+def test_polygon_metrics(vertex_lists):
+    triangle = Polygon([(0, 0), (4, 0), (0, 3)])
+    assert triangle.area() == pytest.approx(6.0)
+    assert triangle.perimeter() == pytest.approx(12.0)
+    assert Polygon([(0, 3), (4, 0), (0, 0)]).area() == pytest.approx(6.0)
+    for vertices in vertex_lists:
+        polygon = Polygon(vertices, 'm')
+        assert polygon.get_vertex_count() == len(vertices)
+        assert polygon.area() == pytest.approx(reference_area(vertices))
+        assert polygon.perimeter() == pytest.approx(reference_perimeter(vertices))
+
+
+@pytest.mark.parametrize('vertices, error', [
+    ([(0, 0), (1, 1)], ValueError),
+    ([(0, 0), (1, 1), (2, 2)], ValueError),
+    ([(0, 0), (1, float('nan')), (0, 1)], ValueError),
+    ([('a', 0), (1, 0), (0, 1)], TypeError),
+    ([0, 1, 2], TypeError),
+])
+def test_invalid_polygons(vertices, error):
+    with pytest.raises(error):
+        Polygon(vertices)
+
+
+def test_vertices_are_read_only():
+    polygon = Polygon([(0, 0), (4, 0), (0, 3)])
+    with pytest.raises(ValueError):
+        polygon.get_vertices()[0, 0] = 1.0
+    polygon.set_vertices([(0, 0), (2, 0), (2, 2), (0, 2)])
+    assert polygon.area() == pytest.approx(4.0)
+
+
+def test_batch_matches_polygons(vertex_lists):
+    polygons = [Polygon(vertices, 'm') for vertices in vertex_lists]
+    batch = PolygonBatch.from_polygons(polygons)
+    assert len(batch) == len(polygons)
+    assert batch.get_vertex_counts().tolist() == [len(v) for v in vertex_lists]
+    assert np.allclose(batch.area(), [polygon.area() for polygon in polygons])
+    assert np.allclose(batch.perimeter(), [polygon.perimeter() for polygon in polygons])
+
+    restored = batch.to_polygons()
+    assert [polygon.get_vertices().tolist() for polygon in restored] == \
+        [polygon.get_vertices().tolist() for polygon in polygons]
+
+    converted = batch.to_unit('cm')
+    assert converted.get_unit() == 'cm'
+    assert np.allclose(converted.area(), batch.area() * 1e4)
+    assert np.allclose(PolygonBatch.from_polygons(polygons, unit='cm').area(), converted.area())
+
+    subset = batch.take([3, 1])
+    assert np.allclose(subset.area(), batch.area()[[3, 1]])
+
+
+def test_batch_validation():
+    coordinates = np.array([[0, 0], [4, 0], [0, 3], [0, 0], [1, 1], [2, 2],
+                            [0, 0], [1, 0], [np.nan, 1]])
+    batch = PolygonBatch(coordinates, [0, 3, 6, 9])
+    assert batch.invalid_rows().tolist() == [False, True, True]
+    with pytest.raises(ValueError, match=r"строки \[1, 2\]"):
+        PolygonBatch.from_arrays(coordinates, np.array([0, 3, 6, 9]))
+    with pytest.raises(ValueError):
+        PolygonBatch(coordinates, [0, 3, 7])
+    with pytest.raises(ValueError, match=r"не менее 3 вершин \(строки \[1\]\)"):
+        PolygonBatch(coordinates, [0, 3, 5, 9])
+    with pytest.raises(ValueError, match=r"не убывать \(строки \[1\]\)"):
+        PolygonBatch(coordinates, [0, 6, 3, 9])
+    with pytest.raises(TypeError):
+        PolygonBatch.from_arrays(coordinates, np.array([0.0, 3.0, 6.0, 8.0]))
+    with pytest.raises(TypeError):
+        PolygonBatch.from_polygons([Polygon([(0, 0), (1, 0), (0, 1)]), 'square'])
+
+
+def test_polygon_report():
+    lines = format_shape_info(Polygon([(0, 0), (4, 0), (0, 3)])).splitlines()
+    assert lines == ['Фигура: Polygon', '  Вершины: 3', '  Площадь: 6.00cm²',
+                     '  Периметр: 12.00cm']
@@ -0,0 +1,60 @@
+"""
+Тесты вывода таблиц.
+"""
+
+import io
+
+import pytest
+
+from shapes.report import render_table, stream_table
+
+
+def reference_table(data, headers) -> str:
+    """
+    Формирует таблицу так же, как прежняя построчная print_table.
+    """
+    widths = [max([len(header)] + [len(str(row[i])) for row in data]) + 2
+              for i, header in enumerate(headers)]
+    separator = "+" + "".join("-" * (width + 2) + "+" for width in widths)
+    lines = [separator, "|" + "".join(f" {header:<{width}} |"
+                                      for header, width in zip(headers, widths)), separator]
+    for row in data:
+        lines.append("|" + "".join(f" {str(cell):<{width}} |" for cell, width in zip(row, widths)))
+        lines.append(separator)
+    return "\n".join(lines) + "\n"
+
+
+HEADERS = ['Фигура', 'Площадь', 'Единица']
+
+
+@pytest.mark.parametrize('size', [0, 1, 5000])
+def test_render_table_matches_reference(size):
+    data = [[f"Shape{i}", i * 1.5, 'cm'] for i in range(size)]
+    stream = io.StringIO()
+    render_table(data, HEADERS, stream)
+    assert stream.getvalue() == reference_table(data, HEADERS)
+
+
+def test_stream_table_matches_render_table():
+    data = [[f"Shape{i}", i * 1.5, 'cm'] for i in range(5000)]
+    expected = io.StringIO()
+    render_table(data, HEADERS, expected)
+
+    stream = io.StringIO()
+    stream_table(iter(data), HEADERS, sample=len(data), stream=stream)
+    assert stream.getvalue() == expected.getvalue()
+
+    widths = [max(len(str(row[i])) for row in data) for i in range(len(HEADERS))]
+    stream = io.StringIO()
+    stream_table(iter(data), HEADERS, widths=widths, stream=stream)
+    assert stream.getvalue() == expected.getvalue()
+
+
+def test_stream_table_keeps_long_cells():
+    stream = io.StringIO()
+    stream_table([['a', 1, 'cm'], ['очень длинная ячейка', 2, 'cm']], HEADERS, sample=1,
+                 stream=stream)
+    assert '| очень длинная ячейка |' in stream.getvalue()
+    with pytest.raises(ValueError):
+        stream_table([], HEADERS, widths=[1, 2])
+
@@ -0,0 +1,48 @@
+"""
+Тесты выбора фигур по площади.
+"""
+
+import pytest
+
+from shapes import (ShapeBatch, Rectangle, Circle, Cube, top_k_by_area, bottom_k_by_area,
+                    rank_by_area, select_by_area_range)
+
+
+@pytest.fixture
+def shapes():
+    # Площади: 6, 1, 24, 4, 3.14...
+    return [Rectangle(2.0, 3.0), Rectangle(1.0, 1.0), Cube(2.0), Rectangle(2.0, 2.0), Circle(1.0)]
+
+
+def test_top_and_bottom_k(shapes):
+    assert top_k_by_area(shapes, 2) == [shapes[2], shapes[0]]
+    assert bottom_k_by_area(shapes, 2, return_indices=True).tolist() == [1, 4]
+    assert top_k_by_area(shapes, 10, return_indices=True).tolist() == [2, 0, 3, 4, 1]
+    assert top_k_by_area(shapes, 0) == []
+
+
+def test_rank(shapes):
+    assert rank_by_area(shapes).tolist() == [4, 1, 5, 3, 2]
+    assert rank_by_area(shapes, descending=True).tolist() == [2, 5, 1, 3, 4]
+
+
+def test_range_selection(shapes):
+    assert select_by_area_range(shapes, 3.0, 6.0, return_indices=True).tolist() == [0, 3, 4]
+    with pytest.raises(ValueError):
+        select_by_area_range(shapes, 2.0, 1.0)
+
+
+def test_batch_matches_list(shapes):
+    batch = ShapeBatch.from_shapes(shapes)
+    assert top_k_by_area(batch, 3, return_indices=True).tolist() == \
+        top_k_by_area(shapes, 3, return_indices=True).tolist()
+    assert rank_by_area(batch).tolist() == rank_by_area(shapes).tolist()
+    selected = select_by_area_range(batch, 3.0, 6.0)
+    assert isinstance(selected, ShapeBatch) and len(selected) == 3
+
+
+def test_invalid_k(shapes):
+    with pytest.raises(ValueError):
+        top_k_by_area(shapes, -1)
+    with pytest.raises(TypeError):
+        top_k_by_area(shapes, 1.5)
@@ -0,0 +1,91 @@
+"""
+Тесты двоичной сериализации и pickle фигур.
+"""
+
+import pickle
+import struct
+
+import pytest
+
+from shapes import Rectangle, Circle, Cube, Sphere, Polygon, Mesh, dumps, loads
+from shapes.serialization import HEADER, RECORD_DTYPE
+
+
+@pytest.fixture
+def placed_shapes(mixed_shapes):
+    shapes = [shape.to_unit(shape.get_unit()) for shape in mixed_shapes]
+    shapes[0].set_position((1.5, -2.0))
+    shapes[1].set_position((0.0, 3.0))
+    for shape in shapes:
+        if isinstance(shape, Sphere):
+            shape.set_position((1.0, 2.0, 3.0))
+            break
+    return shapes
+
+
+def state(shape):
+    return type(shape), shape._arguments(), shape.get_unit(), shape.get_position()
+
+
+def test_dumps_loads_round_trip(placed_shapes):
+    data = dumps(placed_shapes)
+    placed = sum(shape.get_position() is not None for shape in placed_shapes)
+    units = {shape.get_unit() for shape in placed_shapes}
+    assert len(data) == (HEADER.size + sum(1 + len(unit) for unit in units) +
+                         RECORD_DTYPE.itemsize * len(placed_shapes) + 24 * placed)
+
+    for trusted in (False, True):
+        restored = loads(data, trusted=trusted)
+        assert [state(shape) for shape in restored] == [state(shape) for shape in placed_shapes]
+    assert loads(bytearray(data)) == placed_shapes
+    assert loads(dumps([])) == []
+
+
+def test_pickle_round_trip(placed_shapes):
+    shapes = placed_shapes + [Polygon([(0, 0), (3, 0), (0, 4)], 'm', (1.0, 1.0)),
+                              Mesh([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+                                   [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])]
+    # Кэш характеристик не сохраняется и вычисляется заново
+    shapes[-2].area()
+    shapes[-1].volume()
+    restored = pickle.loads(pickle.dumps(shapes, pickle.HIGHEST_PROTOCOL))
+    for original, copy in zip(shapes, restored):
+        assert type(copy) is type(original)
+        assert copy == original
+        assert copy.get_unit() == original.get_unit()
+        assert copy.get_position() == original.get_position()
+    assert restored[-2].area() == pytest.approx(6.0)
+    assert restored[-1].volume() == pytest.approx(1 / 6)
+
+
+def test_subclasses_are_serialized_as_base_type():
+    class Square(Rectangle):
+        pass
+
+    restored = loads(dumps([Square(2.0, 2.0, 'm')]))
+    assert type(restored[0]) is Rectangle
+    assert restored[0].area() == pytest.approx(4.0)
+    with pytest.raises(TypeError):
+        dumps([Polygon([(0, 0), (1, 0), (0, 1)])])
+
+
+def test_corrupt_buffers_are_rejected(placed_shapes):
+    data = dumps(placed_shapes)
+    corrupt = [
+        data[:HEADER.size - 1],
+        b'XXXX' + data[4:],
+        data[:4] + bytes([2]) + data[5:],
+        data[:-1],
+        data + b'\0',
+        data[:HEADER.size] + b'\xff' + data[HEADER.size + 1:],
+    ]
+    for buffer in corrupt:
+        with pytest.raises(ValueError):
+            loads(buffer)
+
+    # Отрицательный размер обнаруживается при проверке записей
+    circle = bytearray(dumps([Circle(1.0)]))
+    struct.pack_into('<d', circle, len(circle) - 16, -1.0)
+    with pytest.raises(ValueError):
+        loads(bytes(circle))
+    assert loads(bytes(circle), trusted=True)[0].get_radius() == -1.0
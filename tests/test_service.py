@@ -0,0 +1,149 @@
+"""
+Тесты сервиса расчетов с объединением запросов в пакеты.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from shapes import Rectangle, Circle, Cube, compare_shapes_by_area
+from shapes.service import LINE_LIMIT, MicroBatcher, evaluate, serve
+
+REQUESTS = [
+    {'id': 1, 'op': 'metrics', 'shape': {'type': 'rectangle', 'width': 2, 'height': 3}},
+    {'id': 2, 'op': 'metrics', 'shape': {'type': 'cube', 'side': 2, 'unit': 'm'}},
+    {'id': 3, 'op': 'metrics', 'shape': {'type': 'circle', 'radius': -1}},
+    {'id': 4, 'op': 'metrics', 'shape': 'circle'},
+    {'id': 5, 'op': 'convert', 'value': 1.5, 'from': 'm', 'to': 'cm', 'power': 2},
+    {'id': 6, 'op': 'convert', 'value': 1.5, 'from': 'm', 'to': 'parsec'},
+    {'id': 7, 'op': 'convert', 'value': 1.5, 'from': 'm', 'to': 'cm', 'power': True},
+    {'id': 8, 'op': 'convert', 'value': True, 'from': 'm', 'to': 'cm'},
+    {'id': 9, 'op': 'convert', 'value': 10 ** 400, 'from': 'm', 'to': 'cm'},
+    {'id': 10, 'op': 'compare', 'first': {'type': 'rectangle', 'width': 2, 'height': 3},
+     'second': {'type': 'circle', 'radius': 1}, 'message': True},
+    {'id': 11, 'op': 'compare', 'first': {'type': 'circle', 'radius': 1},
+     'second': {'type': 'cube', 'side': 0}},
+    {'id': 12, 'op': 'divide'},
+    ['not', 'an', 'object'],
+    {'op': 'metrics', 'shape': {'type': 'hexagon', 'side': 1}},
+]
+
+
+def test_batch_equals_single_requests():
+    batched = evaluate(REQUESTS)
+    assert batched == [evaluate([request])[0] for request in REQUESTS]
+
+
+def test_results_and_isolated_errors():
+    responses = evaluate(REQUESTS)
+    assert [response.get('id') for response in responses] == list(range(1, 13)) + [None, None]
+
+    rectangle = Rectangle(2.0, 3.0)
+    assert responses[0]['result'] == {'area': rectangle.area(),
+                                      'perimeter': rectangle.perimeter(),
+                                      'volume': None, 'surface_area': None, 'unit': 'cm'}
+    assert responses[1]['result']['volume'] == pytest.approx(Cube(2.0, 'm').volume())
+    assert responses[4]['result'] == pytest.approx(15000.0)
+    first, second = Rectangle(2.0, 3.0), Circle(1.0)
+    assert responses[9]['result'] == {
+        'order': 1, 'difference': pytest.approx(first.area() - second.area()),
+        'message': compare_shapes_by_area(first, second)}
+
+    # Степень True отклоняется, хотя True == 1
+    for index in (2, 3, 5, 6, 7, 8, 10, 11, 12, 13):
+        assert 'error' in responses[index] and 'result' not in responses[index]
+    assert responses[6]['error'] == "Степень должна быть равна 1, 2 или 3."
+
+
+def test_micro_batcher_isolates_failing_requests():
+    calls = []
+
+    def process(requests):
+        calls.append(len(requests))
+        if 'bad' in requests:
+            raise RuntimeError('bad request')
+        return [request.upper() for request in requests]
+
+    async def run():
+        batcher = MicroBatcher(process, batch_size=8, max_wait=0.05)
+        results = await asyncio.gather(*(batcher.submit(request) for request in
+                                         ['a', 'b', 'bad', 'c']), return_exceptions=True)
+        stats = batcher.get_stats()
+        await batcher.close()
+        return results, stats
+
+    results, stats = asyncio.run(run())
+    assert results[:2] == ['A', 'B'] and results[3] == 'C'
+    assert isinstance(results[2], RuntimeError)
+    assert stats == {'batches': 1, 'requests': 4, 'mean_batch': 4.0}
+    assert calls == [4, 1, 1, 1, 1]
+
+    with pytest.raises(ValueError):
+        MicroBatcher(process, batch_size=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(process, max_wait=-1)
+
+
+def test_server_over_unix_socket(tmp_path):
+    path = str(tmp_path / 'shapes.sock')
+    lines = [json.dumps(request) for request in REQUESTS] + ['{broken']
+
+    async def run():
+        started = asyncio.Event()
+        server = asyncio.ensure_future(serve(path=path, max_wait=0.01, ready=started.set))
+        await started.wait()
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+            writer.write_eof()
+            responses = [json.loads(line) for line in
+                         (await reader.read()).decode('utf-8').splitlines()]
+            writer.close()
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+        return responses
+
+    responses = asyncio.run(run())
+    assert len(responses) == len(lines)
+    by_id = {response['id']: response for response in responses if 'id' in response}
+    expected = evaluate(REQUESTS)
+    for response in expected:
+        if 'id' in response:
+            assert by_id[response['id']] == response
+    assert {'error': "Некорректный JSON."} in responses
+
+
+def test_server_skips_long_lines_and_bounds_pending(tmp_path):
+    path = str(tmp_path / 'shapes.sock')
+    request = {'id': 1, 'op': 'convert', 'value': 1, 'from': 'm', 'to': 'cm'}
+    long_line = json.dumps({'id': 2, 'op': 'metrics', 'pad': 'x' * (2 * LINE_LIMIT)})
+    lines = [long_line] + [json.dumps(dict(request, id=index)) for index in range(3, 13)]
+
+    async def run():
+        started = asyncio.Event()
+        server = asyncio.ensure_future(serve(path=path, max_wait=0.01, max_pending=2,
+                                             ready=started.set))
+        await started.wait()
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+            writer.write_eof()
+            responses = [json.loads(line) for line in
+                         (await reader.read()).decode('utf-8').splitlines()]
+            writer.close()
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+        return responses
+
+    responses = asyncio.run(run())
+    # Продолжение длинной строки не принимается за отдельный запрос
+    assert len(responses) == len(lines)
+    assert responses[0] == {'error': f"Строка запроса длиннее {LINE_LIMIT} байт."}
+    assert sorted(response['id'] for response in responses[1:]) == list(range(3, 13))
+    assert all(response['result'] == 100.0 for response in responses[1:])
+
+    with pytest.raises(ValueError):
+        asyncio.run(serve(path=path, max_pending=0))
@@ -0,0 +1,119 @@
+"""
+Тесты скетчей квантилей и накопителя квантилей по группам.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from conftest import run_app
+from shapes import QuantileAggregator, QuantileSketch, ShapeAggregator, ShapeBatch, aggregate
+from shapes.ingest import iter_batches
+from shapes.parallel import aggregate_file_parallel
+
+FRACTIONS = [0.0, 0.01, 0.1, 0.5, 0.9, 0.99, 1.0]
+
+
+def rank_error(sketch, values):
+    ordered = np.sort(values)
+    estimates = sketch.quantiles(FRACTIONS)
+    ranks = np.searchsorted(ordered, estimates, side='right') / len(ordered)
+    return np.abs(ranks - np.array(FRACTIONS)).max()
+
+
+def test_small_sketch_is_exact():
+    values = np.random.default_rng(25).lognormal(size=150)
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    sketch.add(float('nan'))
+    assert sketch.get_count() == 150
+    assert sketch.get_retained() == 150
+    assert sketch.quantiles(FRACTIONS).tolist() == \
+        np.quantile(values, FRACTIONS, method='inverted_cdf').tolist()
+
+
+@pytest.mark.parametrize('k', [50, 200])
+def test_large_sketch_rank_error(k):
+    values = np.random.default_rng(k).lognormal(size=200_000)
+    sketch = QuantileSketch(k)
+    sketch.add_array(values)
+    assert sketch.get_count() == len(values)
+    assert sketch.get_min() == values.min() and sketch.get_max() == values.max()
+    assert sketch.get_retained() < 20 * k
+    assert rank_error(sketch, values) < 4 / k
+
+
+def test_merge_matches_single_sketch():
+    values = np.random.default_rng(7).normal(size=100_000)
+    parts = np.array_split(values, 7)
+    merged = QuantileSketch()
+    for part in parts:
+        sketch = QuantileSketch()
+        sketch.add_array(part)
+        merged.merge(sketch)
+    merged.merge(QuantileSketch())
+    assert merged.get_count() == len(values)
+    assert rank_error(merged, values) < 0.02
+
+
+def test_serialization_round_trip():
+    sketch = QuantileSketch(64)
+    sketch.add_array(np.arange(10_000, dtype=float))
+    sketch.add(3.5)
+    data = sketch.to_bytes()
+    for copy in (QuantileSketch.from_bytes(data), pickle.loads(pickle.dumps(sketch))):
+        assert copy.get_k() == 64
+        assert copy.get_count() == sketch.get_count()
+        assert copy.to_bytes() == data
+        assert copy.quantiles(FRACTIONS).tolist() == sketch.quantiles(FRACTIONS).tolist()
+        # Восстановленный скетч продолжает накапливать значения так же
+        copy.add_array(np.arange(500, dtype=float))
+    sketch.add_array(np.arange(500, dtype=float))
+    assert copy.to_bytes() == sketch.to_bytes()
+
+
+def test_corrupt_buffers_are_rejected():
+    sketch = QuantileSketch(16)
+    sketch.add_array(np.arange(100, dtype=float))
+    data = sketch.to_bytes()
+    for buffer in (data[:10], b'XXXX' + data[4:], data[:4] + b'\x09' + data[5:],
+                   data[:-8], data + b'\0' * 8, data[:8] + b'\xff' * 8 + data[16:]):
+        with pytest.raises(ValueError):
+            QuantileSketch.from_bytes(buffer)
+
+
+def test_invalid_arguments():
+    for k in (7, 70000, 1.5):
+        with pytest.raises(ValueError):
+            QuantileSketch(k)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(1.5)
+    assert np.isnan(QuantileSketch().quantile(0.5))
+
+
+def test_quantile_aggregator(mixed_shapes):
+    result = QuantileAggregator()
+    result.add_batch(ShapeBatch.from_shapes(mixed_shapes))
+    summaries = aggregate(mixed_shapes).get_groups()
+    groups = result.get_groups()
+    assert list(groups) == list(summaries)
+    for key, metrics in groups.items():
+        for metric, sketch in metrics.items():
+            assert sketch.get_count() == summaries[key][metric].get_count()
+    assert all(len(row) == len(QuantileAggregator.HEADERS) for row in result.rows())
+    with pytest.raises(TypeError):
+        result.merge(ShapeAggregator())
+
+
+def test_parallel_percentiles_match_serial(shape_files):
+    _, csv_path, _ = shape_files
+    serial = QuantileAggregator()
+    for batch in iter_batches(csv_path, chunk_size=256):
+        serial.add_batch(batch)
+    parallel = aggregate_file_parallel(csv_path, None, 3, 256, QuantileAggregator)
+    assert parallel.rows() == serial.rows()
+    # Группы меньше k хранятся точно, поэтому отчеты совпадают полностью
+    assert run_app(str(csv_path), '--percentiles', '--workers', '2') == \
+        run_app(str(csv_path), '--percentiles')
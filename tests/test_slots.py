@@ -0,0 +1,48 @@
+"""
+Тесты компактного представления фигур на слотах.
+"""
+
+import pytest
+
+from shapes import Shape, ThreeDShape, Rectangle, Circle, Polygon, Cube, Sphere, Mesh
+
+
+@pytest.mark.parametrize('shape', [
+    Rectangle(1.0, 2.0), Circle(1.0), Polygon([(0, 0), (1, 0), (0, 1)]),
+    Cube(1.0), Sphere(1.0), Mesh([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+                                 [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)]),
+])
+def test_shapes_have_no_instance_dict(shape):
+    assert not hasattr(shape, '__dict__')
+    with pytest.raises(AttributeError):
+        shape.color = 'red'
+
+
+def test_minimal_subclasses_need_only_metrics():
+    class Dot(Shape):
+        def area(self):
+            return 0.0
+
+        def perimeter(self):
+            return 0.0
+
+    class Blob(ThreeDShape):
+        def volume(self):
+            return 1.0
+
+    # Необязательные методы базовых классов вызывают ошибку только при вызове
+    for shape in (Dot('mm', (1, 2)), Blob('m', (1, 2, 3))):
+        assert shape.get_position() is not None
+        with pytest.raises(NotImplementedError):
+            shape.bounding_box()
+        with pytest.raises(NotImplementedError):
+            shape.to_unit('cm')
+    assert Blob().volume() == 1.0 and str(Blob()) == 'Blob(unit=cm)'
+
+
+def test_units_are_interned():
+    unit = ''.join(['c', 'm'])
+    assert Rectangle(1.0, 2.0, unit).get_unit() is Circle(1.0, 'cm').get_unit()
+    shape = Cube(1.0)
+    shape.set_unit(''.join(['m', 'm']))
+    assert shape.get_unit() is Sphere(1.0, 'mm').get_unit()
@@ -0,0 +1,108 @@
+"""
+Тесты пространственного индекса фигур.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from shapes import Rectangle, Circle, Cube, Sphere, SpatialIndex
+from shapes.spatial import _distance, _geometry, _overlap, _touches_window
+
+
+@pytest.fixture
+def placed():
+    rng = random.Random(7)
+    shapes = []
+    for i in range(300):
+        position = (rng.uniform(-100, 100), rng.uniform(-100, 100))
+        if i % 2:
+            shapes.append(Rectangle(rng.uniform(0.5, 8), rng.uniform(0.5, 8), position=position))
+        else:
+            shapes.append(Circle(rng.uniform(0.5, 4), position=position))
+    return shapes
+
+
+@pytest.fixture
+def index(placed):
+    index = SpatialIndex(cell_size=5.0)
+    for shape in placed:
+        index.insert(shape)
+    return index
+
+
+def brute_nearest(shapes, point, k):
+    order = sorted(range(len(shapes)), key=lambda i: (_distance(point, _geometry(shapes[i])), i))
+    return [shapes[i] for i in order[:k]]
+
+
+def test_window_matches_linear_scan(placed, index):
+    rng = random.Random(1)
+    for _ in range(50):
+        x, y = rng.uniform(-120, 100), rng.uniform(-120, 100)
+        low, high = (x, y), (x + rng.uniform(0, 40), y + rng.uniform(0, 40))
+        expected = [shape for shape in placed if _touches_window(_geometry(shape), low, high)]
+        assert index.query_window(low, high) == expected
+
+
+@pytest.mark.parametrize('point', [(0.0, 0.0), (55.5, -20.0), (20000.0, 20000.0), (-1e6, 3.0)])
+def test_nearest_matches_linear_scan(placed, index, point):
+    for k in (1, 5, 20):
+        assert [id(shape) for shape in index.nearest(point, k)] == \
+            [id(shape) for shape in brute_nearest(placed, point, k)]
+
+
+def test_overlapping_pairs_match_linear_scan(placed, index):
+    expected = [(a, b) for a, b in combinations(placed, 2) if _overlap(_geometry(a), _geometry(b))]
+    assert [(id(a), id(b)) for a, b in index.overlapping_pairs()] == \
+        [(id(a), id(b)) for a, b in expected]
+
+
+def test_index_follows_shape_changes():
+    index = SpatialIndex(cell_size=1.0)
+    circle = Circle(1.0, position=(0.0, 0.0))
+    unplaced = Rectangle(1.0, 1.0)
+    index.insert(circle)
+    index.insert(unplaced)
+    assert len(index) == 2 and circle in index
+    assert index.query_window((-0.5, -0.5), (0.5, 0.5)) == [circle]
+
+    circle.set_position((50.0, 50.0))
+    assert index.query_window((-0.5, -0.5), (0.5, 0.5)) == []
+    assert index.nearest((48.0, 50.0)) == [circle]
+
+    circle.set_radius(5.0)
+    assert index.query_window((44.0, 49.0), (46.0, 51.0)) == [circle]
+
+    unplaced.set_position((0.0, 0.0))
+    assert index.nearest((0.0, 0.0)) == [unplaced]
+
+    index.remove(circle)
+    circle.set_position((0.0, 0.0))
+    assert index.nearest((0.0, 0.0), k=3) == [unplaced]
+    with pytest.raises(KeyError):
+        index.remove(circle)
+
+
+def test_three_dimensional_index():
+    index = SpatialIndex(cell_size=2.0, dimensions=3)
+    cube = Cube(1.0, position=(0.0, 0.0, 0.0))
+    sphere = Sphere(1.0, position=(10.0, 0.0, 0.0))
+    index.insert(cube)
+    index.insert(sphere)
+    assert index.nearest((9.0, 0.0, 0.0)) == [sphere]
+    assert index.query_window((0.5, 0.5, 0.5), (2.0, 2.0, 2.0)) == [cube]
+    with pytest.raises(TypeError):
+        index.insert(Circle(1.0, position=(0.0, 0.0)))
+    with pytest.raises(ValueError):
+        index.nearest((0.0, 0.0))
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        SpatialIndex(cell_size=0)
+    with pytest.raises(ValueError):
+        SpatialIndex(cell_size=1.0, dimensions=4)
+    with pytest.raises(ValueError):
+        Rectangle(1.0, 1.0).bounding_box()
@@ -0,0 +1,81 @@
+"""
+Тесты двоичного хранилища фигур.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import run_app
+from shapes import ShapeBatch, open_store, write_store
+from shapes.ingest import iter_batches
+from shapes.store import iter_store_batches, store_size
+
+
+def _assert_same_batch(first: ShapeBatch, second: ShapeBatch):
+    np.testing.assert_array_equal(first.get_kinds(), second.get_kinds())
+    for a, b in zip(first.get_dimensions(), second.get_dimensions()):
+        np.testing.assert_array_equal(a, b)
+    assert [first.get_units()[code] for code in first.get_unit_codes()] == \
+        [second.get_units()[code] for code in second.get_unit_codes()]
+
+
+def test_write_open_round_trip(tmp_path, mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes)
+    path = tmp_path / 'shapes.shapes'
+    assert write_store(path, batch) == len(batch)
+    assert store_size(path) == len(batch)
+    _assert_same_batch(open_store(path), batch)
+
+
+def test_streamed_batches_share_unit_table(tmp_path, shape_files):
+    _, csv_path, _ = shape_files
+    path = tmp_path / 'shapes.shapes'
+    batches = list(iter_batches(csv_path, chunk_size=300))
+    assert write_store(path, iter(batches)) == 2000
+
+    stored = open_store(path, trusted=True)
+    assert sorted(stored.get_units()) == ['cm', 'm', 'mm']
+    expected = ShapeBatch.from_shapes(
+        [shape for batch in batches for shape in batch.to_shapes()])
+    _assert_same_batch(stored, expected)
+
+    chunks = list(iter_store_batches(path, chunk_size=700))
+    assert [len(chunk) for chunk in chunks] == [700, 700, 600]
+    assert list(iter_store_batches(path, 1000, 500, 900))[0].get_dimensions()[0].tolist() == \
+        stored.get_dimensions()[0][500:900].tolist()
+
+
+def test_store_is_read_only(tmp_path, mixed_shapes):
+    path = tmp_path / 'shapes.shapes'
+    write_store(path, ShapeBatch.from_shapes(mixed_shapes))
+    with pytest.raises(ValueError):
+        open_store(path).get_dimensions()[0][0] = 1.0
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / 'empty.shapes'
+    write_store(path, ShapeBatch.from_shapes([]))
+    assert len(open_store(path)) == 0
+
+
+def test_corrupt_store(tmp_path):
+    path = tmp_path / 'bad.shapes'
+    path.write_bytes(b'NOTASTORE' + bytes(40))
+    with pytest.raises(ValueError):
+        open_store(path)
+
+
+def test_invalid_records_are_detected(tmp_path):
+    path = tmp_path / 'bad.shapes'
+    write_store(path, ShapeBatch([0, 1], [1.0, -2.0], [1.0, 0.0], [0, 0], ['cm']))
+    with pytest.raises(ValueError):
+        open_store(path)
+    assert len(open_store(path, trusted=True)) == 2
+
+
+def test_report_from_store_matches_csv(tmp_path, shape_files):
+    _, csv_path, _ = shape_files
+    path = tmp_path / 'shapes.shapes'
+    write_store(path, iter_batches(csv_path))
+    assert run_app(path) == run_app(csv_path)
+    assert run_app(path, '--workers', 2) == run_app(csv_path)
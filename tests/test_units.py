@@ -0,0 +1,83 @@
+"""
+Тесты реестра единиц измерения и перевода фигур в другие единицы.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import ShapeBatch, Rectangle, Circle, Cube, Sphere, convert_units
+from shapes.units import UNIT_FACTORS, IMPERIAL_FACTORS, UnitRegistry, registry
+
+
+def test_factors_follow_meters():
+    factors = {**UNIT_FACTORS, **IMPERIAL_FACTORS}
+    for source, source_meters in factors.items():
+        for target, target_meters in factors.items():
+            for power in (1, 2, 3):
+                assert registry.factor(source, target, power) == \
+                    pytest.approx((source_meters / target_meters) ** power)
+    assert convert_units(1.0, 'ft', 'in') == pytest.approx(12.0)
+    assert convert_units(1.0, 'm', 'cm', power=2) == pytest.approx(1e4)
+    assert convert_units(1.0, 'M', 'CM', power=3) == pytest.approx(1e6)
+
+
+def test_registry_lookup_and_errors():
+    units = UnitRegistry({'m': 1.0, 'cm': 0.01})
+    assert units.get_units() == ('m', 'cm')
+    assert units.code('Cm') == units.code('cm') == 1
+    assert units.code('parsec') == -1
+    assert units.codes(['m', 'CM', 'x', 'm']).tolist() == [0, 1, -1, 0]
+
+    assert units.register('Furlong', 201.168) == 2
+    assert units.factor('furlong', 'm') == pytest.approx(201.168)
+    assert units.get_factor_matrix(2).shape == (3, 3)
+    with pytest.raises(ValueError):
+        units.get_factor_matrix()[0, 0] = 2.0
+
+    with pytest.raises(ValueError):
+        units.register('M', 1.0)
+    with pytest.raises(ValueError):
+        units.register('pole', 0)
+    with pytest.raises(TypeError):
+        units.register('', 1.0)
+    with pytest.raises(ValueError):
+        units.factor('m', 'parsec')
+    with pytest.raises(ValueError):
+        units.get_factor_matrix(4)
+    with pytest.raises(ValueError):
+        UnitRegistry({f"u{i}": 1.0 + i for i in range(257)})
+
+
+@pytest.mark.parametrize('shape', [Rectangle(2.0, 3.0, 'm'), Circle(1.5, 'm'),
+                                   Cube(2.0, 'm'), Sphere(1.5, 'm')])
+@pytest.mark.parametrize('unit', ['cm', 'ft'])
+def test_to_unit_scales_metrics(shape, unit):
+    converted = shape.to_unit(unit)
+    assert type(converted) is type(shape)
+    assert converted.get_unit() == unit
+    assert converted == shape
+    if isinstance(shape, (Rectangle, Circle)):
+        assert converted.area() == pytest.approx(convert_units(shape.area(), 'm', unit, 2))
+        assert converted.perimeter() == pytest.approx(convert_units(shape.perimeter(), 'm', unit))
+    else:
+        assert converted.volume() == pytest.approx(convert_units(shape.volume(), 'm', unit, 3))
+        assert converted.surface_area() == \
+            pytest.approx(convert_units(shape.surface_area(), 'm', unit, 2))
+    with pytest.raises(ValueError):
+        shape.to_unit('parsec')
+
+
+def test_to_unit_scales_position():
+    rectangle = Rectangle(2.0, 3.0, 'm')
+    rectangle.set_position((1.0, 2.0))
+    assert rectangle.to_unit('cm').get_position() == pytest.approx((100.0, 200.0))
+    sphere = Sphere(1.0, 'cm')
+    sphere.set_position((10.0, 20.0, 30.0))
+    assert sphere.to_unit('mm').get_position() == pytest.approx((100.0, 200.0, 300.0))
+    assert Circle(1.0).to_unit('m').get_position() is None
+
+
+def test_batch_to_unit_matches_shapes(mixed_shapes):
+    batch = ShapeBatch.from_shapes(mixed_shapes).to_unit('in')
+    expected = [shape.to_unit('in') for shape in mixed_shapes]
+    assert np.allclose(batch.get_dimensions(), ShapeBatch.from_shapes(expected).get_dimensions())